@@ -0,0 +1,287 @@
+# Copyright 2014, Sandia Corporation. Under the terms of Contract
+# DE-AC04-94AL85000 with Sandia Corporation, the U.S. Government retains certain
+# rights in this software.
+
+from __future__ import division, print_function
+
+import argparse
+import itertools
+import multiprocessing
+import timeit
+
+import numpy
+
+import toyplot
+import toyplot.color
+import toyplot.data
+import toyplot.font
+import toyplot.html
+import toyplot.layout
+import toyplot.text
+
+benchmarks = {}
+
+def benchmark(function):
+    benchmarks[function.__name__] = function
+    return function
+
+
+def report(label, seconds, baseline=None):
+    if baseline is None:
+        print("  %-40s %10.4f s" % (label, seconds))
+    else:
+        print("  %-40s %10.4f s %10.1fx" % (label, seconds, baseline / seconds))
+
+
+def measure(function, repeat):
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+@benchmark
+def segments(arguments):
+    """Find runs of non-null values in a series with sparse gaps."""
+    generator = numpy.random.RandomState(1234)
+    not_null = generator.uniform(size=arguments.size) > 0.0001
+
+    def groupby():
+        i = 0
+        result = []
+        for (k, g) in itertools.groupby(not_null):
+            n = len(list(g))
+            if k:
+                result.append(slice(i, i + n))
+            i += n
+        return result
+
+    print("segments (%s points):" % arguments.size)
+    baseline = measure(groupby, arguments.repeat)
+    report("itertools.groupby", baseline)
+    report("toyplot.data.segments", measure(lambda: toyplot.data.segments(not_null), arguments.repeat), baseline)
+
+
+@benchmark
+def css(arguments):
+    """Parse CSS color strings drawn from a small set of distinct values."""
+    generator = numpy.random.RandomState(1234)
+    distinct = numpy.array(["#%06x" % value for value in generator.randint(0, 0xffffff, size=64)])
+    strings = distinct[generator.randint(0, len(distinct), size=arguments.size // 10)]
+
+    def elementwise():
+        toyplot.color.css.cache.clear()
+        return numpy.array([toyplot.color.css(string) for string in strings], dtype=toyplot.color.dtype)
+
+    print("css (%s strings):" % len(strings))
+    baseline = measure(elementwise, arguments.repeat)
+    report("toyplot.color.css", baseline)
+    report("toyplot.color.css_array", measure(lambda: toyplot.color.css_array(strings), arguments.repeat), baseline)
+
+
+@benchmark
+def to_css(arguments):
+    """Format colors drawn from a small palette as CSS strings."""
+    generator = numpy.random.RandomState(1234)
+    colors = toyplot.color.broadcast(generator.randint(0, 8, size=arguments.size // 10), shape=arguments.size // 10)
+
+    print("to_css (%s colors):" % len(colors))
+    baseline = measure(lambda: [toyplot.color.to_css(color) for color in colors], arguments.repeat)
+    report("toyplot.color.to_css", baseline)
+    report("toyplot.color.to_css_array", measure(lambda: toyplot.color.to_css_array(colors), arguments.repeat), baseline)
+
+
+@benchmark
+def colormap(arguments):
+    """Colorize a square image with a linear color map."""
+    side = int(numpy.sqrt(arguments.size))
+    generator = numpy.random.RandomState(1234)
+    values = generator.uniform(size=(side, side))
+    colormap = toyplot.color.brewer.map("BlueRed")
+    lut = toyplot.color.brewer.map("BlueRed", lut=4096)
+
+    print("colormap (%sx%s values):" % (side, side))
+    baseline = measure(lambda: colormap.colors(values), arguments.repeat)
+    report("LinearMap.colors", baseline)
+    report("LinearMap.colors, lut=4096", measure(lambda: lut.colors(values), arguments.repeat), baseline)
+    report("LinearMap.rgba8, lut=4096", measure(lambda: lut.rgba8(values), arguments.repeat), baseline)
+
+
+
+@benchmark
+def table(arguments):
+    """Render a table of repeated values, with and without previously cached text layouts."""
+    generator = numpy.random.RandomState(1234)
+    rows = min(arguments.size // 10000, 1000)
+    data = toyplot.data.Table()
+    for column in range(10):
+        data["c%s" % column] = generator.choice(100, size=rows)
+    canvas, table = toyplot.table(data)
+
+    def cold():
+        toyplot.text.layout.cache.clear()
+        toyplot.html.render(canvas)
+
+    print("table (%s rows, 10 columns):" % rows)
+    baseline = measure(cold, arguments.repeat)
+    report("toyplot.html.render, empty cache", baseline)
+    report("toyplot.html.render, warm cache", measure(lambda: toyplot.html.render(canvas), arguments.repeat), baseline)
+    print("  %-40s %10.4f" % ("  text layout cache hit rate", toyplot.text.layout.cache.hit_rate))
+
+@benchmark
+def labels(arguments):
+    """Lay out distinct plain-text labels, parsing them as markup and using the plain-text fast path."""
+    generator = numpy.random.RandomState(1234)
+    labels = ["%.6g" % value for value in generator.normal(size=arguments.size // 100)]
+    style = {"font-size": "10px", "text-anchor": "start"}
+    fonts = toyplot.font.library()
+
+    def fast():
+        toyplot.text.layout.cache.clear()
+        toyplot.text._plain_template.cache.clear()
+        return [toyplot.text.layout(label, style, fonts) for label in labels]
+
+    print("labels (%s labels):" % len(labels))
+    baseline = measure(lambda: [toyplot.text._markup_layout(label, style, fonts) for label in labels], arguments.repeat)
+    report("toyplot.text._markup_layout", baseline)
+    report("toyplot.text.layout, empty cache", measure(fast, arguments.repeat), baseline)
+
+@benchmark
+def scatterplot(arguments):
+    """Render a scatterplot with constant marker styles."""
+    generator = numpy.random.RandomState(1234)
+    x = generator.uniform(size=arguments.size // 100)
+    y = generator.uniform(size=arguments.size // 100)
+    canvas, axes, mark = toyplot.scatterplot(x, y)
+
+    print("scatterplot (%s points):" % len(x))
+    report("toyplot.html.render", measure(lambda: toyplot.html.render(canvas), arguments.repeat))
+
+
+@benchmark
+def lab(arguments):
+    """Convert colors to CIE Lab and back."""
+    generator = numpy.random.RandomState(1234)
+    colors = toyplot.color.rgb(*generator.uniform(size=(3, arguments.size // 100)))
+
+    print("lab (%s colors):" % len(colors))
+    baseline = measure(lambda: [toyplot.color.lab(*toyplot.color.to_lab(color)) for color in colors], arguments.repeat)
+    report("per-color", baseline)
+    report("array", measure(lambda: toyplot.color.lab(*toyplot.color.to_lab(colors)), arguments.repeat), baseline)
+
+
+@benchmark
+def diverging(arguments):
+    """Map values to colors with a diverging color map."""
+    generator = numpy.random.RandomState(1234)
+    values = generator.uniform(size=arguments.size // 10)
+    sample = values[:10000]
+    colormap = toyplot.color.DivergingMap(domain_min=0, domain_max=1)
+
+    print("diverging (%s values):" % len(values))
+    baseline = measure(lambda: [colormap.colors(value) for value in sample], arguments.repeat) * len(values) / len(sample)
+    report("per-value (extrapolated)", baseline)
+    report("DivergingMap.colors", measure(lambda: colormap.colors(values), arguments.repeat), baseline)
+
+
+@benchmark
+def repulsion(arguments):
+    """Run force-directed graph layouts with exact and Barnes-Hut repulsion."""
+    generator = numpy.random.RandomState(1234)
+    for vcount in [1000, 10000, 100000]:
+        if vcount > arguments.size // 100:
+            break
+        sources = numpy.arange(1, vcount)
+        targets = (generator.uniform(size=len(sources)) * sources).astype("int64")
+        edges = numpy.column_stack((sources, targets))
+        vcoordinates = numpy.ma.masked_all((vcount, 2))
+
+        print("repulsion (%s vertices, 5 iterations):" % vcount)
+        baseline = None
+        if vcount <= 1000:
+            exact = toyplot.layout.FruchtermanReingold(M=5)
+            baseline = measure(lambda: exact.graph(vcoordinates, edges), arguments.repeat)
+            report("FruchtermanReingold", baseline)
+        for theta in [0.5, 0.9]:
+            layout = toyplot.layout.FruchtermanReingold(M=5, repulsion=toyplot.layout.BarnesHut(theta=theta))
+            report("FruchtermanReingold, BarnesHut(%s)" % theta, measure(lambda: layout.graph(vcoordinates, edges), arguments.repeat), baseline)
+
+
+
+@benchmark
+def cutoff(arguments):
+    """Lay out random trees with all-pairs, Barnes-Hut, and grid cutoff repulsion.
+
+    Layout quality is reported as the coefficient of variation of the edge
+    lengths, which is lower for more uniform layouts.
+    """
+    generator = numpy.random.RandomState(1234)
+    for vcount in [1000, 10000, 100000]:
+        if vcount > arguments.size // 100:
+            break
+        sources = numpy.arange(1, vcount)
+        targets = (generator.uniform(size=len(sources)) * sources).astype("int64")
+        edges = numpy.column_stack((sources, targets))
+        vcoordinates = numpy.ma.masked_all((vcount, 2))
+
+        print("cutoff (%s vertices):" % vcount)
+        repulsions = [("BarnesHut", toyplot.layout.BarnesHut()), ("GridCutoff", toyplot.layout.GridCutoff())]
+        if vcount <= 1000:
+            repulsions.insert(0, ("AllPairs", toyplot.layout.AllPairs()))
+        baseline = None
+        for name, repulsion in repulsions:
+            layout = toyplot.layout.FruchtermanReingold(repulsion=repulsion)
+            seconds = measure(lambda: layout.graph(vcoordinates, edges), arguments.repeat)
+            report("FruchtermanReingold, %s" % name, seconds, baseline)
+            baseline = seconds if baseline is None else baseline
+
+            coordinates = numpy.ma.getdata(layout.graph(vcoordinates, edges)[0])
+            lengths = numpy.linalg.norm(coordinates[edges.T[0]] - coordinates[edges.T[1]], axis=1)
+            print("  %-40s %10.4f" % ("  edge length variation", numpy.std(lengths) / numpy.mean(lengths)))
+
+@benchmark
+def multilevel(arguments):
+    """Lay out random trees with Fruchterman-Reingold and multilevel layouts."""
+    generator = numpy.random.RandomState(1234)
+    for vcount in [1000, 10000, 100000]:
+        if vcount > arguments.size // 100:
+            break
+        sources = numpy.arange(1, vcount)
+        targets = (generator.uniform(size=len(sources)) * sources).astype("int64")
+        edges = numpy.column_stack((sources, targets))
+        vcoordinates = numpy.ma.masked_all((vcount, 2))
+
+        print("multilevel (%s vertices):" % vcount)
+        baseline = None
+        if vcount <= 10000:
+            layout = toyplot.layout.FruchtermanReingold(repulsion=toyplot.layout.BarnesHut())
+            baseline = measure(lambda: layout.graph(vcoordinates, edges), arguments.repeat)
+            report("FruchtermanReingold, BarnesHut", baseline)
+        layout = toyplot.layout.Multilevel()
+        report("Multilevel", measure(lambda: layout.graph(vcoordinates, edges), arguments.repeat), baseline)
+        threads = multiprocessing.cpu_count()
+        layout = toyplot.layout.Multilevel(threads=threads)
+        report("Multilevel, threads=%s" % threads, measure(lambda: layout.graph(vcoordinates, edges), arguments.repeat), baseline)
+
+
+
+@benchmark
+def graph(arguments):
+    """Render a randomly laid-out graph with straight, curved, and bundled edges."""
+    generator = numpy.random.RandomState(1234)
+    ecount = arguments.size // 20
+    vcount = ecount // 10
+    edges = (generator.uniform(size=(ecount, 2)) * vcount).astype("int64")
+
+    print("graph (%s vertices, %s edges):" % (vcount, ecount))
+    for name, edge_layout in [("StraightEdges", toyplot.layout.StraightEdges()), ("CurvedEdges", toyplot.layout.CurvedEdges())]:
+        canvas, axes, mark = toyplot.graph(edges, layout=toyplot.layout.Random(edges=edge_layout), vsize=4)
+        report("toyplot.html.render, %s" % name, measure(lambda: toyplot.html.render(canvas), arguments.repeat))
+    canvas, axes, mark = toyplot.graph(edges, layout=toyplot.layout.Random(edges=toyplot.layout.BundledEdges()), ebundle=True, vsize=4)
+    report("toyplot.html.render, BundledEdges", measure(lambda: toyplot.html.render(canvas), arguments.repeat))
+
+parser = argparse.ArgumentParser(description="Run Toyplot performance benchmarks.")
+parser.add_argument("benchmark", nargs="*", choices=[[]] + sorted(benchmarks.keys()), help="Benchmarks to run (defaults to all).")
+parser.add_argument("--size", type=int, default=10000000, help="Problem size.")
+parser.add_argument("--repeat", type=int, default=3, help="Number of repetitions for each measurement.")
+arguments = parser.parse_args()
+
+for name in arguments.benchmark or sorted(benchmarks.keys()):
+    benchmarks[name](arguments)
@@ -0,0 +1,32 @@
+Feature: Aggregation
+  Scenario: Group-by aggregation
+    Given a table of raw events
+    When the events are grouped by key
+    Then the result contains one row per key with the requested aggregates
+
+  Scenario: Fixed-width binning
+    Given a table of raw events
+    When the events are aggregated into fixed-width bins
+    Then the result contains contiguous bins with the requested aggregates
+
+  Scenario: Explicit bin edges
+    Given a table of raw events
+    When the events are aggregated into bins with explicit edges
+    Then the result matches numpy.histogram
+
+  Scenario: Timestamp binning
+    Given a table of raw events
+    When the events are aggregated into daily bins
+    Then the result contains one row per day
+
+  Scenario: Streaming histogram
+    Given a streaming histogram
+    When the histogram is updated with multiple batches
+    Then the histogram contains the total counts for every batch
+
+  Scenario: Binning ignores infinite values
+    Given a table of raw events containing infinite values
+    When the events are aggregated into fixed-width bins
+    And the histogram is updated with infinite values
+    Then infinite values are ignored
+    And fixed-width bins are limited to a maximum count
@@ -85,3 +85,8 @@ Feature: Color Broadcasting
         Examples:
             | mark             | type                                        | reference |
             | bars             | an array of CSS colors                      | color-broadcast-css-array |
+
+    Scenario: Per-series colors are broadcast to constant columns
+        When per-series colors are broadcast to per-datum colors
+        Then the per-datum colors are writable with constant columns
+        And the per-datum colors can be stored and modified in a table
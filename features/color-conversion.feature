@@ -32,3 +32,23 @@ Feature: Color conversion
     Examples:
       | input                            | output                          |
       | toyplot.color.rgba(1, .5, .4, 1) | rgba(100.0%,50.0%,40.0%,1.000)  |
+
+  Scenario: Conversion from an array of css strings
+    Given a collection of repeated css strings
+    Then toyplot.color.css_array should match toyplot.color.css for every string
+    And toyplot.color.css_array should raise ValueError for an invalid string
+
+  Scenario: Conversion of an array of colors to css
+    Given a collection of repeated colors
+    Then toyplot.color.to_css_array should match toyplot.color.to_css for every color
+
+  Scenario: Packed colors
+    Given a collection of packed colors
+    Then unpacking and packing the colors should be lossless
+    And packed colors can be converted to css
+    And packed colors are stored compactly by marks
+
+  Scenario: Color space conversion of arrays
+    Given a collection of random colors
+    Then converting the colors to and from Lab space should match converting each color
+    And converting the colors to and from Lab space should be lossless
@@ -7,6 +7,30 @@ Feature: Color maps
     And the linear color map can map scalar values to css colors
     And the color map domain can be changed
 
+  Scenario: Linear color maps with Lab interpolation
+    Given a linear color map with Lab interpolation
+    Then the linear color map interpolates colors in Lab space
+
+  Scenario: Linear color maps with degenerate inputs
+    Given a linear color map with an implicit domain
+    Then the linear color map can map constant values to colors
+    And the linear color map can map values containing nan to colors
+    And the linear color map can map values with a center at the domain boundary to colors
+
+  Scenario: Named linear color maps
+    Then the named linear color maps are available in order
+    And each named linear color map can map scalar values to toyplot colors
+
+  Scenario: Linear color maps with lookup tables
+    Given a linear color map and a linear color map with a lookup table
+    Then the color maps should produce similar colors
+    And the color map with a lookup table can produce 8-bit colors
+
+  Scenario: Diverging color maps with lookup tables
+    Given a diverging color map and a diverging color map with a lookup table
+    Then the color maps should produce similar colors
+    And the color map with a lookup table can produce 8-bit colors
+
   Scenario: Diverging color maps
     Given a collection of diverging color maps
     Then each diverging color map can be rendered as ipython html
@@ -22,6 +46,7 @@ Feature: Color maps
   Scenario: Diverging color map colors
     When the user creates a default diverging color map with domain
     Then individual values can be mapped to colors by the diverging color map
+    And arrays of values can be mapped to colors by the diverging color map
 
   Scenario: Diverging color map css
     When the user creates a default diverging color map with domain
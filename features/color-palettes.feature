@@ -16,6 +16,11 @@ Feature: Color palettes
         Given a collection of Color Brewer palettes
         Then each palette can be rendered as ipython html
 
+    Scenario: Cached Color Brewer palettes
+        When the user creates a Color Brewer palette twice
+        Then the palettes should contain the same colors
+        And modifying one palette should not modify the other
+
     Scenario: Color Brewer palette categories
         Given a color brewer category, the palette names for that category can be retrieved.
 
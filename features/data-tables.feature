@@ -26,6 +26,8 @@ Feature: Data tables
     And new columns must have the same number of rows as existing columns
     And new columns must be one-dimensional
     And per-column metadata can be specified
+    And per-column statistics are cached until the column is modified
+    And columns can be dictionary-encoded
     And the table can be converted to a numpy matrix
 
   Scenario Outline: Data table creation
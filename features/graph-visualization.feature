@@ -18,6 +18,11 @@ Feature: Graph visualization
             | ba graph                | eades                           | graph-ba-graph-eades-layout |
             | ba graph                | fruchterman-reingold            | graph-ba-graph-fruchterman-reingold-layout |
             | ba graph                | fruchterman-reingold-curved-edge | graph-ba-graph-fruchterman-reingold-curved-edges-layout |
+            | ba graph                | eades-barnes-hut                | graph-ba-graph-eades-barnes-hut-layout |
+            | ba graph                | fruchterman-reingold-barnes-hut | graph-ba-graph-fruchterman-reingold-barnes-hut-layout |
+            | ba graph                | fruchterman-reingold-grid-cutoff | graph-ba-graph-fruchterman-reingold-grid-cutoff-layout |
+            | ba graph                | multilevel                      | graph-ba-graph-multilevel-layout |
+            | prufer tree             | multilevel                      | graph-prufer-tree-multilevel-layout |
 
     Scenario Outline: Render a graph from source and target arrays
         Given <graph>
@@ -38,6 +43,49 @@ Feature: Graph visualization
         When the graph and layout are combined
         Then the visualization should match the graph-ba-graph-disconnected-vertices-fruchterman-reingold-layout reference image
 
+    Scenario: Render a graph with bundled edges
+        Given a ba graph
+        And a fruchterman-reingold-bundled-edge graph layout
+        When the graph and layout are combined with bundled edges
+        Then the visualization should match the graph-ba-graph-bundled-edges reference image
+        And every edge is drawn as part of a bundle
+
+    Scenario: Barnes-Hut repulsion
+        Given random vertex coordinates
+        Then barnes-hut repulsion with theta zero matches all-pairs repulsion
+        And barnes-hut repulsion approximates all-pairs repulsion
+        And barnes-hut repulsion is deterministic
+
+    Scenario: Grid cutoff repulsion
+        Given random vertex coordinates
+        Then grid cutoff repulsion matches all-pairs repulsion within the cutoff radius
+
+    Scenario: Clip edges to vertex markers
+        Then vectorized marker intersections match per-marker intersections
+        And edge coordinate offsets are computed from edge shapes
+
+    Scenario: Multilevel layout of a large graph
+        Given a random tree with 5000 vertices
+        And a multilevel graph layout
+        Then the layout assigns finite coordinates to every vertex
+        And the layout preserves explicit vertex coordinates
+
+    Scenario: Warm start a force-directed layout
+        Given a random tree with 300 vertices
+        And a fruchterman-reingold graph layout with a tolerance
+        Then the tree can be extended and laid out again using a warm start
+
+    Scenario: Cache graph layouts
+        Given a ba graph
+        Then graph layouts can be cached in memory
+        And graph layouts can be cached on disk
+
+    Scenario: Buchheim layout of a deep tree
+        Given a chain with 5000 vertices
+        And a buchheim graph layout
+        Then the layout assigns finite coordinates to every vertex
+        And the chain is laid out vertically
+
     Scenario: Render subgraph with shared layout
         Given a graph and a subgraph
         Then the subgraph can be rendered with the graph layout
@@ -48,3 +96,6 @@ Feature: Graph visualization
         Then the graph can be rendered with the subgraph layout
         And the visualization should match the graph-shared-layout-graph reference image
 
+    Scenario: Compute graph layout forces in parallel
+        Given a random tree with 3000 vertices
+        Then laying out the graph with multiple threads produces the same layout
@@ -0,0 +1,126 @@
+# Copyright 2014, Sandia Corporation. Under the terms of Contract
+# DE-AC04-94AL85000 with Sandia Corporation, the U.S. Government retains certain
+# rights in this software.
+
+from behave import *
+import nose.tools
+import numpy.testing
+import toyplot.aggregate
+import toyplot.data
+
+
+@given(u'a table of raw events')
+def step_impl(context):
+    context.events = toyplot.data.Table()
+    context.events["key"] = ["a", "b", "a", "c", "b", "a"]
+    context.events["position"] = [0.5, 1.5, 2.5, 12.0, 13.0, 30.0]
+    context.events["value"] = numpy.ma.array([1.0, 2.0, 3.0, 4.0, numpy.nan, 5.0], mask=[False, False, False, False, False, False])
+    context.events["time"] = [0, 3600 * 5, 86400 * 1.5, 86400 * 3, 86400 * 3 + 1, 86400 * 7]
+
+
+@when(u'the events are grouped by key')
+def step_impl(context):
+    context.result = toyplot.aggregate.group(context.events, "key", "value", how=["count", "sum", "mean", "min", "max", "median", "quantile"], q=0.25)
+
+
+@then(u'the result contains one row per key with the requested aggregates')
+def step_impl(context):
+    numpy.testing.assert_array_equal(list(context.result.keys()), ["key", "count", "sum", "mean", "min", "max", "median", "quantile"])
+    numpy.testing.assert_array_equal(context.result["key"], ["a", "b", "c"])
+    numpy.testing.assert_array_equal(context.result["count"], [3, 1, 1])
+    numpy.testing.assert_array_equal(context.result["sum"], [9, 2, 4])
+    numpy.testing.assert_array_equal(context.result["mean"], [3, 2, 4])
+    numpy.testing.assert_array_equal(context.result["min"], [1, 2, 4])
+    numpy.testing.assert_array_equal(context.result["max"], [5, 2, 4])
+    numpy.testing.assert_array_equal(context.result["median"], [3, 2, 4])
+    numpy.testing.assert_array_equal(context.result["quantile"], [2, 2, 4])
+
+
+@when(u'the events are aggregated into fixed-width bins')
+def step_impl(context):
+    context.result = toyplot.aggregate.bins(context.events, "position", width=10, values="value", how=["count", "mean"])
+
+
+@then(u'the result contains contiguous bins with the requested aggregates')
+def step_impl(context):
+    numpy.testing.assert_array_equal(context.result["left"], [0, 10, 20, 30])
+    numpy.testing.assert_array_equal(context.result["right"], [10, 20, 30, 40])
+    numpy.testing.assert_array_equal(context.result["center"], [5, 15, 25, 35])
+    numpy.testing.assert_array_equal(context.result["count"], [3, 1, 0, 1])
+    numpy.testing.assert_array_equal(context.result["mean"].mask, [False, False, True, False])
+    numpy.testing.assert_array_equal(context.result["mean"].compressed(), [2, 4, 5])
+
+
+@when(u'the events are aggregated into bins with explicit edges')
+def step_impl(context):
+    context.edges = [0, 1, 2, 20]
+    context.result = toyplot.aggregate.bins(context.events, "position", edges=context.edges)
+
+
+@then(u'the result matches numpy.histogram')
+def step_impl(context):
+    counts, edges = numpy.histogram(context.events["position"], bins=context.edges)
+    numpy.testing.assert_array_equal(context.result["count"], counts)
+    numpy.testing.assert_array_equal(context.result["left"], edges[:-1])
+    numpy.testing.assert_array_equal(context.result["right"], edges[1:])
+
+
+@when(u'the events are aggregated into daily bins')
+def step_impl(context):
+    context.result = toyplot.aggregate.timestamps(context.events, "time", interval="day")
+
+
+@then(u'the result contains one row per day')
+def step_impl(context):
+    numpy.testing.assert_array_equal(context.result["left"], numpy.arange(8) * 86400)
+    numpy.testing.assert_array_equal(context.result["count"], [2, 1, 0, 2, 0, 0, 0, 1])
+
+
+@given(u'a streaming histogram')
+def step_impl(context):
+    context.histogram = toyplot.aggregate.Histogram(width=10)
+
+
+@when(u'the histogram is updated with multiple batches')
+def step_impl(context):
+    context.histogram.update([1, 2, 15])
+    context.histogram.update(numpy.ma.array([-5, 40, 3], mask=[False, False, True]))
+
+
+@then(u'the histogram contains the total counts for every batch')
+def step_impl(context):
+    table = context.histogram.table()
+    numpy.testing.assert_array_equal(table["left"], [-10, 0, 10, 20, 30, 40])
+    numpy.testing.assert_array_equal(table["count"], [1, 2, 1, 0, 0, 1])
+
+
+@given(u'a table of raw events containing infinite values')
+def step_impl(context):
+    context.events = toyplot.data.Table()
+    context.events["position"] = [0.5, numpy.inf, 12.0, -numpy.inf, 30.0]
+    context.events["value"] = [1.0, 2.0, numpy.inf, 4.0, 5.0]
+    context.histogram = toyplot.aggregate.Histogram(width=10)
+
+
+@when(u'the histogram is updated with infinite values')
+def step_impl(context):
+    context.histogram.update([1.0, numpy.inf, -numpy.inf, 15.0])
+
+
+@then(u'infinite values are ignored')
+def step_impl(context):
+    numpy.testing.assert_array_equal(context.result["left"], [0, 10, 20, 30])
+    numpy.testing.assert_array_equal(context.result["count"], [1, 0, 0, 1])
+    numpy.testing.assert_array_equal(context.result["mean"].mask, [False, True, True, False])
+    table = context.histogram.table()
+    numpy.testing.assert_array_equal(table["left"], [0, 10])
+    numpy.testing.assert_array_equal(table["count"], [1, 1])
+
+
+@then(u'fixed-width bins are limited to a maximum count')
+def step_impl(context):
+    with nose.tools.assert_raises(ValueError):
+        toyplot.aggregate.bins(context.events, "position", width=1e-9)
+    with nose.tools.assert_raises(ValueError):
+        context.histogram.update([1e300])
+    nose.tools.assert_equal(len(context.histogram.counts), 2)
@@ -6,8 +6,11 @@ from __future__ import division
 
 from behave import *
 
+import nose.tools
 import numpy
+import toyplot.broadcast
 import toyplot.color
+import toyplot.data
 
 
 @given(u'a set of diverging series')
@@ -309,3 +312,40 @@ def step_impl(context):
     context.axes.bars(context.series, baseline="symmetric", color=color)
 
 
+
+
+@when(u'per-series colors are broadcast to per-datum colors')
+def step_impl(context):
+    context.colors = toyplot.color.broadcast(["red", "blue"], shape=(1000, 2))
+
+
+@then(u'the per-datum colors are writable with constant columns')
+def step_impl(context):
+    nose.tools.assert_equal(context.colors.shape, (1000, 2))
+    nose.tools.assert_true(context.colors.flags.writeable)
+    nose.tools.assert_true(toyplot.broadcast.is_constant(context.colors[:, 0]))
+    nose.tools.assert_true(toyplot.broadcast.is_constant(context.colors[:, 1]))
+    nose.tools.assert_equal(toyplot.color.to_css_array(context.colors[:, 1])[999], toyplot.color.to_css(toyplot.color.css("blue")))
+
+
+@then(u'the per-datum colors can be stored and modified in a table')
+def step_impl(context):
+    table = toyplot.data.Table()
+    table["fill"] = context.colors[:, 0]
+    nose.tools.assert_true(toyplot.broadcast.is_constant(table["fill"]))
+    table["fill", 5] = toyplot.color.css("green")
+    nose.tools.assert_false(toyplot.broadcast.is_constant(table["fill"]))
+    nose.tools.assert_equal(table["fill"][5], toyplot.color.css("green"))
+    nose.tools.assert_equal(table["fill"][6], toyplot.color.css("red"))
+
+    opacity = toyplot.broadcast.scalar(0.5, (1000,))
+    nose.tools.assert_true(toyplot.broadcast.is_constant(opacity))
+    opacity[2] = 1.0
+    nose.tools.assert_false(toyplot.broadcast.is_constant(opacity))
+
+    view = toyplot.broadcast._view(numpy.array(0.5), (1000,))
+    table["opacity"] = view
+    nose.tools.assert_true(toyplot.broadcast.is_constant(table["opacity"]))
+    table["opacity", 2] = 1.0
+    nose.tools.assert_equal(table["opacity"][2], 1.0)
+    nose.tools.assert_equal(view[2], 0.5)
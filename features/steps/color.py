@@ -10,6 +10,7 @@ import json
 import nose.tools
 import numpy
 import toyplot.color
+import toyplot.html
 
 import testing
 
@@ -35,6 +36,92 @@ def step_impl(context, value):
     nose.tools.assert_equal(toyplot.color.to_css(context.value), value)
 
 
+@given(u'a collection of repeated css strings')
+def step_impl(context):
+    context.strings = numpy.array([["red", "#f0f", "rgba(255, 128, 3, 0.45)"], ["#f0f", "red", "red"]])
+
+
+@then(u'toyplot.color.css_array should match toyplot.color.css for every string')
+def step_impl(context):
+    colors = toyplot.color.css_array(context.strings)
+    nose.tools.assert_equal(colors.shape, context.strings.shape)
+    for string, color in zip(context.strings.flat, colors.flat):
+        nose.tools.assert_equal(color, toyplot.color.css(string))
+    hits = toyplot.color.css.cache.hits
+    toyplot.color.css_array(context.strings)
+    nose.tools.assert_equal(toyplot.color.css.cache.hits, hits + 3)
+
+
+@then(u'toyplot.color.css_array should raise ValueError for an invalid string')
+def step_impl(context):
+    with nose.tools.assert_raises(ValueError):
+        toyplot.color.css_array(["red", "baloney"])
+
+
+@given(u'a collection of repeated colors')
+def step_impl(context):
+    context.colors = toyplot.color.broadcast(numpy.array([[0, 1, 2], [2, 0, 0]]), shape=(2, 3))
+
+
+@then(u'toyplot.color.to_css_array should match toyplot.color.to_css for every color')
+def step_impl(context):
+    strings = toyplot.color.to_css_array(context.colors)
+    nose.tools.assert_equal(strings.shape, context.colors.shape)
+    for color, string in zip(context.colors.flat, strings.flat):
+        nose.tools.assert_equal(string, toyplot.color.to_css(color))
+
+
+@given(u'a collection of packed colors')
+def step_impl(context):
+    context.colors = toyplot.color.pack(toyplot.color.broadcast(numpy.linspace(0, 1, 10), shape=10))
+    nose.tools.assert_equal(context.colors.dtype, toyplot.color.packed_dtype)
+    nose.tools.assert_equal(context.colors.itemsize, 4)
+
+
+@then(u'unpacking and packing the colors should be lossless')
+def step_impl(context):
+    colors = toyplot.color.unpack(context.colors)
+    nose.tools.assert_equal(colors.dtype, toyplot.color.dtype)
+    numpy.testing.assert_array_equal(toyplot.color.pack(colors), context.colors)
+
+
+@then(u'packed colors can be converted to css')
+def step_impl(context):
+    colors = toyplot.color.unpack(context.colors)
+    nose.tools.assert_equal(toyplot.color.to_css(context.colors[3]), toyplot.color.to_css(colors[3]))
+    numpy.testing.assert_array_equal(toyplot.color.to_css_array(context.colors), toyplot.color.to_css_array(colors))
+
+
+@then(u'packed colors are stored compactly by marks')
+def step_impl(context):
+    canvas, axes, mark = toyplot.scatterplot(numpy.arange(10), color=context.colors)
+    nose.tools.assert_equal(mark._table["fill0"].dtype, toyplot.color.packed_dtype)
+    toyplot.html.render(canvas)
+
+
+@given(u'a collection of random colors')
+def step_impl(context):
+    generator = numpy.random.RandomState(1234)
+    context.colors = toyplot.color.rgb(*generator.uniform(size=(3, 20)))
+
+
+@then(u'converting the colors to and from Lab space should match converting each color')
+def step_impl(context):
+    lab = toyplot.color.to_lab(context.colors)
+    nose.tools.assert_equal(lab.shape, (3, 20))
+    colors = toyplot.color.lab(*lab)
+    for index, color in enumerate(context.colors):
+        numpy.testing.assert_array_equal(lab[:, index], toyplot.color.to_lab(color))
+        nose.tools.assert_equal(colors[index], toyplot.color.lab(*toyplot.color.to_lab(color)))
+
+
+@then(u'converting the colors to and from Lab space should be lossless')
+def step_impl(context):
+    colors = toyplot.color.lab(*toyplot.color.to_lab(context.colors))
+    for channel in ["r", "g", "b", "a"]:
+        numpy.testing.assert_allclose(colors[channel], context.colors[channel], atol=0.001)
+
+
 @given(u'a color value')
 def step_impl(context):
     context.value = toyplot.color.css("red")
@@ -58,6 +145,24 @@ def step_impl(context):
             palette._repr_html_(), "color-brewer-%s" % name)
 
 
+@when(u'the user creates a Color Brewer palette twice')
+def step_impl(context):
+    context.palettes = [toyplot.color.brewer.palette("Reds"), toyplot.color.brewer.palette("Reds")]
+
+
+@then(u'the palettes should contain the same colors')
+def step_impl(context):
+    numpy.testing.assert_array_equal(context.palettes[0]._colors, context.palettes[1]._colors)
+
+
+@then(u'modifying one palette should not modify the other')
+def step_impl(context):
+    context.palettes[0] += toyplot.color.Palette(["black"])
+    nose.tools.assert_equal(len(context.palettes[0]), 10)
+    nose.tools.assert_equal(len(context.palettes[1]), 9)
+    nose.tools.assert_equal(len(toyplot.color.brewer.palette("Reds")), 9)
+
+
 @given(u'a color brewer category, the palette names for that category can be retrieved.')
 def step_impl(context):
     nose.tools.assert_equal(toyplot.color.brewer.names("sequential"), [
@@ -200,6 +305,26 @@ def step_impl(context):
         context.color_map.color(2), [0.7059977,  0.01612647,  0.15000112,  1.])
 
 
+@then(u'arrays of values can be mapped to colors by the diverging color map')
+def step_impl(context):
+    values = numpy.array([-1, 0.1, 0.25, 0.4, 0.5, 0.6, 0.75, 0.9, 3]).reshape((-1, 1))
+    colors = context.color_map.colors(values)
+    nose.tools.assert_equal(colors.shape, values.shape)
+    expected = [
+        [0.23003265, 0.29899933, 0.75400176, 1.],
+        [0.3511016, 0.46925129, 0.89107083, 1.],
+        [0.55329468, 0.68905247, 0.99541191, 1.],
+        [0.75391955, 0.83065046, 0.96128027, 1.],
+        [0.86539042, 0.86541865, 0.86532601, 1.],
+        [0.94795562, 0.79514101, 0.71712477, 1.],
+        [0.95827002, 0.6030214, 0.48189862, 1.],
+        [0.84222377, 0.3266024, 0.26728203, 1.],
+        [0.7059977, 0.01612647, 0.15000112, 1.],
+        ]
+    for color, reference in zip(colors.flat, expected):
+        testing.assert_color_equal(color, reference)
+
+
 @then(
     u'individual values can be mapped to css colors by the diverging color map')
 def step_impl(context):
@@ -250,6 +375,96 @@ def step_impl(context):
     nose.tools.assert_equal(context.color_map.css(2), "rgba(0.0%,0.0%,100.0%,1.000)")
 
 
+@given(u'a linear color map with Lab interpolation')
+def step_impl(context):
+    context.color_map = toyplot.color.LinearMap(
+        toyplot.color.Palette(["red", "blue"]), domain_min=0, domain_max=1, interpolation="lab")
+
+
+@then(u'the linear color map interpolates colors in Lab space')
+def step_impl(context):
+    colors = context.color_map.colors([0, 0.5, 1])
+    nose.tools.assert_equal(toyplot.color.to_css(colors[0]), "rgba(100.0%,0.0%,0.0%,1.000)")
+    nose.tools.assert_equal(toyplot.color.to_css(colors[1]), "rgba(79.0%,0.0%,53.5%,1.000)")
+    nose.tools.assert_equal(toyplot.color.to_css(colors[2]), "rgba(0.0%,0.0%,100.0%,1.000)")
+
+
+@given(u'a linear color map with an implicit domain')
+def step_impl(context):
+    context.color_map = toyplot.color.LinearMap(toyplot.color.Palette(["red", "blue"]))
+
+
+@then(u'the linear color map can map constant values to colors')
+def step_impl(context):
+    colors = context.color_map.colors([1, 1, 1])
+    for color in colors:
+        testing.assert_color_equal(color, (1, 0, 0, 1))
+    numpy.testing.assert_array_equal(context.color_map.rgba8(numpy.ones((2, 2))), numpy.tile([255, 0, 0, 255], (2, 2, 1)))
+
+
+@then(u'the linear color map can map values containing nan to colors')
+def step_impl(context):
+    colors = context.color_map.colors([0, numpy.nan, 1])
+    testing.assert_color_equal(colors[0], (1, 0, 0, 1))
+    nose.tools.assert_true(numpy.isnan(colors[1]["r"]))
+    testing.assert_color_equal(colors[2], (0, 0, 1, 1))
+    numpy.testing.assert_array_equal(context.color_map.rgba8([0, numpy.nan, 1]), [[255, 0, 0, 255], [0, 0, 0, 0], [0, 0, 255, 255]])
+
+
+@then(u'the linear color map can map values with a center at the domain boundary to colors')
+def step_impl(context):
+    color_map = toyplot.color.LinearMap(toyplot.color.Palette(["red", "blue"]), center=0)
+    colors = color_map.colors([0, 1, 2])
+    testing.assert_color_equal(colors[0], (0.5, 0, 0.5, 1))
+    testing.assert_color_equal(colors[2], (0, 0, 1, 1))
+    colors = color_map.colors([-2, -1, 0])
+    testing.assert_color_equal(colors[0], (1, 0, 0, 1))
+    testing.assert_color_equal(colors[2], (0.5, 0, 0.5, 1))
+    numpy.testing.assert_array_equal(color_map.rgba8([0, 0]), [[127, 0, 127, 255], [127, 0, 127, 255]])
+
+
+@then(u'the named linear color maps are available in order')
+def step_impl(context):
+    nose.tools.assert_equal(toyplot.color.linear.names(), ["Blackbody", "ExtendedBlackbody", "Kindlmann", "ExtendedKindlmann"])
+
+
+@then(u'each named linear color map can map scalar values to toyplot colors')
+def step_impl(context):
+    for name, color_map in toyplot.color.linear.maps():
+        testing.assert_color_equal(color_map.color(0, domain_min=0, domain_max=1), (0, 0, 0, 1))
+
+
+@given(u'a linear color map and a linear color map with a lookup table')
+def step_impl(context):
+    context.color_map = toyplot.color.brewer.map("BlueRed", domain_min=-1, domain_max=1)
+    context.lut_color_map = toyplot.color.brewer.map("BlueRed", domain_min=-1, domain_max=1, lut=1024)
+
+
+@given(u'a diverging color map and a diverging color map with a lookup table')
+def step_impl(context):
+    context.color_map = toyplot.color.DivergingMap(domain_min=-1, domain_max=1)
+    context.lut_color_map = toyplot.color.DivergingMap(domain_min=-1, domain_max=1, lut=1024)
+
+
+@then(u'the color maps should produce similar colors')
+def step_impl(context):
+    values = numpy.linspace(-2, 2, 101).reshape((-1, 1))
+    expected = context.color_map.colors(values)
+    colors = context.lut_color_map.colors(values)
+    nose.tools.assert_equal(colors.shape, values.shape)
+    for channel in ["r", "g", "b", "a"]:
+        numpy.testing.assert_allclose(colors[channel], expected[channel], atol=0.002)
+    nose.tools.assert_true(numpy.all(numpy.isnan(context.lut_color_map.colors([numpy.nan])["r"])))
+
+
+@then(u'the color map with a lookup table can produce 8-bit colors')
+def step_impl(context):
+    colors = context.lut_color_map.rgba8([[-1, 0, 1]])
+    nose.tools.assert_equal(colors.shape, (1, 3, 4))
+    nose.tools.assert_equal(colors.dtype, numpy.uint8)
+    numpy.testing.assert_allclose(colors, context.color_map.rgba8([[-1, 0, 1]]), atol=1)
+
+
 @then(u'the color map domain can be changed')
 def step_impl(context):
     nose.tools.assert_equal(context.color_map.domain.min, 0)
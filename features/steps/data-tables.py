@@ -15,6 +15,7 @@ import tempfile
 
 import six
 import toyplot.data
+import toyplot.html
 
 import testing
 
@@ -220,6 +221,57 @@ def step_impl(context):
         context.data.metadata("c")
 
 
+@then(u'per-column statistics are cached until the column is modified')
+def step_impl(context):
+    statistics = context.data.statistics("b")
+    nose.tools.assert_equal(statistics.extent, (0, 81))
+    nose.tools.assert_equal(statistics.null_count, 0)
+    nose.tools.assert_equal(statistics.sorted, True)
+    numpy.testing.assert_array_equal(statistics.distinct, [0, 1, 4, 9, 16, 25, 36, 49, 64, 81])
+    nose.tools.assert_is(context.data.statistics("b"), statistics)
+
+    context.data["b", 0] = 100
+    context.data["b", 1] = numpy.ma.masked
+    statistics = context.data.statistics("b")
+    nose.tools.assert_equal(statistics.extent, (4, 100))
+    nose.tools.assert_equal(statistics.null_count, 1)
+    nose.tools.assert_equal(statistics.sorted, False)
+
+    context.data["b"] = context.data["a"] ** 2
+    nose.tools.assert_equal(context.data.statistics("b").extent, (0, 81))
+
+    with nose.tools.assert_raises(ValueError):
+        context.data.statistics("c")
+
+
+@then(u'columns can be dictionary-encoded')
+def step_impl(context):
+    codes, dictionary = context.data.statistics("a").categories
+    numpy.testing.assert_array_equal(dictionary[codes], context.data["a"])
+
+    titles = numpy.ma.array(numpy.array(["x", None, "y", "x", None, "x", "y", "y", None, "x"], dtype="object"))
+    titles[9] = numpy.ma.masked
+    context.data["c"] = titles
+    codes, dictionary = context.data.statistics("c").categories
+    numpy.testing.assert_array_equal(codes, [0, 1, 2, 0, 1, 0, 2, 2, 1, -1])
+    numpy.testing.assert_array_equal(dictionary, ["x", None, "y"])
+
+    context.data["c"] = numpy.array([1, 1.0, True, 1, 1.0, True, 1, 1.0, True, 1], dtype="object")
+    codes, dictionary = context.data.statistics("c").categories
+    numpy.testing.assert_array_equal(codes, [0, 1, 2, 0, 1, 2, 0, 1, 2, 0])
+    nose.tools.assert_equal([type(value) for value in dictionary], [int, float, bool])
+
+    context.data["c"] = titles
+    context.data.statistics("c").distinct_limit = 2
+    nose.tools.assert_is_none(context.data.statistics("c").categories)
+    nose.tools.assert_equal(list(toyplot.html._decode(context.data, "c", toyplot.html._convert_title)), ["x", None, "y", "x", None, "x", "y", "y", None, None])
+
+    context.data["c"] = numpy.arange(10) * 1.5
+    context.data.statistics("c").distinct_limit = 5
+    nose.tools.assert_is_none(context.data.statistics("c").categories)
+    del context.data["c"]
+
+
 @then(u'the table can be converted to a numpy matrix')
 def step_impl(context):
     matrix = context.data.matrix()
@@ -4,8 +4,17 @@
 
 from behave import *
 
+import re
+import shutil
+import tempfile
+
+import nose.tools
 import numpy
+import toyplot.cache
+import toyplot.config
 import toyplot.layout
+import toyplot.marker
+import toyplot.svg
 
 import testing
 
@@ -58,6 +67,177 @@ def step_impl(context):
 def step_impl(context):
     context.layout = toyplot.layout.FruchtermanReingold(edges=toyplot.layout.CurvedEdges())
 
+@given(u'a eades-barnes-hut graph layout')
+def step_impl(context):
+    context.layout = toyplot.layout.Eades(repulsion=toyplot.layout.BarnesHut())
+
+@given(u'a fruchterman-reingold-barnes-hut graph layout')
+def step_impl(context):
+    context.layout = toyplot.layout.FruchtermanReingold(repulsion=toyplot.layout.BarnesHut())
+
+@given(u'a multilevel graph layout')
+def step_impl(context):
+    context.layout = toyplot.layout.Multilevel()
+
+@given(u'a fruchterman-reingold-bundled-edge graph layout')
+def step_impl(context):
+    context.layout = toyplot.layout.FruchtermanReingold(edges=toyplot.layout.BundledEdges(resolution=4))
+
+@given(u'a fruchterman-reingold-grid-cutoff graph layout')
+def step_impl(context):
+    context.layout = toyplot.layout.FruchtermanReingold(repulsion=toyplot.layout.GridCutoff())
+
+@given(u'a random tree with {vcount:d} vertices')
+def step_impl(context, vcount):
+    generator = numpy.random.RandomState(1234)
+    sources = numpy.arange(1, vcount)
+    targets = (generator.uniform(size=len(sources)) * sources).astype("int64")
+    context.edges = numpy.column_stack((sources, targets))
+    context.vcoordinates = numpy.ma.masked_all((vcount, 2))
+
+@given(u'a fruchterman-reingold graph layout with a tolerance')
+def step_impl(context):
+    context.layout = toyplot.layout.FruchtermanReingold(temperature=0.01, M=100, tolerance=0.002)
+
+@then(u'the tree can be extended and laid out again using a warm start')
+def step_impl(context):
+    vcount = len(context.vcoordinates)
+    first = toyplot.layout.graph(context.edges, layout=context.layout)
+    nose.tools.assert_less(context.layout.iterations, 100)
+
+    generator = numpy.random.RandomState(1234)
+    neighbors = (generator.uniform(size=10) * vcount).astype("int64")
+    edges = numpy.concatenate((context.edges, numpy.column_stack((neighbors, numpy.arange(vcount, vcount + 10)))))
+    second = toyplot.layout.graph(edges, olayout=first, layout=context.layout, owarm=True)
+    nose.tools.assert_less(context.layout.iterations, 100)
+
+    # Existing vertices can't move farther than the sum of the temperatures.
+    moved = numpy.linalg.norm(second.vcoordinates[:vcount] - first.vcoordinates, axis=1)
+    nose.tools.assert_less(numpy.max(moved), 0.5)
+    # New vertices start next to their neighbors.
+    distance = numpy.linalg.norm(second.vcoordinates[vcount:] - second.vcoordinates[neighbors], axis=1)
+    nose.tools.assert_less(numpy.max(distance), 1.0)
+
+@then(u'graph layouts can be cached in memory')
+def step_impl(context):
+    toyplot.config.layout_cache = toyplot.cache.LRU(maxsize=4)
+    try:
+        first = toyplot.layout.graph(context.graph, layout=toyplot.layout.FruchtermanReingold())
+        second = toyplot.layout.graph(context.graph, layout=toyplot.layout.FruchtermanReingold())
+        nose.tools.assert_equal(toyplot.config.layout_cache.hits, 1)
+        numpy.testing.assert_array_equal(first.vcoordinates, second.vcoordinates)
+        numpy.testing.assert_array_equal(first.ecoordinates, second.ecoordinates)
+
+        toyplot.layout.graph(context.graph, layout=toyplot.layout.FruchtermanReingold(seed=42))
+        toyplot.layout.graph(context.graph, vcoordinates=first.vcoordinates)
+        nose.tools.assert_equal(toyplot.config.layout_cache.misses, 3)
+    finally:
+        toyplot.config.layout_cache = None
+
+@then(u'graph layouts can be cached on disk')
+def step_impl(context):
+    directory = tempfile.mkdtemp()
+    try:
+        toyplot.config.layout_cache = toyplot.cache.LRU(maxsize=4, directory=directory)
+        first = toyplot.layout.graph(context.graph, layout=toyplot.layout.Eades())
+        toyplot.config.layout_cache = toyplot.cache.LRU(maxsize=4, directory=directory)
+        second = toyplot.layout.graph(context.graph, layout=toyplot.layout.Eades())
+        nose.tools.assert_equal(toyplot.config.layout_cache.hits, 1)
+        numpy.testing.assert_array_equal(first.vcoordinates, second.vcoordinates)
+    finally:
+        toyplot.config.layout_cache = None
+        shutil.rmtree(directory)
+
+@given(u'a chain with {vcount:d} vertices')
+def step_impl(context, vcount):
+    context.edges = numpy.column_stack((numpy.arange(vcount - 1), numpy.arange(1, vcount)))
+    context.vcoordinates = numpy.ma.masked_all((vcount, 2))
+
+@then(u'the chain is laid out vertically')
+def step_impl(context):
+    vcoordinates, eshapes, ecoordinates = context.layout.graph(context.vcoordinates, context.edges)
+    numpy.testing.assert_array_equal(vcoordinates.T[0], 0)
+    numpy.testing.assert_array_equal(vcoordinates.T[1], -numpy.arange(len(vcoordinates)))
+
+@then(u'the layout assigns finite coordinates to every vertex')
+def step_impl(context):
+    vcoordinates, eshapes, ecoordinates = context.layout.graph(context.vcoordinates, context.edges)
+    nose.tools.assert_equal(vcoordinates.shape, context.vcoordinates.shape)
+    nose.tools.assert_false(numpy.ma.is_masked(vcoordinates))
+    nose.tools.assert_true(numpy.all(numpy.isfinite(vcoordinates)))
+
+@then(u'the layout preserves explicit vertex coordinates')
+def step_impl(context):
+    context.vcoordinates[0] = (5, 5)
+    vcoordinates, eshapes, ecoordinates = context.layout.graph(context.vcoordinates, context.edges)
+    numpy.testing.assert_array_equal(vcoordinates[0], (5, 5))
+    nose.tools.assert_true(numpy.all(numpy.isfinite(vcoordinates)))
+
+@then(u'laying out the graph with multiple threads produces the same layout')
+def step_impl(context):
+    for layout in [toyplot.layout.Eades, toyplot.layout.FruchtermanReingold, toyplot.layout.Multilevel]:
+        for repulsion in [toyplot.layout.BarnesHut, toyplot.layout.GridCutoff]:
+            serial = layout(M=5, repulsion=repulsion()).graph(context.vcoordinates, context.edges)
+            parallel = layout(M=5, repulsion=repulsion(), threads=4).graph(context.vcoordinates, context.edges)
+            numpy.testing.assert_array_equal(serial[0], parallel[0])
+    with nose.tools.assert_raises(ValueError):
+        toyplot.layout.FruchtermanReingold(threads=0)
+
+@given(u'random vertex coordinates')
+def step_impl(context):
+    generator = numpy.random.RandomState(1234)
+    context.vcoordinates = generator.uniform(size=(500, 2))
+    context.force = lambda distance: 1.0 / distance
+    repulsion = toyplot.layout.AllPairs()
+    context.exact = repulsion.forces(context.vcoordinates, context.force)
+    nose.tools.assert_equal(vars(repulsion), {})
+
+@then(u'barnes-hut repulsion with theta zero matches all-pairs repulsion')
+def step_impl(context):
+    offsets = toyplot.layout.BarnesHut(theta=0).forces(context.vcoordinates, context.force)
+    numpy.testing.assert_allclose(offsets, context.exact, rtol=1e-10)
+
+@then(u'barnes-hut repulsion approximates all-pairs repulsion')
+def step_impl(context):
+    offsets = toyplot.layout.BarnesHut().forces(context.vcoordinates, context.force)
+    error = numpy.linalg.norm(offsets - context.exact, axis=1) / numpy.linalg.norm(context.exact, axis=1)
+    nose.tools.assert_less(numpy.median(error), 0.01)
+
+@then(u'grid cutoff repulsion matches all-pairs repulsion within the cutoff radius')
+def step_impl(context):
+    radius = 0.1
+    cutoff = lambda distance: numpy.where(distance < radius, context.force(distance), 0)
+    numpy.testing.assert_allclose(
+        toyplot.layout.GridCutoff(radius=radius).forces(context.vcoordinates, context.force),
+        toyplot.layout.AllPairs().forces(context.vcoordinates, cutoff),
+        rtol=1e-10, atol=1e-10)
+    with nose.tools.assert_raises(ValueError):
+        toyplot.layout.GridCutoff(radius=0)
+
+@then(u'barnes-hut repulsion is deterministic')
+def step_impl(context):
+    repulsion = toyplot.layout.BarnesHut()
+    numpy.testing.assert_array_equal(
+        repulsion.forces(context.vcoordinates, context.force),
+        repulsion.forces(context.vcoordinates, context.force))
+
+@then(u'vectorized marker intersections match per-marker intersections')
+def step_impl(context):
+    generator = numpy.random.RandomState(1234)
+    p = generator.normal(size=(100, 2))
+    p[0] = [1, 0]
+    p[1] = [0, -1]
+    size = generator.choice([0, 5, 10], size=100)
+    for shape in ["o", "o+", "s", "r2x1", "r1x3", "^"]:
+        expected = [toyplot.marker.create(shape=shape, size=s).intersect(numpy.copy(v)) for s, v in zip(size, p)]
+        numpy.testing.assert_array_equal(toyplot.marker.intersect(shape, size, p), expected)
+
+@then(u'edge coordinate offsets are computed from edge shapes')
+def step_impl(context):
+    numpy.testing.assert_array_equal(toyplot.layout._edge_offsets(["ML", "MQ", "MC", "MLL"]), [0, 2, 5, 9, 12])
+    with nose.tools.assert_raises(ValueError):
+        toyplot.layout._edge_offsets(["ML", "MX"])
+
 @when(u'the graph and layout are combined')
 def step_impl(context):
     if context.disconnected_vertices is not None:
@@ -65,6 +245,22 @@ def step_impl(context):
     else:
         context.canvas, axes, mark = toyplot.graph(context.graph, layout=context.layout, vcoordinates=context.vcoordinates)
 
+@when(u'the graph and layout are combined with bundled edges')
+def step_impl(context):
+    context.canvas, axes, context.mark = toyplot.graph(context.graph, layout=context.layout, ebundle=True, ewidth=0.5)
+
+@then(u'every edge is drawn as part of a bundle')
+def step_impl(context):
+    svg = toyplot.svg.render(context.canvas)
+    paths = svg.findall(".//*[@class='toyplot-Edges']/path")
+    nose.tools.assert_less(len(paths), len(context.graph))
+    widths = [float(re.search("stroke-width:([^;]+)", path.get("style")).group(1)) for path in paths]
+    nose.tools.assert_less_equal(numpy.sum(widths), 0.5 * len(context.graph))
+    for path in paths:
+        coordinates = path.get("d").split()
+        nose.tools.assert_not_equal(coordinates[1:3], coordinates[-2:])
+    nose.tools.assert_equal(context.mark._etable.shape[0], len(context.graph))
+
 @when(u'a graph visualization is constructed from explicit source and target edge arrays')
 def step_impl(context):
     numpy.random.seed(1234)
@@ -5,7 +5,9 @@
 from behave import *
 
 import nose.tools
+import toyplot.font
 import toyplot.html
+import toyplot.text
 
 
 @given(u'text with default alignment')
@@ -198,3 +200,39 @@ def step_impl(context):
 def step_impl(context, markup):
     context.axes.text(0, 0, markup, color=toyplot.color.black, style={"font-size": "32px"})
 
+
+
+@then(u'text layouts are cached')
+def step_impl(context):
+    toyplot.text.layout.cache.clear()
+    style = {"font-size": "12px"}
+    first = toyplot.text.layout("Cached!", style, toyplot.font.library())
+    second = toyplot.text.layout("Cached!", {"font-size": "12px"}, toyplot.font.library())
+    nose.tools.assert_is(first, second)
+    third = toyplot.text.layout("Cached!", {"font-size": "14px"}, toyplot.font.library())
+    nose.tools.assert_is_not(first, third)
+    nose.tools.assert_equal(toyplot.text.layout.cache.hits, 1)
+    nose.tools.assert_equal(toyplot.text.layout.cache.misses, 2)
+
+
+@then(u'the font library is shared')
+def step_impl(context):
+    nose.tools.assert_is(toyplot.font.library(), toyplot.font.library())
+    style = {"font-family": "helvetica", "font-size": "12px"}
+    nose.tools.assert_is(toyplot.font.library().font(style), toyplot.font.library().font(style))
+
+
+@then(u'plain text layouts match markup layouts')
+def step_impl(context):
+    fonts = toyplot.font.library()
+    for text in ["x", "Hello, world!", "  -1.5e+10  "]:
+        for style in [{}, {"text-anchor": "start", "-toyplot-anchor-shift": "5px"}, {"text-anchor": "end", "-toyplot-vertical-align": "top", "font-size": "24px"}]:
+            plain = toyplot.text._layout(text, style, fonts, tuple(sorted(style.items())))
+            markup = toyplot.text._markup_layout(text, style, fonts)
+            for expected, actual in [(markup, plain), (markup.children[0], plain.children[0]), (markup.children[0].children[0], plain.children[0].children[0])]:
+                nose.tools.assert_equal(type(expected), type(actual))
+                nose.tools.assert_equal(expected.style, actual.style)
+                for name in ["left", "right", "top", "bottom", "width", "height"]:
+                    nose.tools.assert_equal(getattr(expected, name), getattr(actual, name))
+    for text in ["", "<b>x</b>", "x &amp; y", "x<br/>y"]:
+        nose.tools.assert_false(toyplot.text._plain_text(text))
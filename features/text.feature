@@ -40,6 +40,13 @@ Feature: Text
         And a set of cartesian axes
         When text is aligned with an unknown alignment-baseline value, an exception is raised.
 
+    Scenario: Text layout cache
+        Then text layouts are cached
+        And the font library is shared
+
+    Scenario: Plain text layout
+        Then plain text layouts match markup layouts
+
     Scenario Outline: Rich Text
         Given a default canvas
         And a set of cartesian axes
@@ -27,7 +27,7 @@ setup(
         "numpy>=1.8.0",
         "pypng",
         "reportlab",
-        "six",
+        "six>=1.13",
     ],
     long_description="""Toyplot is the kid-sized plotting toolkit for Python with grownup-sized goals:
   * Develop beautiful interactive, animated plots that embrace the unique capabilities of electronic publishing and support repoducibility.
@@ -39,7 +39,7 @@ setup(
     maintainer_email="tshead@sandia.gov",
     name="toyplot",
     packages=find_packages(),
-    package_data = {"": ["*.csv"]},
+    package_data = {"": ["*.csv", "*.json"]},
     url="http://toyplot.readthedocs.org",
     version=re.search(
         r"^__version__ = ['\"]([^'\"]*)['\"]",
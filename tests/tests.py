@@ -540,6 +540,41 @@ def test_axes_plot_masked_nan():
     assert_canvas_matches(canvas, "axes-plot-masked-nan")
 
 
+def test_axes_plot_masked_nan_chunks():
+    x = numpy.linspace(0, 2 * numpy.pi, 51)
+    y = numpy.ma.column_stack((
+        1 + 0.5 * numpy.sin(x),
+        1 + 0.5 * numpy.cos(x),
+        1 + 0.2 * numpy.sin(2 * x),
+    ))
+    y[8:18, 0] = numpy.nan
+    y[33:43, 1] = numpy.ma.masked
+
+    canvas, axes, mark = toyplot.plot(
+        (x[i:i + 10] for i in range(0, len(x), 10)),
+        (y[i:i + 7] for i in range(0, len(y), 7)),
+        marker="o")
+    assert_canvas_matches(canvas, "axes-plot-masked-nan")
+
+
+def test_axes_plot_masked_nan_memmap():
+    x = numpy.linspace(0, 2 * numpy.pi, 51)
+    y = numpy.column_stack((
+        1 + 0.5 * numpy.sin(x),
+        1 + 0.5 * numpy.cos(x),
+        1 + 0.2 * numpy.sin(2 * x),
+    ))
+    y[8:18, 0] = numpy.nan
+    y[33:43, 1] = numpy.nan
+
+    with tempfile.NamedTemporaryFile() as stream:
+        mapped = numpy.memmap(stream, dtype="float64", mode="w+", shape=y.shape)
+        mapped[...] = y
+        canvas, axes, mark = toyplot.plot(x, mapped, marker="o")
+        nose.tools.assert_is_instance(mark._table["y0"].data, numpy.memmap)
+        assert_canvas_matches(canvas, "axes-plot-masked-nan")
+
+
 def test_axes_bars_magnitudes_masked_nan():
     x = numpy.linspace(0, 2 * numpy.pi, 51)
     y = numpy.ma.column_stack((
@@ -603,6 +638,15 @@ def test_scatterplot_one_variable():
     assert_canvas_matches(canvas, "scatterplot-one-variable")
 
 
+def test_scatterplot_one_variable_chunks():
+    numpy.random.seed(1234)
+    observations = numpy.random.normal(loc=1, size=(25, 100))
+    y = numpy.mean(observations, axis=1)
+
+    canvas, axes, mark = toyplot.scatterplot(y[i:i + 10] for i in range(0, len(y), 10))
+    assert_canvas_matches(canvas, "scatterplot-one-variable")
+
+
 def test_axes_scatterplot_one_variable():
     numpy.random.seed(1234)
     observations = numpy.random.normal(loc=1, size=(25, 100))
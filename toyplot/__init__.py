@@ -182,6 +182,7 @@ def graph(
         b=None,
         c=None,
         along="x",
+        ebundle=False,
         ecolor=None,
         eopacity=1.0,
         estyle=None,
@@ -193,6 +194,7 @@ def graph(
         mmarker=None,
         mposition=0.5,
         olayout=None,
+        owarm=False,
         padding=20,
         tmarker=None,
         varea=None,
@@ -238,6 +240,7 @@ def graph(
         b=b,
         c=c,
         along=along,
+        ebundle=ebundle,
         ecolor=ecolor,
         eopacity=eopacity,
         estyle=estyle,
@@ -247,6 +250,7 @@ def graph(
         mmarker=mmarker,
         mposition=mposition,
         olayout=olayout,
+        owarm=owarm,
         tmarker=tmarker,
         varea=varea,
         vcolor=vcolor,
@@ -0,0 +1,454 @@
+# Copyright 2014, Sandia Corporation. Under the terms of Contract
+# DE-AC04-94AL85000 with Sandia Corporation, the U.S. Government retains certain
+# rights in this software.
+
+"""Functions and classes for summarizing large tables before they are plotted.
+
+The results are ordinary :class:`toyplot.data.Table` instances containing one
+row per group or bin, so that marks such as
+:meth:`toyplot.coordinates.Cartesian.bars` and
+:meth:`toyplot.coordinates.Cartesian.fill` only ever see the aggregated rows.
+Binned results contain "left", "right", and "center" columns, plus one column
+for each requested aggregation:
+
+>>> counts = toyplot.aggregate.bins(table, "latency", width=10)
+>>> axes.bars(counts["left"], counts["right"], counts["count"])
+>>> axes.fill(counts["center"], counts["count"])
+"""
+
+from __future__ import division
+
+import collections
+
+import arrow
+import numpy
+import six
+
+import toyplot.data
+
+
+_aggregations = ["count", "sum", "mean", "min", "max", "median", "quantile"]
+
+#: Largest number of fixed-width bins that will be allocated, to guard against
+#: outliers or very small bin widths.
+max_bins = 1000000
+
+
+def _require_how(how):
+    if isinstance(how, six.string_types):
+        how = [how]
+    how = list(how)
+    for name in how:
+        if name not in _aggregations:
+            raise ValueError("Unknown aggregation: %s.  Use one of %s." % (name, ", ".join(_aggregations)))
+    return how
+
+
+def _require_column(table, column):
+    if not isinstance(table, toyplot.data.Table):
+        raise ValueError("Expected toyplot.data.Table, received %s." % type(table))
+    if column not in table.keys():
+        raise ValueError("Unknown column: %s" % column)
+    return table[column]
+
+
+def _valid(values):
+    """Return a boolean array that is True for values that are neither masked nor non-finite (NaN or infinite)."""
+    values = numpy.ma.asarray(values)
+    valid = numpy.logical_not(numpy.ma.getmaskarray(values))
+    if issubclass(values.dtype.type, numpy.floating):
+        valid = numpy.logical_and(valid, numpy.isfinite(numpy.ma.getdata(values)))
+    return valid
+
+
+def _require_bin_count(count):
+    if count > max_bins:
+        raise ValueError("Fixed-width bins would require %s bins, more than the limit of %s.  Use a larger width." % (count, max_bins))
+    return count
+
+
+def _aggregate(groups, group_count, values, how, q):
+    """Compute aggregates for values that have been assigned to integer groups.
+
+    Parameters
+    ----------
+    groups: integer array
+        Group index in the range [0, group_count) for each value.  Values with
+        negative group indices are ignored.
+    group_count: integer
+        Total number of groups.
+    values: array or None
+        Values to be aggregated, or None when only counting.
+    how: list of strings
+        Aggregations to compute.
+    q: float
+        Quantile in the range [0, 1] used by the "quantile" aggregation.
+
+    Returns
+    -------
+    columns: :class:`collections.OrderedDict` of aggregation name to masked array.
+    """
+    selection = groups >= 0
+    if values is not None:
+        values = numpy.ma.asarray(values)
+        selection = numpy.logical_and(selection, _valid(values))
+        values = numpy.ma.getdata(values)[selection].astype("float64")
+    groups = groups[selection]
+
+    counts = numpy.bincount(groups, minlength=group_count)[:group_count]
+    empty = counts == 0
+
+    columns = collections.OrderedDict()
+    sorted_values = None
+    for name in how:
+        if name == "count":
+            columns[name] = numpy.ma.array(counts)
+            continue
+
+        if values is None:
+            raise ValueError("A values column is required for the %s aggregation." % name)
+
+        if name == "sum":
+            columns[name] = numpy.ma.array(numpy.bincount(groups, weights=values, minlength=group_count)[:group_count])
+        elif name == "mean":
+            sums = numpy.bincount(groups, weights=values, minlength=group_count)[:group_count]
+            columns[name] = numpy.ma.array(sums / numpy.maximum(counts, 1), mask=empty)
+        else:
+            # Order statistics are computed from values sorted within each group.
+            if sorted_values is None:
+                order = numpy.lexsort((values, groups))
+                sorted_values = values[order]
+                begin = numpy.concatenate(([0], numpy.cumsum(counts)[:-1])) if group_count else counts
+                last = numpy.maximum(begin + counts - 1, begin)
+
+            if not len(sorted_values):
+                columns[name] = numpy.ma.masked_all(group_count, dtype="float64")
+                continue
+
+            if name == "min":
+                result = sorted_values[numpy.minimum(begin, len(sorted_values) - 1)]
+            elif name == "max":
+                result = sorted_values[numpy.minimum(last, len(sorted_values) - 1)]
+            else:
+                quantile = 0.5 if name == "median" else q
+                # Linear interpolation between order statistics, matching numpy.percentile().
+                position = begin + quantile * (last - begin)
+                lower = numpy.minimum(numpy.floor(position).astype("int64"), len(sorted_values) - 1)
+                upper = numpy.minimum(numpy.ceil(position).astype("int64"), len(sorted_values) - 1)
+                fraction = position - numpy.floor(position)
+                result = sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+            columns[name] = numpy.ma.array(result, mask=empty)
+
+    return columns
+
+
+def group(table, by, values=None, how="count", q=0.5):
+    """Aggregate the rows of a table that share a common key.
+
+    Rows with masked keys are ignored, as are masked, NaN, or infinite values.
+
+    Parameters
+    ----------
+    table: :class:`toyplot.data.Table`
+        Table containing the raw rows to be aggregated.
+    by: string
+        Name of the column containing group keys.
+    values: string, optional
+        Name of the column containing values to be aggregated.  Required for
+        every aggregation except "count".
+    how: string or sequence of strings, optional
+        One or more of "count", "sum", "mean", "min", "max", "median", or
+        "quantile".
+    q: float, optional
+        Quantile in the range [0, 1] used by the "quantile" aggregation.
+
+    Returns
+    -------
+    table: :class:`toyplot.data.Table` containing one row per unique key,
+    sorted by key, with the key column followed by one column per aggregation.
+    """
+    how = _require_how(how)
+    keys = _require_column(table, by)
+    values = _require_column(table, values) if values is not None else None
+
+    selection = _valid(keys)
+    groups = numpy.repeat(-1, len(keys))
+    unique, inverse = numpy.unique(numpy.ma.getdata(keys)[selection], return_inverse=True)
+    groups[selection] = inverse
+
+    result = toyplot.data.Table()
+    result[by] = unique
+    for name, column in _aggregate(groups, len(unique), values, how, q).items():
+        result[name] = column
+    return result
+
+
+def bins(table, column, width=None, origin=0, edges=None, values=None, how="count", q=0.5):
+    """Aggregate the rows of a table into bins along a numeric column.
+
+    Callers may specify fixed-width bins, aligned so that `origin` is always a
+    bin boundary:
+
+    >>> toyplot.aggregate.bins(table, "latency", width=10)
+
+    or explicit bin edges:
+
+    >>> toyplot.aggregate.bins(table, "latency", edges=[0, 10, 100, 1000])
+
+    Fixed-width bins are half-open and always cover the full range of the data,
+    up to a limit of :data:`max_bins` bins.
+    Like :func:`numpy.histogram`, explicit edges create half-open bins except
+    for the last bin, which is closed, and rows outside the edges are ignored.
+    Empty bins are included in the output, so the results are contiguous.
+
+    Parameters
+    ----------
+    table: :class:`toyplot.data.Table`
+        Table containing the raw rows to be aggregated.
+    column: string
+        Name of the numeric column used to assign rows to bins.
+    width: number, optional
+        Width of fixed-width bins.
+    origin: number, optional
+        Location of a bin boundary for fixed-width bins.
+    edges: array-like, optional
+        Monotonically increasing sequence of :math:`M+1` bin edges.
+    values: string, optional
+        Name of the column containing values to be aggregated.  Required for
+        every aggregation except "count".
+    how: string or sequence of strings, optional
+        One or more of "count", "sum", "mean", "min", "max", "median", or
+        "quantile".
+    q: float, optional
+        Quantile in the range [0, 1] used by the "quantile" aggregation.
+
+    Returns
+    -------
+    table: :class:`toyplot.data.Table` containing one row per bin, with "left",
+    "right", and "center" columns followed by one column per aggregation.
+    """
+    how = _require_how(how)
+    positions = _require_column(table, column)
+    values = _require_column(table, values) if values is not None else None
+
+    selection = _valid(positions)
+    positions = numpy.ma.getdata(positions).astype("float64")
+    groups = numpy.repeat(-1, len(positions))
+
+    if (width is None) == (edges is None):
+        raise ValueError("Specify either width or edges.")
+
+    if width is not None:
+        if width <= 0:
+            raise ValueError("Bin width must be positive.")
+        indices = numpy.floor((positions[selection] - origin) / width)
+        if len(indices):
+            first = int(indices.min())
+            count = _require_bin_count(int(indices.max()) - first + 1)
+            groups[selection] = indices.astype("int64") - first
+        else:
+            first = 0
+            count = 0
+        edges = origin + (first + numpy.arange(count + 1)) * width
+    else:
+        edges = numpy.asarray(edges, dtype="float64")
+        if edges.ndim != 1 or len(edges) < 2:
+            raise ValueError("At least two bin edges are required.")
+        if numpy.any(numpy.diff(edges) <= 0):
+            raise ValueError("Bin edges must be monotonically increasing.")
+        count = len(edges) - 1
+        indices = numpy.searchsorted(edges, positions[selection], side="right") - 1
+        indices[positions[selection] == edges[-1]] = count - 1
+        indices[numpy.logical_or(indices < 0, indices >= count)] = -1
+        groups[selection] = indices
+
+    result = toyplot.data.Table()
+    result["left"] = edges[:-1]
+    result["right"] = edges[1:]
+    result["center"] = (edges[:-1] + edges[1:]) * 0.5
+    for name, aggregate in _aggregate(groups, count, values, how, q).items():
+        result[name] = aggregate
+    return result
+
+
+def _timestamp_interval(interval):
+    if isinstance(interval, six.string_types):
+        interval = (1, interval)
+    amount, units = int(interval[0]), interval[1].lower()
+    if amount < 1:
+        raise ValueError("Interval quantity must be a positive integer.")
+
+    frames = {
+        "year": "year", "years": "year",
+        "quarter": "quarter", "quarters": "quarter",
+        "month": "month", "months": "month",
+        "week": "week", "weeks": "week",
+        "day": "day", "days": "day",
+        "hour": "hour", "hours": "hour",
+        "minute": "minute", "minutes": "minute",
+        "second": "second", "seconds": "second",
+        }
+    if units not in frames:
+        raise ValueError("Unsupported interval units: %s" % units)
+    return amount, frames[units]
+
+
+def timestamps(table, column, interval, timezone="utc", values=None, how="count", q=0.5):
+    """Aggregate the rows of a table into calendar-aligned time bins.
+
+    Timestamps are expected to be seconds relative to the Unix epoch, as used
+    by :class:`toyplot.locator.Timestamp`.  Bins are aligned to the start of
+    the given calendar unit in the given timezone, so that (for example)
+    daily bins begin at local midnight:
+
+    >>> toyplot.aggregate.timestamps(table, "time", interval="day", timezone="US/Mountain")
+    >>> toyplot.aggregate.timestamps(table, "time", interval=(15, "minutes"))
+
+    Parameters
+    ----------
+    table: :class:`toyplot.data.Table`
+        Table containing the raw rows to be aggregated.
+    column: string
+        Name of the column containing timestamps.
+    interval: string or (integer, string) tuple
+        Bin width in calendar units.  Allowed units are "year", "years",
+        "quarter", "quarters", "month", "months", "week", "weeks", "day",
+        "days", "hour", "hours", "minute", "minutes", "second", and "seconds".
+    timezone: string, optional
+        Timezone used to align bins.  Defaults to "utc".  Supports any timezone
+        code allowed by :class:`arrow.arrow.Arrow`.
+    values: string, optional
+        Name of the column containing values to be aggregated.  Required for
+        every aggregation except "count".
+    how: string or sequence of strings, optional
+        One or more of "count", "sum", "mean", "min", "max", "median", or
+        "quantile".
+    q: float, optional
+        Quantile in the range [0, 1] used by the "quantile" aggregation.
+
+    Returns
+    -------
+    table: :class:`toyplot.data.Table` containing one row per bin, with "left",
+    "right", and "center" columns followed by one column per aggregation.
+    """
+    amount, frame = _timestamp_interval(interval)
+    positions = _require_column(table, column)
+
+    domain_min, domain_max = toyplot.data.minimax([positions])
+    if domain_min is None:
+        return bins(table, column, width=1, values=values, how=how, q=q)
+
+    shift = {frame + "s": amount}
+    edge = arrow.get(domain_min).to(timezone).floor(frame)
+    edges = [edge]
+    while edges[-1].timestamp <= domain_max:
+        edges.append(edges[-1].shift(**shift))
+
+    edges = numpy.array([edge.timestamp for edge in edges], dtype="float64")
+    return bins(table, column, edges=edges, values=values, how=how, q=q)
+
+
+class Histogram(object):
+    """Accumulate fixed-width histogram counts from a stream of values.
+
+    Use this when the raw values are too large to hold in memory at once, or
+    arrive incrementally.  The bin range grows as needed to cover every value
+    seen so far, up to a limit of :data:`max_bins` bins:
+
+    >>> histogram = toyplot.aggregate.Histogram(width=10)
+    >>> for chunk in chunks:
+    ...     histogram.update(chunk)
+    >>> counts = histogram.table()
+    >>> axes.bars(counts["left"], counts["right"], counts["count"])
+
+    Parameters
+    ----------
+    width: number
+        Width of each bin.
+    origin: number, optional
+        Location of a bin boundary.
+    """
+    def __init__(self, width, origin=0):
+        if width <= 0:
+            raise ValueError("Bin width must be positive.")
+        self._width = width
+        self._origin = origin
+        self._first = 0
+        self._counts = numpy.zeros(0, dtype="float64")
+
+    def update(self, values, weights=None):
+        """Add a batch of values to the histogram.
+
+        Masked, NaN, and infinite values are ignored.
+
+        Parameters
+        ----------
+        values: array-like
+            Values to be counted.
+        weights: array-like, optional
+            Weight for each value, which defaults to one.
+        """
+        values = numpy.ma.asarray(values).ravel()
+        selection = _valid(values)
+        if weights is not None:
+            weights = numpy.asarray(weights, dtype="float64").ravel()
+            if weights.shape != values.shape:
+                raise ValueError("Expected %s weights, received %s." % (values.shape[0], weights.shape[0]))
+            weights = weights[selection]
+
+        indices = numpy.floor((numpy.ma.getdata(values)[selection].astype("float64") - self._origin) / self._width)
+        if not len(indices):
+            return
+
+        first = indices.min()
+        last = indices.max()
+        if len(self._counts):
+            first = min(first, self._first)
+            last = max(last, self._first + len(self._counts) - 1)
+        first = int(first)
+        last = int(last)
+        _require_bin_count(last - first + 1)
+        indices = indices.astype("int64")
+        if first != self._first or last - first + 1 != len(self._counts):
+            counts = numpy.zeros(last - first + 1, dtype="float64")
+            counts[self._first - first:self._first - first + len(self._counts)] = self._counts
+            self._counts = counts
+            self._first = first
+
+        self._counts += numpy.bincount(indices - self._first, weights=weights, minlength=len(self._counts))
+
+    @property
+    def edges(self):
+        """Current bin edges.
+
+        Returns
+        -------
+        edges: :class:`numpy.ndarray` containing :math:`M+1` bin edges.
+        """
+        return self._origin + (self._first + numpy.arange(len(self._counts) + 1)) * self._width
+
+    @property
+    def counts(self):
+        """Current (optionally weighted) bin counts.
+
+        Returns
+        -------
+        counts: :class:`numpy.ndarray` containing :math:`M` counts.
+        """
+        return self._counts.copy()
+
+    def table(self):
+        """Return the current state of the histogram as a table.
+
+        Returns
+        -------
+        table: :class:`toyplot.data.Table` containing one row per bin, with
+        "left", "right", "center", and "count" columns.
+        """
+        edges = self.edges
+        result = toyplot.data.Table()
+        result["left"] = edges[:-1]
+        result["right"] = edges[1:]
+        result["center"] = (edges[:-1] + edges[1:]) * 0.5
+        result["count"] = self.counts
+        return result
@@ -31,14 +31,18 @@ def to_png(data, stream, bitdepth=None):
         (greyscale plus alpha channel), :math:`M \times N \times 3`
         (RGB data), or :math:`M \times N \times 4` (RGB + alpha).  Floating
         point values are scaled and converted to unsigned 8 bit integers.
+        :math:`M \times N` arrays of Toyplot colors, including packed colors
+        with dtype = :data:`toyplot.color.packed_dtype`, are also accepted.
     stream: file-like object, required
         Target file to receive PNG data.
     bitdepth: integer, optional
         Override the default output bit depth.  Allowed color / bitdepth combinations
         are: greyscale (1/2/4/8/16), greyscale + alpha (8/16), RGB (8/16), and RGB + alpha (8/16).
     """
-    if data.dtype == toyplot.color.dtype:
+    if data.dtype in (toyplot.color.dtype, toyplot.color.packed_dtype):
         data = numpy.dstack((data["r"], data["g"], data["b"], data["a"]))
+    if data.dtype == "uint8" and bitdepth == 16:
+        data = data.astype("uint16") * 257
 
     if issubclass(data.dtype.type, numpy.bool_):
         if bitdepth is None:
@@ -28,13 +28,7 @@ def scalar(value, shape):
     -------
     array: :class:`numpy.ndarray`
     """
-    array = numpy.array(value).astype("float64")
-    # As a special-case, allow a vector with shape M to be matched-up with an
-    # M x 1 matrix.
-    if array.ndim == 1 and isinstance(shape, tuple) and len(
-            shape) == 2 and array.shape[0] == shape[0] and shape[1] == 1:
-        return numpy.reshape(array, shape)
-    return numpy.broadcast_arrays(array, numpy.empty(shape))[0]
+    return numpy.array(_view(numpy.array(value).astype("float64"), shape))
 
 
 #def string(value, shape):
@@ -61,12 +55,45 @@ def pyobject(value, shape):
     -------
     array: :class:`numpy.ndarray`
     """
-    array = numpy.array(value)
+    return numpy.array(_view(numpy.array(value).astype("object"), shape))
+
+
+def _view(array, shape):
+    """Return a read-only view of an array broadcast to the given shape, without copying."""
     # As a special-case, allow a vector with shape M to be matched-up with an
     # M x 1 matrix.
     if array.ndim == 1 and isinstance(shape, tuple) and len(
             shape) == 2 and array.shape[0] == shape[0] and shape[1] == 1:
         return numpy.reshape(array, shape)
-    result = numpy.empty(shape, dtype="object")
-    result.flat = [u for u, _ in numpy.broadcast(array, result)]
-    return result
+    return numpy.broadcast_to(array, shape)
+
+
+def is_constant(array):
+    """Return True if a 1D array contains a single repeated value.
+
+    Broadcast views are detected without examining every value; other arrays
+    are compared against their first value.  Renderers use this to compute
+    the style for a series once, instead of once per datum.
+
+    Parameters
+    ----------
+    array: :class:`numpy.ndarray` or :class:`numpy.ma.MaskedArray`
+
+    Returns
+    -------
+    constant: bool
+    """
+    mask = numpy.ma.getmask(array)
+    if mask is not numpy.ma.nomask:
+        fields = [mask[name] for name in mask.dtype.names] if mask.dtype.names else [mask]
+        if any(field.any() for field in fields):
+            return False
+    array = numpy.ma.getdata(array)
+    if array.ndim != 1:
+        return False
+    if array.shape[0] < 2 or array.strides[0] == 0:
+        return True
+    try:
+        return bool(numpy.all(array == array[0]))
+    except (AttributeError, TypeError, ValueError):
+        return False
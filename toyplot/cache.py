@@ -0,0 +1,151 @@
+# Copyright 2014, Sandia Corporation. Under the terms of Contract
+# DE-AC04-94AL85000 with Sandia Corporation, the U.S. Government retains certain
+# rights in this software.
+
+"""Bounded caches used by Toyplot to avoid redundant computation."""
+
+from __future__ import division
+
+import collections
+import os
+import tempfile
+import threading
+
+from six.moves import cPickle as pickle
+
+
+class LRU(object):
+    """Thread-safe, bounded, least-recently-used cache.
+
+    Parameters
+    ----------
+    maxsize: integer
+        Maximum number of entries to store.  When the cache is full, the least
+        recently used entry is discarded to make room for a new one.
+    directory: string, optional
+        If specified, every computed value is also pickled to a file in this
+        directory, and values that aren't in memory are loaded from it, so
+        they persist across processes.  Keys must be strings that are valid
+        filenames.  Files are never evicted.
+
+    Examples
+    --------
+    >>> cache = toyplot.cache.LRU(maxsize=1024)
+    >>> value = cache.lookup(key, compute)
+    """
+    def __init__(self, maxsize, directory=None):
+        if maxsize < 1:
+            raise ValueError("Cache size must be positive.")
+        if directory is not None and not os.path.isdir(directory):
+            os.makedirs(directory)
+        self._maxsize = maxsize
+        self._directory = directory
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def maxsize(self):
+        """Maximum number of entries stored in the cache."""
+        return self._maxsize
+
+    @property
+    def directory(self):
+        """Directory used to persist cached values, or None."""
+        return self._directory
+
+    @property
+    def hits(self):
+        """Number of lookups that were satisfied by the cache."""
+        return self._hits
+
+    @property
+    def misses(self):
+        """Number of lookups that required a new value to be computed."""
+        return self._misses
+
+    @property
+    def hit_rate(self):
+        """Fraction of lookups that were satisfied by the cache, or None if there haven't been any lookups."""
+        total = self._hits + self._misses
+        return self._hits / total if total else None
+
+    def clear(self):
+        """Discard every entry and reset the hit and miss counts."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def lookup(self, key, compute):
+        """Return the cached value for a key, computing and storing it if necessary.
+
+        Parameters
+        ----------
+        key: hashable object
+            Key identifying the value.
+        compute: callable
+            Called with `key` as its only argument to compute a missing value.
+            It is called without holding the cache lock, so concurrent
+            lookups for the same missing key may compute it more than once.
+            Values loaded from the cache directory count as hits.
+
+        Returns
+        -------
+        value: the cached or newly-computed value.
+        """
+        with self._lock:
+            if key in self._entries:
+                value = self._entries.pop(key)
+                self._entries[key] = value
+                self._hits += 1
+                return value
+
+        value = self._load(key)
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+
+        if value is None:
+            value = compute(key)
+            self._store(key, value)
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = value
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def _path(self, key):
+        return os.path.join(self._directory, "%s.pickle" % key)
+
+    def _load(self, key):
+        """Return a value from the cache directory, or None if it isn't available."""
+        if self._directory is None:
+            return None
+        try:
+            with open(self._path(key), "rb") as stream:
+                return pickle.load(stream)
+        except Exception: # Missing or unreadable files are recomputed.
+            return None
+
+    def _store(self, key, value):
+        """Write a value to the cache directory, atomically replacing any existing file."""
+        if self._directory is None:
+            return
+        descriptor, temporary = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as stream:
+            pickle.dump(value, stream, protocol=pickle.HIGHEST_PROTOCOL)
+        if os.path.exists(self._path(key)) and os.name == "nt": # pragma: no cover
+            os.remove(self._path(key))
+        os.rename(temporary, self._path(key))
@@ -1182,7 +1182,7 @@ class Canvas(object):
             data = numpy.atleast_3d(data)
             if data.shape[2] != 1:
                 raise ValueError("Expected an image with one channel.") # pragma: no cover
-            data = colormap.colors(data)
+            data = colormap.rgba8(data[:, :, 0])
 
         xmin_range, xmax_range, ymin_range, ymax_range = toyplot.layout.region(
             0, self._width, 0, self._height,
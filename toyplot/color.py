@@ -8,6 +8,8 @@ from __future__ import division
 
 import collections
 import colorsys
+import json
+import os
 import re
 import xml.etree.ElementTree as xml
 
@@ -15,6 +17,8 @@ import custom_inherit
 import numpy
 import six
 
+import toyplot.broadcast
+import toyplot.cache
 import toyplot.projection
 
 
@@ -28,6 +32,13 @@ dtype = {"names": ["r", "g", "b", "a"], "formats": ["float64", "float64", "float
 """Data type for storing RGBA color information in :class:`numpy.ndarray` instances.
 """
 
+packed_dtype = {"names": ["r", "g", "b", "a"], "formats": ["uint8", "uint8", "uint8", "uint8"]}
+"""Data type for storing compact RGBA color information in :class:`numpy.ndarray` instances, using 4 bytes per color.
+
+Use :func:`toyplot.color.pack` and :func:`toyplot.color.unpack` to convert
+between packed colors and colors with dtype = :data:`toyplot.color.dtype`.
+"""
+
 
 def _html_color_swatches(colors, css_class, margin=0):
     root_xml = xml.Element(
@@ -60,18 +71,23 @@ except:
 
 
 def lab(l, a, b):
-    """Construct a Toyplot color from CIE Lab values."""
+    """Construct a Toyplot color from CIE Lab values.
+
+    The inputs may be scalars or arrays, which are broadcast against each
+    other to produce an array of colors.
+    """
     y = (l + 16.0) / 116.0
     x = a / 500.0 + y
     z = y - b / 200.0
 
     x3 = x * x * x
     z3 = z * z * z
-    return xyz(
-        lab.white[0] * (x3 if x3 > lab.epsilon else (x - 16.0 / 116.0) / 7.787),
-        lab.white[1] * (numpy.power(((l + 16.0) / 116.0), 3) if l > (lab.kappa * lab.epsilon) else l / lab.kappa),
-        lab.white[2] * (z3 if z3 > lab.epsilon else (z - 16.0 / 116.0) / 7.787),
-        )
+    with numpy.errstate(invalid="ignore"):
+        return xyz(
+            lab.white[0] * numpy.where(x3 > lab.epsilon, x3, (x - 16.0 / 116.0) / 7.787),
+            lab.white[1] * numpy.where(l > (lab.kappa * lab.epsilon), numpy.power(((l + 16.0) / 116.0), 3), l / lab.kappa),
+            lab.white[2] * numpy.where(z3 > lab.epsilon, z3, (z - 16.0 / 116.0) / 7.787),
+            )
 lab.epsilon = 216.0 / 24389.0
 lab.kappa = 24389.0 / 27.0
 lab.white = numpy.array([95.047, 100.0, 108.883])
@@ -80,25 +96,43 @@ lab.white = numpy.array([95.047, 100.0, 108.883])
 def rgb(r, g, b):
     """Construct a Toyplot color from RGB values.
 
+    The inputs may be scalars or arrays, which are broadcast against each
+    other to produce an array of colors.
+
     Returns
     -------
     color: :class:`numpy.ndarray` scalar containing RGBA values with dtype = :data:`toyplot.color.dtype`.
     """
-    return numpy.array((r, g, b, 1.0), dtype=dtype)
+    return rgba(r, g, b, 1.0)
 
 
 def rgba(r, g, b, a):
     """Construct a Toyplot color from RGBA values.
 
+    The inputs may be scalars or arrays, which are broadcast against each
+    other to produce an array of colors.
+
     Returns
     -------
     color: :class:`numpy.ndarray` scalar containing RGBA values with dtype = :data:`toyplot.color.dtype`.
     """
-    return numpy.array((r, g, b, a), dtype=dtype)
+    if numpy.ndim(r) == 0 and numpy.ndim(g) == 0 and numpy.ndim(b) == 0 and numpy.ndim(a) == 0:
+        return numpy.array((r, g, b, a), dtype=dtype)
+    r, g, b, a = numpy.broadcast_arrays(r, g, b, a)
+    result = numpy.empty(r.shape, dtype=dtype)
+    result["r"] = r
+    result["g"] = g
+    result["b"] = b
+    result["a"] = a
+    return result
 
 
 def xyz(x, y, z):
-    """Construct a Toyplot color from CIE XYZ values, using observer = 2 deg and illuminant = D65."""
+    """Construct a Toyplot color from CIE XYZ values, using observer = 2 deg and illuminant = D65.
+
+    The inputs may be scalars or arrays, which are broadcast against each
+    other to produce an array of colors.
+    """
     x = x / 100.0
     y = y / 100.0
     z = z / 100.0
@@ -107,20 +141,26 @@ def xyz(x, y, z):
     g = x * -0.9689 + y * 1.8758 + z * 0.0415
     b = x * 0.0557 + y * -0.2040 + z * 1.0570
 
-    r = 1.055 * numpy.power(r, 1 / 2.4) - 0.055 if r > 0.0031308 else 12.92 * r
-    g = 1.055 * numpy.power(g, 1 / 2.4) - 0.055 if g > 0.0031308 else 12.92 * g
-    b = 1.055 * numpy.power(b, 1 / 2.4) - 0.055 if b > 0.0031308 else 12.92 * b
+    with numpy.errstate(invalid="ignore"):
+        r = numpy.where(r > 0.0031308, 1.055 * numpy.power(r, 1 / 2.4) - 0.055, 12.92 * r)
+        g = numpy.where(g > 0.0031308, 1.055 * numpy.power(g, 1 / 2.4) - 0.055, 12.92 * g)
+        b = numpy.where(b > 0.0031308, 1.055 * numpy.power(b, 1 / 2.4) - 0.055, 12.92 * b)
 
-    return rgb(*numpy.clip((r, g, b), 0, 1))
+    return rgb(numpy.clip(r, 0, 1), numpy.clip(g, 0, 1), numpy.clip(b, 0, 1))
 
 
 def to_lab(color):
-    """Convert a Toyplot color to a CIE Lab color."""
+    """Convert a Toyplot color to a CIE Lab color.
+
+    If `color` is an array of colors, the result has shape (3,) + `color.shape`,
+    i.e. `L, a, b = toyplot.color.to_lab(colors)` produces one array per channel.
+    """
 
     color = to_xyz(color)
 
     def pivot(n):
-        return numpy.power(n, 1.0 / 3.0) if n > pivot.epsilon else (pivot.kappa * n + 16) / 116
+        with numpy.errstate(invalid="ignore"):
+            return numpy.where(n > pivot.epsilon, numpy.power(n, 1.0 / 3.0), (pivot.kappa * n + 16) / 116)
     pivot.epsilon = 216.0 / 24389.0
     pivot.kappa = 24389.0 / 27.0
 
@@ -128,14 +168,18 @@ def to_lab(color):
     y = pivot(color[1] / to_lab.white[1])
     z = pivot(color[2] / to_lab.white[2])
 
-    return numpy.array([max(0, 116 * y - 16), 500 * (x - y), 200 * (y - z)])
+    return numpy.array([numpy.maximum(0, 116 * y - 16), 500 * (x - y), 200 * (y - z)])
 to_lab.white = numpy.array([95.047, 100.0, 108.883])
 
 
 def to_xyz(color):
-    """Convert a Toyplot color to a CIE XYZ color using observer = 2 deg and illuminant = D65."""
+    """Convert a Toyplot color to a CIE XYZ color using observer = 2 deg and illuminant = D65.
+
+    If `color` is an array of colors, the result has shape (3,) + `color.shape`.
+    """
     def pivot(n):
-        return (numpy.power((n + 0.055) / 1.055, 2.4) if n > 0.04045 else n / 12.92) * 100.0
+        with numpy.errstate(invalid="ignore"):
+            return numpy.where(n > 0.04045, numpy.power((n + 0.055) / 1.055, 2.4), n / 12.92) * 100.0
 
     r = pivot(color["r"])
     g = pivot(color["g"])
@@ -148,11 +192,26 @@ def to_xyz(color):
         ])
 
 
+def _load_palettes(filename, counts=False):
+    """Load palette data from a JSON file in the Toyplot package, caching it for subsequent calls."""
+    if filename not in _load_palettes.cache:
+        with open(os.path.join(os.path.dirname(__file__), filename), "r") as stream:
+            data = json.load(stream, object_pairs_hook=collections.OrderedDict)
+        if counts:
+            data = dict([(name, dict([(int(key) if key.isdigit() else key, value) for key, value in entry.items()])) for name, entry in data.items()])
+        _load_palettes.cache[filename] = data
+    return _load_palettes.cache[filename]
+
+_load_palettes.cache = {}
+
+
 def _require_color(color):
     if isinstance(color, six.string_types):
         return css(color)
     elif isinstance(color, (numpy.void, numpy.ndarray)) and color.dtype == dtype:
         return color
+    elif isinstance(color, (numpy.void, numpy.ndarray)) and color.dtype == packed_dtype:
+        return unpack(color)
     elif isinstance(color, (tuple, list, numpy.ndarray)) and len(color) == 3:
         return rgb(color[0], color[1], color[2])
     elif isinstance(color, (tuple, list, numpy.ndarray)) and len(color) == 4:
@@ -174,7 +233,8 @@ def broadcast(colors, shape, default=None):
 
     Returns
     -------
-    colors: One- or two-dimensional :class:`numpy.ndarray` containing RGBA values with dtype = :data:`toyplot.color.dtype`.
+    colors: One- or two-dimensional :class:`numpy.ndarray` containing RGBA values with dtype = :data:`toyplot.color.dtype`,
+        or dtype = :data:`toyplot.color.packed_dtype` if the supplied colors were packed.
     """
     if colors is None and default is None:
         raise ValueError("Must supply colors or default.") # pragma: no cover
@@ -206,14 +266,14 @@ def broadcast(colors, shape, default=None):
         colors = numpy.array(colors)
 
     if isinstance(colors, numpy.ndarray):
-        if colors.dtype == dtype: # Already an array of colors
+        if colors.dtype == dtype or colors.dtype == packed_dtype: # Already an array of colors
             pass
         elif issubclass(colors.dtype.type, numpy.number): # Array of numeric values, so map values to colors
             if colormap is None:
                 colormap = brewer.map("BlueRed", domain_min=colors.min(), domain_max=colors.max())
             colors = colormap.colors(colors)
         elif issubclass(colors.dtype.type, numpy.character): # Convert CSS strings to colors.
-            colors = numpy.array([_require_color(color) for color in colors.flat], dtype=dtype).reshape(colors.shape)
+            colors = css_array(colors)
     else: # A single value, so convert to a color
         colors = _require_color(colors)
 
@@ -221,12 +281,7 @@ def broadcast(colors, shape, default=None):
     if colors.ndim > len(shape):
         raise ValueError("Per-datum colors aren't allowed here - expecting per-series colors.") # pragma: no cover
 
-    # As a special-case, allow a vector with shape M to be matched-up with an
-    # M x 1 matrix.
-    if colors.ndim == 1 and per_datum and colors.shape[0] == shape[0] and shape[1] == 1:
-        return numpy.reshape(colors, shape)
-
-    return numpy.array(numpy.broadcast_arrays(colors, numpy.empty(shape))[0])
+    return numpy.array(toyplot.broadcast._view(colors, shape))
 
 
 class Palette(object):
@@ -252,9 +307,14 @@ class Palette(object):
     """
     def __init__(self, colors=None, reverse=False):
         if colors is None:
-            colors = numpy.array(brewer._data["Set2"][8]) / 255.0
+            colors = brewer._colors("Set2", 8)
 
-        self._colors = numpy.array([_require_color(color) for color in colors], dtype=dtype)
+        if isinstance(colors, numpy.ndarray) and colors.dtype == dtype and colors.ndim == 1:
+            self._colors = numpy.array(colors)
+        elif isinstance(colors, numpy.ndarray) and issubclass(colors.dtype.type, numpy.number) and colors.ndim == 2 and colors.shape[1] in (3, 4):
+            self._colors = rgba(colors[:, 0], colors[:, 1], colors[:, 2], colors[:, 3] if colors.shape[1] == 4 else 1.0)
+        else:
+            self._colors = numpy.array([_require_color(color) for color in colors], dtype=dtype)
 
         if reverse:
             self._colors = self._colors[::-1]
@@ -316,15 +376,79 @@ def _mix(a, b, amount):
     return (a * (1 - amount)) + (b * (amount))
 
 
+def _to_rgba8(colors):
+    """Convert an array of Toyplot colors to 8-bit RGBA channels, the same way :func:`toyplot.bitmap.to_png` does."""
+    # NaN colors become transparent black, matching the lookup table's NaN entry.
+    return (numpy.nan_to_num(numpy.stack((colors["r"], colors["g"], colors["b"], colors["a"]), axis=-1)) * 255.0).astype("uint8")
+
+
+def _lookup_table(key, size, interpolate):
+    """Return a cached :class:`_LookupTable`, so maps with identical colors share one table."""
+    return _lookup_table.cache.lookup(key + (size,), lambda key: _LookupTable(size, interpolate))
+
+_lookup_table.cache = toyplot.cache.LRU(maxsize=64)
+
+
+class _LookupTable(object):
+    """Precomputed colors for evenly-spaced positions in the range [0, 1].
+
+    Positions are quantized to the nearest table entry, so that mapping values
+    to colors only requires an index computation and a gather.  NaN positions
+    map to an extra entry containing NaN (or transparent black, for 8-bit
+    output).
+    """
+    def __init__(self, size, interpolate):
+        if size < 2:
+            raise ValueError("Lookup table size must be at least 2.")
+        self._size = size
+        self._colors = numpy.empty(size + 1, dtype=dtype)
+        self._colors[:-1] = interpolate(numpy.linspace(0, 1, size, endpoint=True))
+        self._colors[-1] = (numpy.nan, numpy.nan, numpy.nan, numpy.nan)
+        self._rgba8 = numpy.zeros((size + 1, 4), dtype="uint8")
+        self._rgba8[:-1] = _to_rgba8(self._colors[:-1])
+
+    def indices(self, positions):
+        indices = numpy.clip(positions, 0, 1)
+        indices *= self._size - 1
+        numpy.rint(indices, out=indices)
+        indices[numpy.isnan(indices)] = self._size
+        return indices.astype("intp")
+
+    def colors(self, positions):
+        return self._colors.take(self.indices(positions))
+
+    def rgba8(self, positions):
+        # Gather whole pixels at once by viewing each RGBA quadruple as a single 32-bit value.
+        return self._rgba8.view("uint32").take(self.indices(positions)).view("uint8").reshape((-1, 4))
+
+
+def _hls_to_rgb(h, l, s):
+    """Vectorized equivalent of :func:`colorsys.hls_to_rgb`."""
+    h, l, s = numpy.broadcast_arrays(*[numpy.asarray(value, dtype="float64") for value in (h, l, s)])
+    m2 = numpy.where(l <= 0.5, l * (1.0 + s), l + s - (l * s))
+    m1 = 2.0 * l - m2
+
+    def value(hue):
+        hue = hue % 1.0
+        return numpy.select(
+            [hue < 1.0 / 6.0, hue < 0.5, hue < 2.0 / 3.0],
+            [m1 + (m2 - m1) * hue * 6.0, m2, m1 + (m2 - m1) * ((2.0 / 3.0) - hue) * 6.0],
+            m1)
+
+    grey = s == 0.0
+    return (
+        numpy.where(grey, l, value(h + (1.0 / 3.0))),
+        numpy.where(grey, l, value(h)),
+        numpy.where(grey, l, value(h - (1.0 / 3.0))),
+        )
+
+
 def spread(color, count=5, lightness=0.9, reverse=False):
     """Create a palette by progressively altering an initial color."""
     color = _require_color(color)
     h, l, s = colorsys.rgb_to_hls(color["r"], color["g"], color["b"])
-    results = []
-    for i in range(count):
-        r, g, b = colorsys.hls_to_rgb(h, _mix(l, lightness, i / (count-1)), s)
-        results.append(rgba(r, g, b, color["a"]))
-    return Palette(numpy.array(results), reverse=reverse)
+    r, g, b = _hls_to_rgb(h, _mix(l, lightness, numpy.arange(count) / (count-1)), s)
+    return Palette(rgba(r, g, b, color["a"]), reverse=reverse)
 
 
 @six.add_metaclass(custom_inherit.DocInheritMeta(style="numpy_napoleon"))
@@ -371,6 +495,35 @@ class Map(object):
         """
         return self._domain
 
+    def colors(self, values, domain_min=None, domain_max=None):
+        """Convert an array-like collection of values to colors.
+
+        Parameters
+        ----------
+        values: array-like collection of scalar values
+
+        Returns
+        -------
+        colors: :class:`numpy.ndarray` containing RGBA values with dtype = :data:`toyplot.color.dtype` and the same shape as `values`.
+        """
+        raise NotImplementedError() # pragma: no cover
+
+    def rgba8(self, values, domain_min=None, domain_max=None):
+        """Convert an array-like collection of values to 8-bit RGBA colors.
+
+        The result can be passed directly to :func:`toyplot.bitmap.to_png`
+        and image marks, without floating-point conversion.
+
+        Parameters
+        ----------
+        values: array-like collection of scalar values
+
+        Returns
+        -------
+        colors: :class:`numpy.ndarray` of uint8 values with shape = `values.shape` + (4,).
+        """
+        return _to_rgba8(self.colors(values, domain_min, domain_max))
+
 
 class CategoricalMap(Map):
     """Maps 1D categorical values (nonnegative integers) to colors.
@@ -471,11 +624,17 @@ class DivergingMap(Map):
 
     domain_max: scalar, optional
 
+    lut: integer, optional
+      If specified, precompute a lookup table with this many entries (such
+      as 256 or 4096), and quantize values to the nearest entry instead of
+      interpolating colors for every value.  This is much faster when mapping
+      large arrays.
+
     Notes
     -----
     Diverging maps generate a color preview when viewed in a Jupyter notebook.
     """
-    def __init__(self, low=None, high=None, domain_min=None, domain_max=None):
+    def __init__(self, low=None, high=None, domain_min=None, domain_max=None, lut=None):
         super(DivergingMap, self).__init__(domain_min=domain_min, domain_max=domain_max)
 
         def _lab_to_msh(L, a, b):
@@ -503,6 +662,32 @@ class DivergingMap(Map):
         self._high = _lab_to_msh(*to_lab(high)) # pylint: disable=no-value-for-parameter
         self._mid_low = middle(self._low)
         self._mid_high = middle(self._high)
+        self._lut = None if lut is None else _lookup_table(("diverging", self._low, self._high), lut, self._interpolate)
+
+    def _positions(self, values, domain_min, domain_max):
+        domain_min = domain_min if domain_min is not None else self.domain.min if self.domain.min is not None else numpy.nanmin(values)
+        domain_max = domain_max if domain_max is not None else self.domain.max if self.domain.max is not None else numpy.nanmax(values)
+
+        flat = numpy.clip(numpy.ravel(values), domain_min, domain_max)
+        return (flat - domain_min) / (domain_max - domain_min) if (domain_max - \
+                domain_min) > 0 else numpy.zeros(flat.shape)
+
+    def _interpolate(self, flat):
+        def _msh_to_lab(M, s, h):
+            L = M * numpy.cos(s)
+            a = M * numpy.sin(s) * numpy.cos(h)
+            b = M * numpy.sin(s) * numpy.sin(h)
+            return L, a, b
+
+        with numpy.errstate(invalid="ignore"):
+            lower = flat < 0.5
+        amount = numpy.where(lower, flat * 2.0, (flat - 0.5) * 2.0)
+        return lab(*_msh_to_lab(*[
+            _mix(
+                numpy.where(lower, self._low[i], self._mid_high[i]),
+                numpy.where(lower, self._mid_low[i], self._high[i]),
+                amount)
+            for i in range(3)]))
 
     def colors(self, values, domain_min=None, domain_max=None):
         """Convert an array-like collection of values to colors.
@@ -515,46 +700,31 @@ class DivergingMap(Map):
         -------
         colors: :class:`numpy.ndarray` containing RGBA values with dtype = :data:`toyplot.color.dtype` and the same shape as `values`.
         """
+        values = numpy.array(values)
+        flat = self._positions(values, domain_min, domain_max)
+        if self._lut is not None:
+            return self._lut.colors(flat).reshape(values.shape)
+        return self._interpolate(flat).reshape(values.shape)
 
-        def _msh_to_lab(M, s, h):
-            L = M * numpy.cos(s)
-            a = M * numpy.sin(s) * numpy.cos(h)
-            b = M * numpy.sin(s) * numpy.sin(h)
-            return L, a, b
+    def rgba8(self, values, domain_min=None, domain_max=None):
+        """Convert an array-like collection of values to 8-bit RGBA colors.
 
-        values = numpy.array(values)
-        domain_min = domain_min if domain_min is not None else self.domain.min if self.domain.min is not None else values.min()
-        domain_max = domain_max if domain_max is not None else self.domain.max if self.domain.max is not None else values.max()
+        The result can be passed directly to :func:`toyplot.bitmap.to_png`
+        and image marks, without floating-point conversion.
 
-        flat = numpy.clip(numpy.ravel(values), domain_min, domain_max)
-        flat = (flat - domain_min) / (domain_max - domain_min) if (domain_max - \
-                domain_min) > 0 else numpy.zeros(flat.shape)
-        result = numpy.zeros(flat.shape, dtype=dtype)
-        for index, amount in enumerate(flat):
-            if amount < 0.5:
-                a = self._low
-                b = self._mid_low
-                amount = amount * 2.0
-            else:
-                a = self._mid_high
-                b = self._high
-                amount = (amount - 0.5) * 2.0
-            result[index] = lab(
-                *
-                _msh_to_lab(
-                    _mix(
-                        a[0],
-                        b[0],
-                        amount),
-                    _mix(
-                        a[1],
-                        b[1],
-                        amount),
-                    _mix(
-                        a[2],
-                        b[2],
-                        amount)))
-        return result.reshape(values.shape)
+        Parameters
+        ----------
+        values: array-like collection of scalar values
+
+        Returns
+        -------
+        colors: :class:`numpy.ndarray` of uint8 values with shape = `values.shape` + (4,).
+        """
+        values = numpy.array(values)
+        flat = self._positions(values, domain_min, domain_max)
+        if self._lut is not None:
+            return self._lut.rgba8(flat).reshape(values.shape + (4,))
+        return _to_rgba8(self._interpolate(flat)).reshape(values.shape + (4,))
 
     def color(self, value, domain_min=None, domain_max=None):
         """Convert one value to a color.
@@ -628,6 +798,15 @@ class LinearMap(Map):
         as zero or a mean or median.
     domain_min: scalar, optional
     domain_max: scalar, optional
+    lut: integer, optional
+        If specified, precompute a lookup table with this many entries (such
+        as 256 or 4096), and quantize values to the nearest entry instead of
+        interpolating colors for every value.  This is much faster when mapping
+        large arrays.
+    interpolation: string, optional
+        Color space used to interpolate between palette colors, either "rgb"
+        (the default) or "lab" for perceptually uniform transitions in CIE Lab
+        space.
 
     Notes
     -----
@@ -635,7 +814,7 @@ class LinearMap(Map):
     a Jupyter notebook.
     """
 
-    def __init__(self, palette=None, stops=None, center=None, domain_min=None, domain_max=None):
+    def __init__(self, palette=None, stops=None, center=None, domain_min=None, domain_max=None, lut=None, interpolation="rgb"):
         super(LinearMap, self).__init__(domain_min=domain_min, domain_max=domain_max)
 
         if palette is None:
@@ -646,11 +825,51 @@ class LinearMap(Map):
 
         if stops.shape != palette._colors.shape:
             raise ValueError("Number of stops must match palette length.") # pragma: no cover
+        if interpolation not in ["rgb", "lab"]:
+            raise ValueError("Unknown interpolation: %s.  Use 'rgb' or 'lab'." % interpolation)
 
         self._palette = palette
         self._stops = stops
         self._center = center
+        self._lab = to_lab(palette._colors) if interpolation == "lab" else None
+        self._lut = None if lut is None else _lookup_table(("linear", palette._colors.tobytes(), stops.tobytes(), interpolation), lut, self._interpolate)
+
+
+    def _positions(self, values, domain_min, domain_max):
+        domain_min = domain_min if domain_min is not None else self.domain.min if self.domain.min is not None else numpy.nanmin(values)
+        domain_max = domain_max if domain_max is not None else self.domain.max if self.domain.max is not None else numpy.nanmax(values)
+
+        # Equivalent to a linear (or two-segment piecewise linear, if there's a
+        # center) projection onto [0, 1], without the masked array overhead.
+        flat = numpy.ravel(values).astype("float64")
+        if self._center is None:
+            return (flat - domain_min) / (domain_max - domain_min) if (domain_max - \
+                    domain_min) > 0 else numpy.zeros(flat.shape)
+
+        positions = 0.5 * ((flat - domain_min) / (self._center - domain_min)) if (self._center - \
+                domain_min) > 0 else numpy.zeros(flat.shape)
+        upper = flat >= self._center
+        amount = (flat[upper] - self._center) / (domain_max - self._center) if (domain_max - \
+                self._center) > 0 else numpy.zeros(numpy.count_nonzero(upper))
+        positions[upper] = ((1.0 - amount) * 0.5) + amount
+        return positions
+
+    def _interpolate(self, flat):
+        if self._lab is not None:
+            result = lab(
+                numpy.interp(flat, self._stops, self._lab[0]),
+                numpy.interp(flat, self._stops, self._lab[1]),
+                numpy.interp(flat, self._stops, self._lab[2]),
+                )
+            result["a"] = numpy.interp(flat, self._stops, self._palette._colors["a"])
+            return result
 
+        result = numpy.empty(flat.shape, dtype=dtype)
+        result["r"] = numpy.interp(flat, self._stops, self._palette._colors["r"])
+        result["g"] = numpy.interp(flat, self._stops, self._palette._colors["g"])
+        result["b"] = numpy.interp(flat, self._stops, self._palette._colors["b"])
+        result["a"] = numpy.interp(flat, self._stops, self._palette._colors["a"])
+        return result
 
     def colors(self, values, domain_min=None, domain_max=None):
         """Convert an array-like collection of values to colors.
@@ -664,25 +883,30 @@ class LinearMap(Map):
         colors: :class:`numpy.ndarray` containing RGBA values with dtype = :data:`toyplot.color.dtype` and the same shape as `values`.
         """
         values = numpy.array(values)
-        domain_min = domain_min if domain_min is not None else self.domain.min if self.domain.min is not None else values.min()
-        domain_max = domain_max if domain_max is not None else self.domain.max if self.domain.max is not None else values.max()
-
-        if self._center is not None:
-            segments = [
-                toyplot.projection.Piecewise.Segment("linear", -numpy.inf, domain_min, self._center, self._center, -numpy.inf, 0, 0.5, 0.5),
-                toyplot.projection.Piecewise.Segment("linear", self._center, self._center, domain_max, numpy.inf, 0.5, 0.5, 1.0, numpy.inf),
-            ]
-            projection = toyplot.projection.Piecewise(segments)
-        else:
-            projection = toyplot.projection.linear(domain_min, domain_max, 0.0, 1.0)
+        flat = self._positions(values, domain_min, domain_max)
+        if self._lut is not None:
+            return self._lut.colors(flat).reshape(values.shape)
+        return self._interpolate(flat).reshape(values.shape)
 
-        flat = projection(numpy.ravel(values))
-        result = numpy.empty(flat.shape, dtype=dtype)
-        result["r"] = numpy.interp(flat, self._stops, self._palette._colors["r"])
-        result["g"] = numpy.interp(flat, self._stops, self._palette._colors["g"])
-        result["b"] = numpy.interp(flat, self._stops, self._palette._colors["b"])
-        result["a"] = numpy.interp(flat, self._stops, self._palette._colors["a"])
-        return result.reshape(values.shape)
+    def rgba8(self, values, domain_min=None, domain_max=None):
+        """Convert an array-like collection of values to 8-bit RGBA colors.
+
+        The result can be passed directly to :func:`toyplot.bitmap.to_png`
+        and image marks, without floating-point conversion.
+
+        Parameters
+        ----------
+        values: array-like collection of scalar values
+
+        Returns
+        -------
+        colors: :class:`numpy.ndarray` of uint8 values with shape = `values.shape` + (4,).
+        """
+        values = numpy.array(values)
+        flat = self._positions(values, domain_min, domain_max)
+        if self._lut is not None:
+            return self._lut.rgba8(flat).reshape(values.shape + (4,))
+        return _to_rgba8(self._interpolate(flat)).reshape(values.shape + (4,))
 
     def color(self, value, domain_min=None, domain_max=None):
         """Convert one value to a color.
@@ -774,10 +998,19 @@ class BrewerFactory(object):
         """
         if count is None:
             count = max(self.counts(name))
-        data = numpy.array(self._data[name][count]) / 255.0
-        if self._data[name].get("reverse", False):
-            data = data[::-1]
-        return Palette(data, reverse=reverse)
+        return Palette(self._colors(name, count), reverse=reverse)
+
+    def _colors(self, name, count):
+        """Return a cached, read-only array containing the colors for a palette."""
+        key = (name, count)
+        if key not in self._cache:
+            data = numpy.array(self._data[name][count]) / 255.0
+            if self._data[name].get("reverse", False):
+                data = data[::-1]
+            colors = rgb(data[:, 0], data[:, 1], data[:, 2])
+            colors.flags.writeable = False
+            self._cache[key] = colors
+        return self._cache[key]
 
     def palettes(self, category=None):
         """Return a (name, palette) tuple for every Color Brewer 2.0 palette.
@@ -793,7 +1026,7 @@ class BrewerFactory(object):
         """
         return [(name, self.palette(name)) for name in self.names(category)]
 
-    def map(self, name, count=None, reverse=False, center=None, domain_min=None, domain_max=None):
+    def map(self, name, count=None, reverse=False, center=None, domain_min=None, domain_max=None, lut=None):
         """Return a color map that uses the given Color Brewer 2.0 palette.
 
         Returns
@@ -810,6 +1043,7 @@ class BrewerFactory(object):
             center=center,
             domain_min=domain_min,
             domain_max=domain_max,
+            lut=lut,
             )
 
     def maps(self, category=None):
@@ -830,1987 +1064,11 @@ class BrewerFactory(object):
 
     _type_map = {"div": "diverging", "qual": "qualitative", "seq": "sequential"}
 
-    _data = {
-        "Spectral": {
-            3: [
-                (252, 141, 89),
-                (255, 255, 191),
-                (153, 213, 148)],
-            4: [
-                (215, 25, 28),
-                (253, 174, 97),
-                (171, 221, 164),
-                (43, 131, 186)],
-            5: [
-                (215, 25, 28),
-                (253, 174, 97),
-                (255, 255, 191),
-                (171, 221, 164),
-                (43, 131, 186)],
-            6: [
-                (213, 62, 79),
-                (252, 141, 89),
-                (254, 224, 139),
-                (230, 245, 152),
-                (153, 213, 148),
-                (50, 136, 189)],
-            7: [
-                (213, 62, 79),
-                (252, 141, 89),
-                (254, 224, 139),
-                (255, 255, 191),
-                (230, 245, 152),
-                (153, 213, 148),
-                (50, 136, 189)],
-            8: [
-                (213, 62, 79),
-                (244, 109, 67),
-                (253, 174, 97),
-                (254, 224, 139),
-                (230, 245, 152),
-                (171, 221, 164),
-                (102, 194, 165),
-                (50, 136, 189)],
-            9: [
-                (213, 62, 79),
-                (244, 109, 67),
-                (253, 174, 97),
-                (254, 224, 139),
-                (255, 255, 191),
-                (230, 245, 152),
-                (171, 221, 164),
-                (102, 194, 165),
-                (50, 136, 189)],
-            10: [
-                (158, 1, 66),
-                (213, 62, 79),
-                (244, 109, 67),
-                (253, 174, 97),
-                (254, 224, 139),
-                (230, 245, 152),
-                (171, 221, 164),
-                (102, 194, 165),
-                (50, 136, 189),
-                (94, 79, 162)],
-            11: [
-                (158, 1, 66),
-                (213, 62, 79),
-                (244, 109, 67),
-                (253, 174, 97),
-                (254, 224, 139),
-                (255, 255, 191),
-                (230, 245, 152),
-                (171, 221, 164),
-                (102, 194, 165),
-                (50, 136, 189),
-                (94, 79, 162)], "type": "div", "reverse": True},
-        "GreenYellowRed": {
-            3: [
-                (252, 141, 89),
-                (255, 255, 191),
-                (145, 207, 96)],
-            4: [
-                (215, 25, 28),
-                (253, 174, 97),
-                (166, 217, 106),
-                (26, 150, 65)],
-            5: [
-                (215, 25, 28),
-                (253, 174, 97),
-                (255, 255, 191),
-                (166, 217, 106),
-                (26, 150, 65)],
-            6: [
-                (215, 48, 39),
-                (252, 141, 89),
-                (254, 224, 139),
-                (217, 239, 139),
-                (145, 207, 96),
-                (26, 152, 80)],
-            7: [
-                (215, 48, 39),
-                (252, 141, 89),
-                (254, 224, 139),
-                (255, 255, 191),
-                (217, 239, 139),
-                (145, 207, 96),
-                (26, 152, 80)],
-            8: [
-                (215, 48, 39),
-                (244, 109, 67),
-                (253, 174, 97),
-                (254, 224, 139),
-                (217, 239, 139),
-                (166, 217, 106),
-                (102, 189, 99),
-                (26, 152, 80)],
-            9: [
-                (215, 48, 39),
-                (244, 109, 67),
-                (253, 174, 97),
-                (254, 224, 139),
-                (255, 255, 191),
-                (217, 239, 139),
-                (166, 217, 106),
-                (102, 189, 99),
-                (26, 152, 80)],
-            10: [
-                (165, 0, 38),
-                (215, 48, 39),
-                (244, 109, 67),
-                (253, 174, 97),
-                (254, 224, 139),
-                (217, 239, 139),
-                (166, 217, 106),
-                (102, 189, 99),
-                (26, 152, 80),
-                (0, 104, 55)],
-            11: [
-                (165, 0, 38),
-                (215, 48, 39),
-                (244, 109, 67),
-                (253, 174, 97),
-                (254, 224, 139),
-                (255, 255, 191),
-                (217, 239, 139),
-                (166, 217, 106),
-                (102, 189, 99),
-                (26, 152, 80),
-                (0, 104, 55)], "type": "div", "reverse": True},
-        "BlueRed": {
-            3: [
-                (239, 138, 98),
-                (247, 247, 247),
-                (103, 169, 207)],
-            4: [
-                (202, 0, 32),
-                (244, 165, 130),
-                (146, 197, 222),
-                (5, 113, 176)],
-            5: [
-                (202, 0, 32),
-                (244, 165, 130),
-                (247, 247, 247),
-                (146, 197, 222),
-                (5, 113, 176)],
-            6: [
-                (178, 24, 43),
-                (239, 138, 98),
-                (253, 219, 199),
-                (209, 229, 240),
-                (103, 169, 207),
-                (33, 102, 172)],
-            7: [
-                (178, 24, 43),
-                (239, 138, 98),
-                (253, 219, 199),
-                (247, 247, 247),
-                (209, 229, 240),
-                (103, 169, 207),
-                (33, 102, 172)],
-            8: [
-                (178, 24, 43),
-                (214, 96, 77),
-                (244, 165, 130),
-                (253, 219, 199),
-                (209, 229, 240),
-                (146, 197, 222),
-                (67, 147, 195),
-                (33, 102, 172)],
-            9: [
-                (178, 24, 43),
-                (214, 96, 77),
-                (244, 165, 130),
-                (253, 219, 199),
-                (247, 247, 247),
-                (209, 229, 240),
-                (146, 197, 222),
-                (67, 147, 195),
-                (33, 102, 172)],
-            10: [
-                (103, 0, 31),
-                (178, 24, 43),
-                (214, 96, 77),
-                (244, 165, 130),
-                (253, 219, 199),
-                (209, 229, 240),
-                (146, 197, 222),
-                (67, 147, 195),
-                (33, 102, 172),
-                (5, 48, 97)],
-            11: [
-                (103, 0, 31),
-                (178, 24, 43),
-                (214, 96, 77),
-                (244, 165, 130),
-                (253, 219, 199),
-                (247, 247, 247),
-                (209, 229, 240),
-                (146, 197, 222),
-                (67, 147, 195),
-                (33, 102, 172),
-                (5, 48, 97)], "type": "div", "reverse": True},
-        "PinkGreen": {
-            3: [
-                (233, 163, 201),
-                (247, 247, 247),
-                (161, 215, 106)],
-            4: [
-                (208, 28, 139),
-                (241, 182, 218),
-                (184, 225, 134),
-                (77, 172, 38)],
-            5: [
-                (208, 28, 139),
-                (241, 182, 218),
-                (247, 247, 247),
-                (184, 225, 134),
-                (77, 172, 38)],
-            6: [
-                (197, 27, 125),
-                (233, 163, 201),
-                (253, 224, 239),
-                (230, 245, 208),
-                (161, 215, 106),
-                (77, 146, 33)],
-            7: [
-                (197, 27, 125),
-                (233, 163, 201),
-                (253, 224, 239),
-                (247, 247, 247),
-                (230, 245, 208),
-                (161, 215, 106),
-                (77, 146, 33)],
-            8: [
-                (197, 27, 125),
-                (222, 119, 174),
-                (241, 182, 218),
-                (253, 224, 239),
-                (230, 245, 208),
-                (184, 225, 134),
-                (127, 188, 65),
-                (77, 146, 33)],
-            9: [
-                (197, 27, 125),
-                (222, 119, 174),
-                (241, 182, 218),
-                (253, 224, 239),
-                (247, 247, 247),
-                (230, 245, 208),
-                (184, 225, 134),
-                (127, 188, 65),
-                (77, 146, 33)],
-            10: [
-                (142, 1, 82),
-                (197, 27, 125),
-                (222, 119, 174),
-                (241, 182, 218),
-                (253, 224, 239),
-                (230, 245, 208),
-                (184, 225, 134),
-                (127, 188, 65),
-                (77, 146, 33),
-                (39, 100, 25)],
-            11: [
-                (142, 1, 82),
-                (197, 27, 125),
-                (222, 119, 174),
-                (241, 182, 218),
-                (253, 224, 239),
-                (247, 247, 247),
-                (230, 245, 208),
-                (184, 225, 134),
-                (127, 188, 65),
-                (77, 146, 33),
-                (39, 100, 25)], "type": "div"},
-        "PurpleGreen": {
-            3: [
-                (175, 141, 195),
-                (247, 247, 247),
-                (127, 191, 123)],
-            4: [
-                (123, 50, 148),
-                (194, 165, 207),
-                (166, 219, 160),
-                (0, 136, 55)],
-            5: [
-                (123, 50, 148),
-                (194, 165, 207),
-                (247, 247, 247),
-                (166, 219, 160),
-                (0, 136, 55)],
-            6: [
-                (118, 42, 131),
-                (175, 141, 195),
-                (231, 212, 232),
-                (217, 240, 211),
-                (127, 191, 123),
-                (27, 120, 55)],
-            7: [
-                (118, 42, 131),
-                (175, 141, 195),
-                (231, 212, 232),
-                (247, 247, 247),
-                (217, 240, 211),
-                (127, 191, 123),
-                (27, 120, 55)],
-            8: [
-                (118, 42, 131),
-                (153, 112, 171),
-                (194, 165, 207),
-                (231, 212, 232),
-                (217, 240, 211),
-                (166, 219, 160),
-                (90, 174, 97),
-                (27, 120, 55)],
-            9: [
-                (118, 42, 131),
-                (153, 112, 171),
-                (194, 165, 207),
-                (231, 212, 232),
-                (247, 247, 247),
-                (217, 240, 211),
-                (166, 219, 160),
-                (90, 174, 97),
-                (27, 120, 55)],
-            10: [
-                (64, 0, 75),
-                (118, 42, 131),
-                (153, 112, 171),
-                (194, 165, 207),
-                (231, 212, 232),
-                (217, 240, 211),
-                (166, 219, 160),
-                (90, 174, 97),
-                (27, 120, 55),
-                (0, 68, 27)],
-            11: [
-                (64, 0, 75),
-                (118, 42, 131),
-                (153, 112, 171),
-                (194, 165, 207),
-                (231, 212, 232),
-                (247, 247, 247),
-                (217, 240, 211),
-                (166, 219, 160),
-                (90, 174, 97),
-                (27, 120, 55),
-                (0, 68, 27)], "type": "div"},
-        "BlueYellowRed": {
-            3: [
-                (252, 141, 89),
-                (255, 255, 191),
-                (145, 191, 219)],
-            4: [
-                (215, 25, 28),
-                (253, 174, 97),
-                (171, 217, 233),
-                (44, 123, 182)],
-            5: [
-                (215, 25, 28),
-                (253, 174, 97),
-                (255, 255, 191),
-                (171, 217, 233),
-                (44, 123, 182)],
-            6: [
-                (215, 48, 39),
-                (252, 141, 89),
-                (254, 224, 144),
-                (224, 243, 248),
-                (145, 191, 219),
-                (69, 117, 180)],
-            7: [
-                (215, 48, 39),
-                (252, 141, 89),
-                (254, 224, 144),
-                (255, 255, 191),
-                (224, 243, 248),
-                (145, 191, 219),
-                (69, 117, 180)],
-            8: [
-                (215, 48, 39),
-                (244, 109, 67),
-                (253, 174, 97),
-                (254, 224, 144),
-                (224, 243, 248),
-                (171, 217, 233),
-                (116, 173, 209),
-                (69, 117, 180)],
-            9: [
-                (215, 48, 39),
-                (244, 109, 67),
-                (253, 174, 97),
-                (254, 224, 144),
-                (255, 255, 191),
-                (224, 243, 248),
-                (171, 217, 233),
-                (116, 173, 209),
-                (69, 117, 180)],
-            10: [
-                (165, 0, 38),
-                (215, 48, 39),
-                (244, 109, 67),
-                (253, 174, 97),
-                (254, 224, 144),
-                (224, 243, 248),
-                (171, 217, 233),
-                (116, 173, 209),
-                (69, 117, 180),
-                (49, 54, 149)],
-            11: [
-                (165, 0, 38),
-                (215, 48, 39),
-                (244, 109, 67),
-                (253, 174, 97),
-                (254, 224, 144),
-                (255, 255, 191),
-                (224, 243, 248),
-                (171, 217, 233),
-                (116, 173, 209),
-                (69, 117, 180),
-                (49, 54, 149)], "type": "div", "reverse": True},
-        "BlueGreenBrown": {
-            3: [
-                (216, 179, 101),
-                (245, 245, 245),
-                (90, 180, 172)],
-            4: [
-                (166, 97, 26),
-                (223, 194, 125),
-                (128, 205, 193),
-                (1, 133, 113)],
-            5: [
-                (166, 97, 26),
-                (223, 194, 125),
-                (245, 245, 245),
-                (128, 205, 193),
-                (1, 133, 113)],
-            6: [
-                (140, 81, 10),
-                (216, 179, 101),
-                (246, 232, 195),
-                (199, 234, 229),
-                (90, 180, 172),
-                (1, 102, 94)],
-            7: [
-                (140, 81, 10),
-                (216, 179, 101),
-                (246, 232, 195),
-                (245, 245, 245),
-                (199, 234, 229),
-                (90, 180, 172),
-                (1, 102, 94)],
-            8: [
-                (140, 81, 10),
-                (191, 129, 45),
-                (223, 194, 125),
-                (246, 232, 195),
-                (199, 234, 229),
-                (128, 205, 193),
-                (53, 151, 143),
-                (1, 102, 94)],
-            9: [
-                (140, 81, 10),
-                (191, 129, 45),
-                (223, 194, 125),
-                (246, 232, 195),
-                (245, 245, 245),
-                (199, 234, 229),
-                (128, 205, 193),
-                (53, 151, 143),
-                (1, 102, 94)],
-            10: [
-                (84, 48, 5),
-                (140, 81, 10),
-                (191, 129, 45),
-                (223, 194, 125),
-                (246, 232, 195),
-                (199, 234, 229),
-                (128, 205, 193),
-                (53, 151, 143),
-                (1, 102, 94),
-                (0, 60, 48)],
-            11: [
-                (84, 48, 5),
-                (140, 81, 10),
-                (191, 129, 45),
-                (223, 194, 125),
-                (246, 232, 195),
-                (245, 245, 245),
-                (199, 234, 229),
-                (128, 205, 193),
-                (53, 151, 143),
-                (1, 102, 94),
-                (0, 60, 48)], "type": "div", "reverse": True},
-        "GrayRed": {
-            3: [
-                (239, 138, 98),
-                (255, 255, 255),
-                (153, 153, 153)],
-            4: [
-                (202, 0, 32),
-                (244, 165, 130),
-                (186, 186, 186),
-                (64, 64, 64)],
-            5: [
-                (202, 0, 32),
-                (244, 165, 130),
-                (255, 255, 255),
-                (186, 186, 186),
-                (64, 64, 64)],
-            6: [
-                (178, 24, 43),
-                (239, 138, 98),
-                (253, 219, 199),
-                (224, 224, 224),
-                (153, 153, 153),
-                (77, 77, 77)],
-            7: [
-                (178, 24, 43),
-                (239, 138, 98),
-                (253, 219, 199),
-                (255, 255, 255),
-                (224, 224, 224),
-                (153, 153, 153),
-                (77, 77, 77)],
-            8: [
-                (178, 24, 43),
-                (214, 96, 77),
-                (244, 165, 130),
-                (253, 219, 199),
-                (224, 224, 224),
-                (186, 186, 186),
-                (135, 135, 135),
-                (77, 77, 77)],
-            9: [
-                (178, 24, 43),
-                (214, 96, 77),
-                (244, 165, 130),
-                (253, 219, 199),
-                (255, 255, 255),
-                (224, 224, 224),
-                (186, 186, 186),
-                (135, 135, 135),
-                (77, 77, 77)],
-            10: [
-                (103, 0, 31),
-                (178, 24, 43),
-                (214, 96, 77),
-                (244, 165, 130),
-                (253, 219, 199),
-                (224, 224, 224),
-                (186, 186, 186),
-                (135, 135, 135),
-                (77, 77, 77),
-                (26, 26, 26)],
-            11: [
-                (103, 0, 31),
-                (178, 24, 43),
-                (214, 96, 77),
-                (244, 165, 130),
-                (253, 219, 199),
-                (255, 255, 255),
-                (224, 224, 224),
-                (186, 186, 186),
-                (135, 135, 135),
-                (77, 77, 77),
-                (26, 26, 26)], "type": "div", "reverse": True},
-        "PurpleOrange": {
-            3: [
-                (241, 163, 64),
-                (247, 247, 247),
-                (153, 142, 195)],
-            4: [
-                (230, 97, 1),
-                (253, 184, 99),
-                (178, 171, 210),
-                (94, 60, 153)],
-            5: [
-                (230, 97, 1),
-                (253, 184, 99),
-                (247, 247, 247),
-                (178, 171, 210),
-                (94, 60, 153)],
-            6: [
-                (179, 88, 6),
-                (241, 163, 64),
-                (254, 224, 182),
-                (216, 218, 235),
-                (153, 142, 195),
-                (84, 39, 136)],
-            7: [
-                (179, 88, 6),
-                (241, 163, 64),
-                (254, 224, 182),
-                (247, 247, 247),
-                (216, 218, 235),
-                (153, 142, 195),
-                (84, 39, 136)],
-            8: [
-                (179, 88, 6),
-                (224, 130, 20),
-                (253, 184, 99),
-                (254, 224, 182),
-                (216, 218, 235),
-                (178, 171, 210),
-                (128, 115, 172),
-                (84, 39, 136)],
-            9: [
-                (179, 88, 6),
-                (224, 130, 20),
-                (253, 184, 99),
-                (254, 224, 182),
-                (247, 247, 247),
-                (216, 218, 235),
-                (178, 171, 210),
-                (128, 115, 172),
-                (84, 39, 136)],
-            10: [
-                (127, 59, 8),
-                (179, 88, 6),
-                (224, 130, 20),
-                (253, 184, 99),
-                (254, 224, 182),
-                (216, 218, 235),
-                (178, 171, 210),
-                (128, 115, 172),
-                (84, 39, 136),
-                (45, 0, 75)],
-            11: [
-                (127, 59, 8),
-                (179, 88, 6),
-                (224, 130, 20),
-                (253, 184, 99),
-                (254, 224, 182),
-                (247, 247, 247),
-                (216, 218, 235),
-                (178, 171, 210),
-                (128, 115, 172),
-                (84, 39, 136),
-                (45, 0, 75)], "type": "div", "reverse": True},
-        "Set2": {
-            3: [
-                (102, 194, 165),
-                (252, 141, 98),
-                (141, 160, 203)],
-            4: [
-                (102, 194, 165),
-                (252, 141, 98),
-                (141, 160, 203),
-                (231, 138, 195)],
-            5: [
-                (102, 194, 165),
-                (252, 141, 98),
-                (141, 160, 203),
-                (231, 138, 195),
-                (166, 216, 84)],
-            6: [
-                (102, 194, 165),
-                (252, 141, 98),
-                (141, 160, 203),
-                (231, 138, 195),
-                (166, 216, 84),
-                (255, 217, 47)],
-            7: [
-                (102, 194, 165),
-                (252, 141, 98),
-                (141, 160, 203),
-                (231, 138, 195),
-                (166, 216, 84),
-                (255, 217, 47),
-                (229, 196, 148)],
-            8: [
-                (102, 194, 165),
-                (252, 141, 98),
-                (141, 160, 203),
-                (231, 138, 195),
-                (166, 216, 84),
-                (255, 217, 47),
-                (229, 196, 148),
-                (179, 179, 179)], "type": "qual"},
-        "Accent": {
-            3: [
-                (127, 201, 127),
-                (190, 174, 212),
-                (253, 192, 134)],
-            4: [
-                (127, 201, 127),
-                (190, 174, 212),
-                (253, 192, 134),
-                (255, 255, 153)],
-            5: [
-                (127, 201, 127),
-                (190, 174, 212),
-                (253, 192, 134),
-                (255, 255, 153),
-                (56, 108, 176)],
-            6: [
-                (127, 201, 127),
-                (190, 174, 212),
-                (253, 192, 134),
-                (255, 255, 153),
-                (56, 108, 176),
-                (240, 2, 127)],
-            7: [
-                (127, 201, 127),
-                (190, 174, 212),
-                (253, 192, 134),
-                (255, 255, 153),
-                (56, 108, 176),
-                (240, 2, 127),
-                (191, 91, 23)],
-            8: [
-                (127, 201, 127),
-                (190, 174, 212),
-                (253, 192, 134),
-                (255, 255, 153),
-                (56, 108, 176),
-                (240, 2, 127),
-                (191, 91, 23),
-                (102, 102, 102)], "type": "qual"},
-        "Set1": {
-            3: [
-                (228, 26, 28),
-                (55, 126, 184),
-                (77, 175, 74)],
-            4: [
-                (228, 26, 28),
-                (55, 126, 184),
-                (77, 175, 74),
-                (152, 78, 163)],
-            5: [
-                (228, 26, 28),
-                (55, 126, 184),
-                (77, 175, 74),
-                (152, 78, 163),
-                (255, 127, 0)],
-            6: [
-                (228, 26, 28),
-                (55, 126, 184),
-                (77, 175, 74),
-                (152, 78, 163),
-                (255, 127, 0),
-                (255, 255, 51)],
-            7: [
-                (228, 26, 28),
-                (55, 126, 184),
-                (77, 175, 74),
-                (152, 78, 163),
-                (255, 127, 0),
-                (255, 255, 51),
-                (166, 86, 40)],
-            8: [
-                (228, 26, 28),
-                (55, 126, 184),
-                (77, 175, 74),
-                (152, 78, 163),
-                (255, 127, 0),
-                (255, 255, 51),
-                (166, 86, 40),
-                (247, 129, 191)],
-            9: [
-                (228, 26, 28),
-                (55, 126, 184),
-                (77, 175, 74),
-                (152, 78, 163),
-                (255, 127, 0),
-                (255, 255, 51),
-                (166, 86, 40),
-                (247, 129, 191),
-                (153, 153, 153)], "type": "qual"},
-        "Set3": {
-            3: [
-                (141, 211, 199),
-                (255, 255, 179),
-                (190, 186, 218)],
-            4: [
-                (141, 211, 199),
-                (255, 255, 179),
-                (190, 186, 218),
-                (251, 128, 114)],
-            5: [
-                (141, 211, 199),
-                (255, 255, 179),
-                (190, 186, 218),
-                (251, 128, 114),
-                (128, 177, 211)],
-            6: [
-                (141, 211, 199),
-                (255, 255, 179),
-                (190, 186, 218),
-                (251, 128, 114),
-                (128, 177, 211),
-                (253, 180, 98)],
-            7: [
-                (141, 211, 199),
-                (255, 255, 179),
-                (190, 186, 218),
-                (251, 128, 114),
-                (128, 177, 211),
-                (253, 180, 98),
-                (179, 222, 105)],
-            8: [
-                (141, 211, 199),
-                (255, 255, 179),
-                (190, 186, 218),
-                (251, 128, 114),
-                (128, 177, 211),
-                (253, 180, 98),
-                (179, 222, 105),
-                (252, 205, 229)],
-            9: [
-                (141, 211, 199),
-                (255, 255, 179),
-                (190, 186, 218),
-                (251, 128, 114),
-                (128, 177, 211),
-                (253, 180, 98),
-                (179, 222, 105),
-                (252, 205, 229),
-                (217, 217, 217)],
-            10: [
-                (141, 211, 199),
-                (255, 255, 179),
-                (190, 186, 218),
-                (251, 128, 114),
-                (128, 177, 211),
-                (253, 180, 98),
-                (179, 222, 105),
-                (252, 205, 229),
-                (217, 217, 217),
-                (188, 128, 189)],
-            11: [
-                (141, 211, 199),
-                (255, 255, 179),
-                (190, 186, 218),
-                (251, 128, 114),
-                (128, 177, 211),
-                (253, 180, 98),
-                (179, 222, 105),
-                (252, 205, 229),
-                (217, 217, 217),
-                (188, 128, 189),
-                (204, 235, 197)],
-            12: [
-                (141, 211, 199),
-                (255, 255, 179),
-                (190, 186, 218),
-                (251, 128, 114),
-                (128, 177, 211),
-                (253, 180, 98),
-                (179, 222, 105),
-                (252, 205, 229),
-                (217, 217, 217),
-                (188, 128, 189),
-                (204, 235, 197),
-                (255, 237, 111)], "type": "qual"},
-        "Dark2": {
-            3: [
-                (27, 158, 119),
-                (217, 95, 2),
-                (117, 112, 179)],
-            4: [
-                (27, 158, 119),
-                (217, 95, 2),
-                (117, 112, 179),
-                (231, 41, 138)],
-            5: [
-                (27, 158, 119),
-                (217, 95, 2),
-                (117, 112, 179),
-                (231, 41, 138),
-                (102, 166, 30)],
-            6: [
-                (27, 158, 119),
-                (217, 95, 2),
-                (117, 112, 179),
-                (231, 41, 138),
-                (102, 166, 30),
-                (230, 171, 2)],
-            7: [
-                (27, 158, 119),
-                (217, 95, 2),
-                (117, 112, 179),
-                (231, 41, 138),
-                (102, 166, 30),
-                (230, 171, 2),
-                (166, 118, 29)],
-            8: [
-                (27, 158, 119),
-                (217, 95, 2),
-                (117, 112, 179),
-                (231, 41, 138),
-                (102, 166, 30),
-                (230, 171, 2),
-                (166, 118, 29),
-                (102, 102, 102)], "type": "qual"},
-        "Paired": {
-            3: [
-                (166, 206, 227),
-                (31, 120, 180),
-                (178, 223, 138)],
-            4: [
-                (166, 206, 227),
-                (31, 120, 180),
-                (178, 223, 138),
-                (51, 160, 44)],
-            5: [
-                (166, 206, 227),
-                (31, 120, 180),
-                (178, 223, 138),
-                (51, 160, 44),
-                (251, 154, 153)],
-            6: [
-                (166, 206, 227),
-                (31, 120, 180),
-                (178, 223, 138),
-                (51, 160, 44),
-                (251, 154, 153),
-                (227, 26, 28)],
-            7: [
-                (166, 206, 227),
-                (31, 120, 180),
-                (178, 223, 138),
-                (51, 160, 44),
-                (251, 154, 153),
-                (227, 26, 28),
-                (253, 191, 111)],
-            8: [
-                (166, 206, 227),
-                (31, 120, 180),
-                (178, 223, 138),
-                (51, 160, 44),
-                (251, 154, 153),
-                (227, 26, 28),
-                (253, 191, 111),
-                (255, 127, 0)],
-            9: [
-                (166, 206, 227),
-                (31, 120, 180),
-                (178, 223, 138),
-                (51, 160, 44),
-                (251, 154, 153),
-                (227, 26, 28),
-                (253, 191, 111),
-                (255, 127, 0),
-                (202, 178, 214)],
-            10: [
-                (166, 206, 227),
-                (31, 120, 180),
-                (178, 223, 138),
-                (51, 160, 44),
-                (251, 154, 153),
-                (227, 26, 28),
-                (253, 191, 111),
-                (255, 127, 0),
-                (202, 178, 214),
-                (106, 61, 154)],
-            11: [
-                (166, 206, 227),
-                (31, 120, 180),
-                (178, 223, 138),
-                (51, 160, 44),
-                (251, 154, 153),
-                (227, 26, 28),
-                (253, 191, 111),
-                (255, 127, 0),
-                (202, 178, 214),
-                (106, 61, 154),
-                (255, 255, 153)],
-            12: [
-                (166, 206, 227),
-                (31, 120, 180),
-                (178, 223, 138),
-                (51, 160, 44),
-                (251, 154, 153),
-                (227, 26, 28),
-                (253, 191, 111),
-                (255, 127, 0),
-                (202, 178, 214),
-                (106, 61, 154),
-                (255, 255, 153),
-                (177, 89, 40)], "type": "qual"},
-        "Pastel2": {
-            3: [
-                (179, 226, 205),
-                (253, 205, 172),
-                (203, 213, 232)],
-            4: [
-                (179, 226, 205),
-                (253, 205, 172),
-                (203, 213, 232),
-                (244, 202, 228)],
-            5: [
-                (179, 226, 205),
-                (253, 205, 172),
-                (203, 213, 232),
-                (244, 202, 228),
-                (230, 245, 201)],
-            6: [
-                (179, 226, 205),
-                (253, 205, 172),
-                (203, 213, 232),
-                (244, 202, 228),
-                (230, 245, 201),
-                (255, 242, 174)],
-            7: [
-                (179, 226, 205),
-                (253, 205, 172),
-                (203, 213, 232),
-                (244, 202, 228),
-                (230, 245, 201),
-                (255, 242, 174),
-                (241, 226, 204)],
-            8: [
-                (179, 226, 205),
-                (253, 205, 172),
-                (203, 213, 232),
-                (244, 202, 228),
-                (230, 245, 201),
-                (255, 242, 174),
-                (241, 226, 204),
-                (204, 204, 204)], "type": "qual"},
-        "Pastel1": {
-            3: [
-                (251, 180, 174),
-                (179, 205, 227),
-                (204, 235, 197)],
-            4: [
-                (251, 180, 174),
-                (179, 205, 227),
-                (204, 235, 197),
-                (222, 203, 228)],
-            5: [
-                (251, 180, 174),
-                (179, 205, 227),
-                (204, 235, 197),
-                (222, 203, 228),
-                (254, 217, 166)],
-            6: [
-                (251, 180, 174),
-                (179, 205, 227),
-                (204, 235, 197),
-                (222, 203, 228),
-                (254, 217, 166),
-                (255, 255, 204)],
-            7: [
-                (251, 180, 174),
-                (179, 205, 227),
-                (204, 235, 197),
-                (222, 203, 228),
-                (254, 217, 166),
-                (255, 255, 204),
-                (229, 216, 189)],
-            8: [
-                (251, 180, 174),
-                (179, 205, 227),
-                (204, 235, 197),
-                (222, 203, 228),
-                (254, 217, 166),
-                (255, 255, 204),
-                (229, 216, 189),
-                (253, 218, 236)],
-            9: [
-                (251, 180, 174),
-                (179, 205, 227),
-                (204, 235, 197),
-                (222, 203, 228),
-                (254, 217, 166),
-                (255, 255, 204),
-                (229, 216, 189),
-                (253, 218, 236),
-                (242, 242, 242)], "type": "qual"},
-        "RedOrange": {
-            3: [
-                (254, 232, 200),
-                (253, 187, 132),
-                (227, 74, 51)],
-            4: [
-                (254, 240, 217),
-                (253, 204, 138),
-                (252, 141, 89),
-                (215, 48, 31)],
-            5: [
-                (254, 240, 217),
-                (253, 204, 138),
-                (252, 141, 89),
-                (227, 74, 51),
-                (179, 0, 0)],
-            6: [
-                (254, 240, 217),
-                (253, 212, 158),
-                (253, 187, 132),
-                (252, 141, 89),
-                (227, 74, 51),
-                (179, 0, 0)],
-            7: [
-                (254, 240, 217),
-                (253, 212, 158),
-                (253, 187, 132),
-                (252, 141, 89),
-                (239, 101, 72),
-                (215, 48, 31),
-                (153, 0, 0)],
-            8: [
-                (255, 247, 236),
-                (254, 232, 200),
-                (253, 212, 158),
-                (253, 187, 132),
-                (252, 141, 89),
-                (239, 101, 72),
-                (215, 48, 31),
-                (153, 0, 0)],
-            9: [
-                (255, 247, 236),
-                (254, 232, 200),
-                (253, 212, 158),
-                (253, 187, 132),
-                (252, 141, 89),
-                (239, 101, 72),
-                (215, 48, 31),
-                (179, 0, 0),
-                (127, 0, 0)], "type": "seq", "reverse": True},
-        "BluePurple": {
-            3: [
-                (236, 231, 242),
-                (166, 189, 219),
-                (43, 140, 190)],
-            4: [
-                (241, 238, 246),
-                (189, 201, 225),
-                (116, 169, 207),
-                (5, 112, 176)],
-            5: [
-                (241, 238, 246),
-                (189, 201, 225),
-                (116, 169, 207),
-                (43, 140, 190),
-                (4, 90, 141)],
-            6: [
-                (241, 238, 246),
-                (208, 209, 230),
-                (166, 189, 219),
-                (116, 169, 207),
-                (43, 140, 190),
-                (4, 90, 141)],
-            7: [
-                (241, 238, 246),
-                (208, 209, 230),
-                (166, 189, 219),
-                (116, 169, 207),
-                (54, 144, 192),
-                (5, 112, 176),
-                (3, 78, 123)],
-            8: [
-                (255, 247, 251),
-                (236, 231, 242),
-                (208, 209, 230),
-                (166, 189, 219),
-                (116, 169, 207),
-                (54, 144, 192),
-                (5, 112, 176),
-                (3, 78, 123)],
-            9: [
-                (255, 247, 251),
-                (236, 231, 242),
-                (208, 209, 230),
-                (166, 189, 219),
-                (116, 169, 207),
-                (54, 144, 192),
-                (5, 112, 176),
-                (4, 90, 141),
-                (2, 56, 88)], "type": "seq", "reverse": True},
-        "PurpleBlue": {
-            3: [
-                (224, 236, 244),
-                (158, 188, 218),
-                (136, 86, 167)],
-            4: [
-                (237, 248, 251),
-                (179, 205, 227),
-                (140, 150, 198),
-                (136, 65, 157)],
-            5: [
-                (237, 248, 251),
-                (179, 205, 227),
-                (140, 150, 198),
-                (136, 86, 167),
-                (129, 15, 124)],
-            6: [
-                (237, 248, 251),
-                (191, 211, 230),
-                (158, 188, 218),
-                (140, 150, 198),
-                (136, 86, 167),
-                (129, 15, 124)],
-            7: [
-                (237, 248, 251),
-                (191, 211, 230),
-                (158, 188, 218),
-                (140, 150, 198),
-                (140, 107, 177),
-                (136, 65, 157),
-                (110, 1, 107)],
-            8: [
-                (247, 252, 253),
-                (224, 236, 244),
-                (191, 211, 230),
-                (158, 188, 218),
-                (140, 150, 198),
-                (140, 107, 177),
-                (136, 65, 157),
-                (110, 1, 107)],
-            9: [
-                (247, 252, 253),
-                (224, 236, 244),
-                (191, 211, 230),
-                (158, 188, 218),
-                (140, 150, 198),
-                (140, 107, 177),
-                (136, 65, 157),
-                (129, 15, 124),
-                (77, 0, 75)], "type": "seq", "reverse": True},
-        "Oranges": {
-            3: [
-                (254, 230, 206),
-                (253, 174, 107),
-                (230, 85, 13)],
-            4: [
-                (254, 237, 222),
-                (253, 190, 133),
-                (253, 141, 60),
-                (217, 71, 1)],
-            5: [
-                (254, 237, 222),
-                (253, 190, 133),
-                (253, 141, 60),
-                (230, 85, 13),
-                (166, 54, 3)],
-            6: [
-                (254, 237, 222),
-                (253, 208, 162),
-                (253, 174, 107),
-                (253, 141, 60),
-                (230, 85, 13),
-                (166, 54, 3)],
-            7: [
-                (254, 237, 222),
-                (253, 208, 162),
-                (253, 174, 107),
-                (253, 141, 60),
-                (241, 105, 19),
-                (217, 72, 1),
-                (140, 45, 4)],
-            8: [
-                (255, 245, 235),
-                (254, 230, 206),
-                (253, 208, 162),
-                (253, 174, 107),
-                (253, 141, 60),
-                (241, 105, 19),
-                (217, 72, 1),
-                (140, 45, 4)],
-            9: [
-                (255, 245, 235),
-                (254, 230, 206),
-                (253, 208, 162),
-                (253, 174, 107),
-                (253, 141, 60),
-                (241, 105, 19),
-                (217, 72, 1),
-                (166, 54, 3),
-                (127, 39, 4)], "type": "seq", "reverse": True},
-        "GreenBlue": {
-            3: [
-                (229, 245, 249),
-                (153, 216, 201),
-                (44, 162, 95)],
-            4: [
-                (237, 248, 251),
-                (178, 226, 226),
-                (102, 194, 164),
-                (35, 139, 69)],
-            5: [
-                (237, 248, 251),
-                (178, 226, 226),
-                (102, 194, 164),
-                (44, 162, 95),
-                (0, 109, 44)],
-            6: [
-                (237, 248, 251),
-                (204, 236, 230),
-                (153, 216, 201),
-                (102, 194, 164),
-                (44, 162, 95),
-                (0, 109, 44)],
-            7: [
-                (237, 248, 251),
-                (204, 236, 230),
-                (153, 216, 201),
-                (102, 194, 164),
-                (65, 174, 118),
-                (35, 139, 69),
-                (0, 88, 36)],
-            8: [
-                (247, 252, 253),
-                (229, 245, 249),
-                (204, 236, 230),
-                (153, 216, 201),
-                (102, 194, 164),
-                (65, 174, 118),
-                (35, 139, 69),
-                (0, 88, 36)],
-            9: [
-                (247, 252, 253),
-                (229, 245, 249),
-                (204, 236, 230),
-                (153, 216, 201),
-                (102, 194, 164),
-                (65, 174, 118),
-                (35, 139, 69),
-                (0, 109, 44),
-                (0, 68, 27)], "type": "seq", "reverse": True},
-        "BrownOrangeYellow": {
-            3: [
-                (255, 247, 188),
-                (254, 196, 79),
-                (217, 95, 14)],
-            4: [
-                (255, 255, 212),
-                (254, 217, 142),
-                (254, 153, 41),
-                (204, 76, 2)],
-            5: [
-                (255, 255, 212),
-                (254, 217, 142),
-                (254, 153, 41),
-                (217, 95, 14),
-                (153, 52, 4)],
-            6: [
-                (255, 255, 212),
-                (254, 227, 145),
-                (254, 196, 79),
-                (254, 153, 41),
-                (217, 95, 14),
-                (153, 52, 4)],
-            7: [
-                (255, 255, 212),
-                (254, 227, 145),
-                (254, 196, 79),
-                (254, 153, 41),
-                (236, 112, 20),
-                (204, 76, 2),
-                (140, 45, 4)],
-            8: [
-                (255, 255, 229),
-                (255, 247, 188),
-                (254, 227, 145),
-                (254, 196, 79),
-                (254, 153, 41),
-                (236, 112, 20),
-                (204, 76, 2),
-                (140, 45, 4)],
-            9: [
-                (255, 255, 229),
-                (255, 247, 188),
-                (254, 227, 145),
-                (254, 196, 79),
-                (254, 153, 41),
-                (236, 112, 20),
-                (204, 76, 2),
-                (153, 52, 4),
-                (102, 37, 6)], "type": "seq", "reverse": True},
-        "GreenYellow": {
-            3: [
-                (247, 252, 185),
-                (173, 221, 142),
-                (49, 163, 84)],
-            4: [
-                (255, 255, 204),
-                (194, 230, 153),
-                (120, 198, 121),
-                (35, 132, 67)],
-            5: [
-                (255, 255, 204),
-                (194, 230, 153),
-                (120, 198, 121),
-                (49, 163, 84),
-                (0, 104, 55)],
-            6: [
-                (255, 255, 204),
-                (217, 240, 163),
-                (173, 221, 142),
-                (120, 198, 121),
-                (49, 163, 84),
-                (0, 104, 55)],
-            7: [
-                (255, 255, 204),
-                (217, 240, 163),
-                (173, 221, 142),
-                (120, 198, 121),
-                (65, 171, 93),
-                (35, 132, 67),
-                (0, 90, 50)],
-            8: [
-                (255, 255, 229),
-                (247, 252, 185),
-                (217, 240, 163),
-                (173, 221, 142),
-                (120, 198, 121),
-                (65, 171, 93),
-                (35, 132, 67),
-                (0, 90, 50)],
-            9: [
-                (255, 255, 229),
-                (247, 252, 185),
-                (217, 240, 163),
-                (173, 221, 142),
-                (120, 198, 121),
-                (65, 171, 93),
-                (35, 132, 67),
-                (0, 104, 55),
-                (0, 69, 41)], "type": "seq", "reverse": True},
-        "Reds": {
-            3: [
-                (254, 224, 210),
-                (252, 146, 114),
-                (222, 45, 38)],
-            4: [
-                (254, 229, 217),
-                (252, 174, 145),
-                (251, 106, 74),
-                (203, 24, 29)],
-            5: [
-                (254, 229, 217),
-                (252, 174, 145),
-                (251, 106, 74),
-                (222, 45, 38),
-                (165, 15, 21)],
-            6: [
-                (254, 229, 217),
-                (252, 187, 161),
-                (252, 146, 114),
-                (251, 106, 74),
-                (222, 45, 38),
-                (165, 15, 21)],
-            7: [
-                (254, 229, 217),
-                (252, 187, 161),
-                (252, 146, 114),
-                (251, 106, 74),
-                (239, 59, 44),
-                (203, 24, 29),
-                (153, 0, 13)],
-            8: [
-                (255, 245, 240),
-                (254, 224, 210),
-                (252, 187, 161),
-                (252, 146, 114),
-                (251, 106, 74),
-                (239, 59, 44),
-                (203, 24, 29),
-                (153, 0, 13)],
-            9: [
-                (255, 245, 240),
-                (254, 224, 210),
-                (252, 187, 161),
-                (252, 146, 114),
-                (251, 106, 74),
-                (239, 59, 44),
-                (203, 24, 29),
-                (165, 15, 21),
-                (103, 0, 13)], "type": "seq", "reverse": True},
-        "PurpleRed": {
-            3: [
-                (253, 224, 221),
-                (250, 159, 181),
-                (197, 27, 138)],
-            4: [
-                (254, 235, 226),
-                (251, 180, 185),
-                (247, 104, 161),
-                (174, 1, 126)],
-            5: [
-                (254, 235, 226),
-                (251, 180, 185),
-                (247, 104, 161),
-                (197, 27, 138),
-                (122, 1, 119)],
-            6: [
-                (254, 235, 226),
-                (252, 197, 192),
-                (250, 159, 181),
-                (247, 104, 161),
-                (197, 27, 138),
-                (122, 1, 119)],
-            7: [
-                (254, 235, 226),
-                (252, 197, 192),
-                (250, 159, 181),
-                (247, 104, 161),
-                (221, 52, 151),
-                (174, 1, 126),
-                (122, 1, 119)],
-            8: [
-                (255, 247, 243),
-                (253, 224, 221),
-                (252, 197, 192),
-                (250, 159, 181),
-                (247, 104, 161),
-                (221, 52, 151),
-                (174, 1, 126),
-                (122, 1, 119)],
-            9: [
-                (255, 247, 243),
-                (253, 224, 221),
-                (252, 197, 192),
-                (250, 159, 181),
-                (247, 104, 161),
-                (221, 52, 151),
-                (174, 1, 126),
-                (122, 1, 119),
-                (73, 0, 106)], "type": "seq", "reverse": True},
-        "Greens": {
-            3: [
-                (229, 245, 224),
-                (161, 217, 155),
-                (49, 163, 84)],
-            4: [
-                (237, 248, 233),
-                (186, 228, 179),
-                (116, 196, 118),
-                (35, 139, 69)],
-            5: [
-                (237, 248, 233),
-                (186, 228, 179),
-                (116, 196, 118),
-                (49, 163, 84),
-                (0, 109, 44)],
-            6: [
-                (237, 248, 233),
-                (199, 233, 192),
-                (161, 217, 155),
-                (116, 196, 118),
-                (49, 163, 84),
-                (0, 109, 44)],
-            7: [
-                (237, 248, 233),
-                (199, 233, 192),
-                (161, 217, 155),
-                (116, 196, 118),
-                (65, 171, 93),
-                (35, 139, 69),
-                (0, 90, 50)],
-            8: [
-                (247, 252, 245),
-                (229, 245, 224),
-                (199, 233, 192),
-                (161, 217, 155),
-                (116, 196, 118),
-                (65, 171, 93),
-                (35, 139, 69),
-                (0, 90, 50)],
-            9: [
-                (247, 252, 245),
-                (229, 245, 224),
-                (199, 233, 192),
-                (161, 217, 155),
-                (116, 196, 118),
-                (65, 171, 93),
-                (35, 139, 69),
-                (0, 109, 44),
-                (0, 68, 27)], "type": "seq", "reverse": True},
-        "BlueGreenYellow": {
-            3: [
-                (237, 248, 177),
-                (127, 205, 187),
-                (44, 127, 184)],
-            4: [
-                (255, 255, 204),
-                (161, 218, 180),
-                (65, 182, 196),
-                (34, 94, 168)],
-            5: [
-                (255, 255, 204),
-                (161, 218, 180),
-                (65, 182, 196),
-                (44, 127, 184),
-                (37, 52, 148)],
-            6: [
-                (255, 255, 204),
-                (199, 233, 180),
-                (127, 205, 187),
-                (65, 182, 196),
-                (44, 127, 184),
-                (37, 52, 148)],
-            7: [
-                (255, 255, 204),
-                (199, 233, 180),
-                (127, 205, 187),
-                (65, 182, 196),
-                (29, 145, 192),
-                (34, 94, 168),
-                (12, 44, 132)],
-            8: [
-                (255, 255, 217),
-                (237, 248, 177),
-                (199, 233, 180),
-                (127, 205, 187),
-                (65, 182, 196),
-                (29, 145, 192),
-                (34, 94, 168),
-                (12, 44, 132)],
-            9: [
-                (255, 255, 217),
-                (237, 248, 177),
-                (199, 233, 180),
-                (127, 205, 187),
-                (65, 182, 196),
-                (29, 145, 192),
-                (34, 94, 168),
-                (37, 52, 148),
-                (8, 29, 88)], "type": "seq", "reverse": True},
-        "Purples": {
-            3: [
-                (239, 237, 245),
-                (188, 189, 220),
-                (117, 107, 177)],
-            4: [
-                (242, 240, 247),
-                (203, 201, 226),
-                (158, 154, 200),
-                (106, 81, 163)],
-            5: [
-                (242, 240, 247),
-                (203, 201, 226),
-                (158, 154, 200),
-                (117, 107, 177),
-                (84, 39, 143)],
-            6: [
-                (242, 240, 247),
-                (218, 218, 235),
-                (188, 189, 220),
-                (158, 154, 200),
-                (117, 107, 177),
-                (84, 39, 143)],
-            7: [
-                (242, 240, 247),
-                (218, 218, 235),
-                (188, 189, 220),
-                (158, 154, 200),
-                (128, 125, 186),
-                (106, 81, 163),
-                (74, 20, 134)],
-            8: [
-                (252, 251, 253),
-                (239, 237, 245),
-                (218, 218, 235),
-                (188, 189, 220),
-                (158, 154, 200),
-                (128, 125, 186),
-                (106, 81, 163),
-                (74, 20, 134)],
-            9: [
-                (252, 251, 253),
-                (239, 237, 245),
-                (218, 218, 235),
-                (188, 189, 220),
-                (158, 154, 200),
-                (128, 125, 186),
-                (106, 81, 163),
-                (84, 39, 143),
-                (63, 0, 125)], "type": "seq", "reverse": True},
-        "BlueGreen": {
-            3: [
-                (224, 243, 219),
-                (168, 221, 181),
-                (67, 162, 202)],
-            4: [
-                (240, 249, 232),
-                (186, 228, 188),
-                (123, 204, 196),
-                (43, 140, 190)],
-            5: [
-                (240, 249, 232),
-                (186, 228, 188),
-                (123, 204, 196),
-                (67, 162, 202),
-                (8, 104, 172)],
-            6: [
-                (240, 249, 232),
-                (204, 235, 197),
-                (168, 221, 181),
-                (123, 204, 196),
-                (67, 162, 202),
-                (8, 104, 172)],
-            7: [
-                (240, 249, 232),
-                (204, 235, 197),
-                (168, 221, 181),
-                (123, 204, 196),
-                (78, 179, 211),
-                (43, 140, 190),
-                (8, 88, 158)],
-            8: [
-                (247, 252, 240),
-                (224, 243, 219),
-                (204, 235, 197),
-                (168, 221, 181),
-                (123, 204, 196),
-                (78, 179, 211),
-                (43, 140, 190),
-                (8, 88, 158)],
-            9: [
-                (247, 252, 240),
-                (224, 243, 219),
-                (204, 235, 197),
-                (168, 221, 181),
-                (123, 204, 196),
-                (78, 179, 211),
-                (43, 140, 190),
-                (8, 104, 172),
-                (8, 64, 129)], "type": "seq", "reverse": True},
-        "Greys": {
-            3: [
-                (240, 240, 240),
-                (189, 189, 189),
-                (99, 99, 99)],
-            4: [
-                (247, 247, 247),
-                (204, 204, 204),
-                (150, 150, 150),
-                (82, 82, 82)],
-            5: [
-                (247, 247, 247),
-                (204, 204, 204),
-                (150, 150, 150),
-                (99, 99, 99),
-                (37, 37, 37)],
-            6: [
-                (247, 247, 247),
-                (217, 217, 217),
-                (189, 189, 189),
-                (150, 150, 150),
-                (99, 99, 99),
-                (37, 37, 37)],
-            7: [
-                (247, 247, 247),
-                (217, 217, 217),
-                (189, 189, 189),
-                (150, 150, 150),
-                (115, 115, 115),
-                (82, 82, 82),
-                (37, 37, 37)],
-            8: [
-                (255, 255, 255),
-                (240, 240, 240),
-                (217, 217, 217),
-                (189, 189, 189),
-                (150, 150, 150),
-                (115, 115, 115),
-                (82, 82, 82),
-                (37, 37, 37)],
-            9: [
-                (255, 255, 255),
-                (240, 240, 240),
-                (217, 217, 217),
-                (189, 189, 189),
-                (150, 150, 150),
-                (115, 115, 115),
-                (82, 82, 82),
-                (37, 37, 37),
-                (0, 0, 0)], "type": "seq", "reverse": True},
-        "RedOrangeYellow": {
-            3: [
-                (255, 237, 160),
-                (254, 178, 76),
-                (240, 59, 32)],
-            4: [
-                (255, 255, 178),
-                (254, 204, 92),
-                (253, 141, 60),
-                (227, 26, 28)],
-            5: [
-                (255, 255, 178),
-                (254, 204, 92),
-                (253, 141, 60),
-                (240, 59, 32),
-                (189, 0, 38)],
-            6: [
-                (255, 255, 178),
-                (254, 217, 118),
-                (254, 178, 76),
-                (253, 141, 60),
-                (240, 59, 32),
-                (189, 0, 38)],
-            7: [
-                (255, 255, 178),
-                (254, 217, 118),
-                (254, 178, 76),
-                (253, 141, 60),
-                (252, 78, 42),
-                (227, 26, 28),
-                (177, 0, 38)],
-            8: [
-                (255, 255, 204),
-                (255, 237, 160),
-                (254, 217, 118),
-                (254, 178, 76),
-                (253, 141, 60),
-                (252, 78, 42),
-                (227, 26, 28),
-                (177, 0, 38)], "type": "seq", "reverse": True},
-        "RedPurple": {
-            3: [
-                (231, 225, 239),
-                (201, 148, 199),
-                (221, 28, 119)],
-            4: [
-                (241, 238, 246),
-                (215, 181, 216),
-                (223, 101, 176),
-                (206, 18, 86)],
-            5: [
-                (241, 238, 246),
-                (215, 181, 216),
-                (223, 101, 176),
-                (221, 28, 119),
-                (152, 0, 67)],
-            6: [
-                (241, 238, 246),
-                (212, 185, 218),
-                (201, 148, 199),
-                (223, 101, 176),
-                (221, 28, 119),
-                (152, 0, 67)],
-            7: [
-                (241, 238, 246),
-                (212, 185, 218),
-                (201, 148, 199),
-                (223, 101, 176),
-                (231, 41, 138),
-                (206, 18, 86),
-                (145, 0, 63)],
-            8: [
-                (247, 244, 249),
-                (231, 225, 239),
-                (212, 185, 218),
-                (201, 148, 199),
-                (223, 101, 176),
-                (231, 41, 138),
-                (206, 18, 86),
-                (145, 0, 63)],
-            9: [
-                (247, 244, 249),
-                (231, 225, 239),
-                (212, 185, 218),
-                (201, 148, 199),
-                (223, 101, 176),
-                (231, 41, 138),
-                (206, 18, 86),
-                (152, 0, 67),
-                (103, 0, 31)], "type": "seq", "reverse": True},
-        "Blues": {
-            3: [
-                (222, 235, 247),
-                (158, 202, 225),
-                (49, 130, 189)],
-            4: [
-                (239, 243, 255),
-                (189, 215, 231),
-                (107, 174, 214),
-                (33, 113, 181)],
-            5: [
-                (239, 243, 255),
-                (189, 215, 231),
-                (107, 174, 214),
-                (49, 130, 189),
-                (8, 81, 156)],
-            6: [
-                (239, 243, 255),
-                (198, 219, 239),
-                (158, 202, 225),
-                (107, 174, 214),
-                (49, 130, 189),
-                (8, 81, 156)],
-            7: [
-                (239, 243, 255),
-                (198, 219, 239),
-                (158, 202, 225),
-                (107, 174, 214),
-                (66, 146, 198),
-                (33, 113, 181),
-                (8, 69, 148)],
-            8: [
-                (247, 251, 255),
-                (222, 235, 247),
-                (198, 219, 239),
-                (158, 202, 225),
-                (107, 174, 214),
-                (66, 146, 198),
-                (33, 113, 181),
-                (8, 69, 148)],
-            9: [
-                (247, 251, 255),
-                (222, 235, 247),
-                (198, 219, 239),
-                (158, 202, 225),
-                (107, 174, 214),
-                (66, 146, 198),
-                (33, 113, 181),
-                (8, 81, 156),
-                (8, 48, 107)], "type": "seq", "reverse": True},
-        "GreenBluePurple": {
-            3: [
-                (236, 226, 240),
-                (166, 189, 219),
-                (28, 144, 153)],
-            4: [
-                (246, 239, 247),
-                (189, 201, 225),
-                (103, 169, 207),
-                (2, 129, 138)],
-            5: [
-                (246, 239, 247),
-                (189, 201, 225),
-                (103, 169, 207),
-                (28, 144, 153),
-                (1, 108, 89)],
-            6: [
-                (246, 239, 247),
-                (208, 209, 230),
-                (166, 189, 219),
-                (103, 169, 207),
-                (28, 144, 153),
-                (1, 108, 89)],
-            7: [
-                (246, 239, 247),
-                (208, 209, 230),
-                (166, 189, 219),
-                (103, 169, 207),
-                (54, 144, 192),
-                (2, 129, 138),
-                (1, 100, 80)],
-            8: [
-                (255, 247, 251),
-                (236, 226, 240),
-                (208, 209, 230),
-                (166, 189, 219),
-                (103, 169, 207),
-                (54, 144, 192),
-                (2, 129, 138),
-                (1, 100, 80)],
-            9: [
-                (255, 247, 251),
-                (236, 226, 240),
-                (208, 209, 230),
-                (166, 189, 219),
-                (103, 169, 207),
-                (54, 144, 192),
-                (2, 129, 138),
-                (1, 108, 89),
-                (1, 70, 54)], "type": "seq", "reverse": True},
-        }
+    _cache = {}
+
+    @property
+    def _data(self):
+        return _load_palettes("brewer.json", counts=True)
 
 
 brewer = BrewerFactory()
@@ -2825,20 +1083,26 @@ class LinearFactory(object):
         """Return a list of available map names."""
         return [name for name in self._data.keys()]
 
-    def map(self, name, domain_min=None, domain_max=None):
+    def map(self, name, domain_min=None, domain_max=None, lut=None):
         """Construct a named :py:class:`toyplot.color.LinearMap` instance.
 
         Parameters
         ----------
         name: :class:`str`
           The name of the map.  Use :py:meth:`toyplot.color.LinearFactory.names` to retrieve a list of available names.
+        lut: integer, optional
+          If specified, the map will use a lookup table with this many entries.
 
         Returns
         -------
         map: :class:`toyplot.color.LinearMap`
         """
-        palette = Palette([rgb(red, green, blue) for _, red, green, blue in self._data[name]])
-        return LinearMap(palette=palette, domain_min=domain_min, domain_max=domain_max)
+        if name not in self._cache:
+            data = numpy.array(self._data[name])
+            colors = rgb(data[:, 1], data[:, 2], data[:, 3])
+            colors.flags.writeable = False
+            self._cache[name] = colors
+        return LinearMap(palette=Palette(self._cache[name]), domain_min=domain_min, domain_max=domain_max, lut=lut)
 
     def maps(self):
         """Return a (name, colormap) tuple for every map in the collection.
@@ -2849,272 +1113,11 @@ class LinearFactory(object):
         """
         return [(name, self.map(name)) for name in self.names()]
 
-    _data = collections.OrderedDict([
-        ("Blackbody", [
-            (0.0, 0.0, 0.0, 0.0),
-            (0.015873015873, 0.0497734776566, 0.0152477941455, 0.00852887312598),
-            (0.031746031746, 0.084855813636, 0.0304955882911, 0.017057746252),
-            (0.047619047619, 0.110596777851, 0.045468486547, 0.0255866193779),
-            (0.0634920634921, 0.131828466896, 0.0581726828908, 0.0341240566996),
-            (0.0793650793651, 0.15396956097, 0.0666492584387, 0.0428429968035),
-            (0.0952380952381, 0.177679162416, 0.0725166219647, 0.050823629234),
-            (0.111111111111, 0.201904856852, 0.0780963813824, 0.0578148506676),
-            (0.126984126984, 0.22659740784, 0.0833966086871, 0.0640284471441),
-            (0.142857142857, 0.251720295995, 0.0884210421079, 0.0696046995283),
-            (0.15873015873, 0.277244781506, 0.0931718709304, 0.0746415380267),
-            (0.174603174603, 0.303147494519, 0.0976499344002, 0.0792101025496),
-            (0.190476190476, 0.329403084274, 0.101856249237, 0.0834333445488),
-            (0.206349206349, 0.355973461763, 0.105794993876, 0.0876339441208),
-            (0.222222222222, 0.382848034388, 0.109463756409, 0.0918462462183),
-            (0.238095238095, 0.410019181885, 0.112858537428, 0.0960705967607),
-            (0.253968253968, 0.437479394285, 0.115974391474, 0.100307286568),
-            (0.269841269841, 0.465221354411, 0.118805374491, 0.104556559102),
-            (0.285714285714, 0.493237985431, 0.12134447042, 0.108818616983),
-            (0.301587301587, 0.521522475956, 0.123583494231, 0.113093627519),
-            (0.31746031746, 0.550068290666, 0.125512967442, 0.117381727397),
-            (0.333333333333, 0.57886917165, 0.12712196061, 0.121683026697),
-            (0.349206349206, 0.607919133853, 0.128397895268, 0.125997612321),
-            (0.365079365079, 0.637212456877, 0.129326295006, 0.130325550956),
-            (0.380952380952, 0.666743674634, 0.129890471593, 0.134666891619),
-            (0.396825396825, 0.691292894468, 0.141293283089, 0.136258919233),
-            (0.412698412698, 0.706485699582, 0.170344592267, 0.132534602103),
-            (0.428571428571, 0.721654217074, 0.19689465803, 0.128274044848),
-            (0.444444444444, 0.736799548299, 0.221800939447, 0.12340916854),
-            (0.460317460317, 0.751922741791, 0.245555262747, 0.117853905198),
-            (0.47619047619, 0.767024796621, 0.268467312199, 0.111496560918),
-            (0.492063492063, 0.782106665487, 0.290745094317, 0.104187424625),
-            (0.507936507937, 0.797169257565, 0.312535115222, 0.0957174093272),
-            (0.52380952381, 0.812213441141, 0.333944389252, 0.0857782387212),
-            (0.539682539683, 0.827240046048, 0.355053366625, 0.073879942571),
-            (0.555555555556, 0.842249865912, 0.375923953617, 0.0591516202944),
-            (0.571428571429, 0.857243660245, 0.396604712155, 0.039717323074),
-            (0.587301587302, 0.870379942456, 0.418565674041, 0.0197163850683),
-            (0.603174603175, 0.874344023609, 0.446974056864, 0.0181687081555),
-            (0.619047619048, 0.878025845405, 0.47466075806, 0.0167976393343),
-            (0.634920634921, 0.881420328496, 0.501760962635, 0.015617018173),
-            (0.650793650794, 0.884522146084, 0.528379005009, 0.0146406842395),
-            (0.666666666667, 0.887325704879, 0.554597071914, 0.013882477102),
-            (0.68253968254, 0.889825124527, 0.58048102161, 0.0133562363286),
-            (0.698412698413, 0.892014215292, 0.606084400817, 0.0130758014873),
-            (0.714285714286, 0.893886453749, 0.631451293491, 0.0130550121463),
-            (0.730158730159, 0.895434956251, 0.656618388603, 0.0133077078736),
-            (0.746031746032, 0.89665244983, 0.681616511604, 0.0138477282374),
-            (0.761904761905, 0.897531240228, 0.706471778936, 0.0146889128057),
-            (0.777777777778, 0.898063176628, 0.731206482064, 0.0158451011466),
-            (0.793650793651, 0.898239612652, 0.755839773918, 0.0173301328282),
-            (0.809523809524, 0.89805136309, 0.780388208579, 0.0191578474186),
-            (0.825396825397, 0.897488655734, 0.804866170399, 0.0213420844859),
-            (0.84126984127, 0.896541077606, 0.829286218697, 0.0238966835982),
-            (0.857142857143, 0.913697911059, 0.845646813981, 0.222765707352),
-            (0.873015873016, 0.929653817018, 0.862126431003, 0.33192044996),
-            (0.888888888889, 0.944238596146, 0.878764667333, 0.425002143402),
-            (0.904761904762, 0.957362272625, 0.895566343629, 0.511514604922),
-            (0.920634920635, 0.968933860547, 0.912535569382, 0.594836247911),
-            (0.936507936508, 0.978859451813, 0.929675808036, 0.676549211736),
-            (0.952380952381, 0.987040267732, 0.946989936457, 0.757507161315),
-            (0.968253968254, 0.993370582651, 0.964480299321, 0.838212075166),
-            (0.984126984127, 0.997735414612, 0.982148758928, 0.918976236288),
-            (1.0, 1.0, 1.0, 1.0),
-            ]),
-        ("ExtendedBlackbody", [
-            (0.0, 0.0, 0.0, 0.0),
-            (0.015873015873, 0.0410204653528, 0.0125357909278, 0.0689109347353),
-            (0.031746031746, 0.0728292511021, 0.0251074193759, 0.111084701438),
-            (0.047619047619, 0.0914725053853, 0.0382924505445, 0.150828141972),
-            (0.0634920634921, 0.103435457753, 0.0498523739394, 0.192399506279),
-            (0.0793650793651, 0.11697787554, 0.0553384939223, 0.235590084984),
-            (0.0952380952381, 0.13106897058, 0.0574858157959, 0.28012851826),
-            (0.111111111111, 0.14451899335, 0.0588070736298, 0.325831740794),
-            (0.126984126984, 0.157365748413, 0.0592310259517, 0.372622130916),
-            (0.142857142857, 0.169638222229, 0.0586571629275, 0.420432193125),
-            (0.15873015873, 0.181358128671, 0.0569469344531, 0.469202864472),
-            (0.174603174603, 0.192541718123, 0.053903275425, 0.518882124122),
-            (0.190476190476, 0.203200974518, 0.049231841621, 0.569423844856),
-            (0.206349206349, 0.213344430591, 0.0424592716177, 0.620786858997),
-            (0.222222222222, 0.22885083664, 0.0323118386732, 0.667716252697),
-            (0.238095238095, 0.263917734376, 0.0170229151511, 0.696700251951),
-            (0.253968253968, 0.297886776896, 0.0, 0.725911289487),
-            (0.269841269841, 0.331147696924, 0.0, 0.755344187716),
-            (0.285714285714, 0.363946896841, 0.0, 0.784994035048),
-            (0.301587301587, 0.396448879507, 0.0, 0.814856165251),
-            (0.31746031746, 0.428767984311, 0.0, 0.844926138887),
-            (0.333333333333, 0.460986165649, 0.0, 0.875199726605),
-            (0.349206349206, 0.509059764325, 0.0, 0.874878090633),
-            (0.365079365079, 0.586657040025, 0.0, 0.788483458434),
-            (0.380952380952, 0.647525018598, 0.0, 0.703448899692),
-            (0.396825396825, 0.697310408138, 0.0, 0.61974037226),
-            (0.412698412698, 0.739133997894, 0.0, 0.53725751376),
-            (0.428571428571, 0.774966161238, 0.0, 0.455769190891),
-            (0.444444444444, 0.806168536879, 0.0, 0.374768042226),
-            (0.460317460317, 0.833747021783, 0.0227410599117, 0.293092362571),
-            (0.47619047619, 0.854040299862, 0.09354692431, 0.239815658098),
-            (0.492063492063, 0.86584929908, 0.151233844244, 0.239392814342),
-            (0.507936507937, 0.877555741581, 0.194962727652, 0.23874888687),
-            (0.52380952381, 0.889160050233, 0.232289833256, 0.237874380272),
-            (0.539682539683, 0.900662633109, 0.265865002202, 0.236758898038),
-            (0.555555555556, 0.912063883111, 0.296966217671, 0.235391010074),
-            (0.571428571429, 0.923364177686, 0.326317530516, 0.233758094872),
-            (0.587301587302, 0.934563878629, 0.354372124996, 0.231846149973),
-            (0.603174603175, 0.945663331952, 0.381433685093, 0.229639562377),
-            (0.619047619048, 0.956662867807, 0.407716114152, 0.227120827894),
-            (0.634920634921, 0.96756280046, 0.433375921467, 0.224270204635),
-            (0.650793650794, 0.978363428298, 0.458531111592, 0.22106528053),
-            (0.666666666667, 0.975483038855, 0.493783717836, 0.21455014879),
-            (0.68253968254, 0.97122066712, 0.528209235633, 0.20714036059),
-            (0.698412698413, 0.966451052441, 0.56138151885, 0.198927581099),
-            (0.714285714286, 0.961153380556, 0.593535622168, 0.189790175914),
-            (0.730158730159, 0.955305133435, 0.624849458821, 0.17956891477),
-            (0.746031746032, 0.948881871951, 0.655461076484, 0.168048219356),
-            (0.761904761905, 0.941856982438, 0.685479806242, 0.154923356801),
-            (0.777777777778, 0.934201379395, 0.714993736449, 0.139738100068),
-            (0.793650793651, 0.925883154566, 0.744074884731, 0.121752089424),
-            (0.809523809524, 0.916867159951, 0.772782874939, 0.0996076368025),
-            (0.825396825397, 0.907114508751, 0.801167612557, 0.0702264586709),
-            (0.84126984127, 0.896581973444, 0.829271271014, 0.0241364485172),
-            (0.857142857143, 0.913697911059, 0.845646813981, 0.222765707352),
-            (0.873015873016, 0.929653817018, 0.862126431003, 0.33192044996),
-            (0.888888888889, 0.944238596146, 0.878764667333, 0.425002143402),
-            (0.904761904762, 0.957362272625, 0.895566343629, 0.511514604922),
-            (0.920634920635, 0.968933860547, 0.912535569382, 0.594836247911),
-            (0.936507936508, 0.978859451813, 0.929675808036, 0.676549211736),
-            (0.952380952381, 0.987040267732, 0.946989936457, 0.757507161315),
-            (0.968253968254, 0.993370582651, 0.964480299321, 0.838212075166),
-            (0.984126984127, 0.997735414612, 0.982148758928, 0.918976236288),
-            (1.0, 1.0, 1.0, 1.0),
-            ]),
-        ("Kindlmann", [
-            (0.0, 0.0, 0.0, 0.0),
-            (0.015873015873, 0.0671185329588, 0.00322224968401, 0.0636827982308),
-            (0.031746031746, 0.107829620358, 0.00527193539053, 0.110584717909),
-            (0.047619047619, 0.132822207081, 0.00761865377028, 0.158685364855),
-            (0.0634920634921, 0.150658364632, 0.00977706834929, 0.204368743721),
-            (0.0793650793651, 0.164513703673, 0.0117840704797, 0.246150470866),
-            (0.0952380952381, 0.17635738249, 0.0136716834002, 0.287096916371),
-            (0.111111111111, 0.186956701473, 0.0157459008722, 0.330140235882),
-            (0.126984126984, 0.196609134947, 0.0179376087423, 0.374519096987),
-            (0.142857142857, 0.2058836328, 0.0200081348995, 0.419451331093),
-            (0.15873015873, 0.215553664962, 0.0221102465109, 0.463608665805),
-            (0.174603174603, 0.226519452924, 0.0241216136235, 0.506117428928),
-            (0.190476190476, 0.239514530077, 0.0260436809284, 0.546294801685),
-            (0.206349206349, 0.250904916966, 0.0280614987688, 0.588999620164),
-            (0.222222222222, 0.249817749702, 0.0308415106025, 0.646402205149),
-            (0.238095238095, 0.214242447671, 0.0350037426956, 0.732877018055),
-            (0.253968253968, 0.0580253778952, 0.0728643854324, 0.831022738042),
-            (0.269841269841, 0.0367499971596, 0.164763702978, 0.770392363186),
-            (0.285714285714, 0.0335272327849, 0.22111999029, 0.703052629353),
-            (0.301587301587, 0.0307269848338, 0.262580080746, 0.640328823938),
-            (0.31746031746, 0.0281909469934, 0.295692282825, 0.584878656573),
-            (0.333333333333, 0.0256345140463, 0.323638967672, 0.537652138675),
-            (0.349206349206, 0.0239684879129, 0.348256161303, 0.498334574679),
-            (0.365079365079, 0.0224741887644, 0.370718323302, 0.466267149604),
-            (0.380952380952, 0.0213578271529, 0.391778498521, 0.440286960104),
-            (0.396825396825, 0.0203201805033, 0.411937775621, 0.419241969322),
-            (0.412698412698, 0.0208128086974, 0.431596539161, 0.400454861389),
-            (0.428571428571, 0.021854471454, 0.451151641812, 0.380313980138),
-            (0.444444444444, 0.0230712391057, 0.470629535023, 0.358711501755),
-            (0.460317460317, 0.0233722345904, 0.490071489565, 0.335491504837),
-            (0.47619047619, 0.0249491579525, 0.509419733567, 0.310616410835),
-            (0.492063492063, 0.0254113583837, 0.528747638664, 0.283789671987),
-            (0.507936507937, 0.0265511754015, 0.548001432252, 0.255097177506),
-            (0.52380952381, 0.0275272678001, 0.56719680403, 0.224620515107),
-            (0.539682539683, 0.0288835693814, 0.586306830784, 0.193022962508),
-            (0.555555555556, 0.0289206421838, 0.605358177366, 0.161427264774),
-            (0.571428571429, 0.0298263835637, 0.624285254063, 0.133059337268),
-            (0.587301587302, 0.0308293566636, 0.643105492554, 0.112622799332),
-            (0.603174603175, 0.0316208723034, 0.661869577571, 0.102453272786),
-            (0.619047619048, 0.0331152985419, 0.68067601948, 0.0949485127762),
-            (0.634920634921, 0.0345435219144, 0.699700412917, 0.0699256651954),
-            (0.650793650794, 0.0857184757511, 0.717719140782, 0.0342188050111),
-            (0.666666666667, 0.175139323574, 0.733108825242, 0.0350250894642),
-            (0.68253968254, 0.251518174426, 0.747272852278, 0.0360866952214),
-            (0.698412698413, 0.32393651684, 0.760140598481, 0.0363956325921),
-            (0.714285714286, 0.395075620074, 0.771599170072, 0.0373892404385),
-            (0.730158730159, 0.465330965142, 0.781654750673, 0.0372943827485),
-            (0.746031746032, 0.535176000781, 0.790252205312, 0.0377717872748),
-            (0.761904761905, 0.604490052123, 0.797425818444, 0.037983205084),
-            (0.777777777778, 0.673240541923, 0.803195625374, 0.0389751481252),
-            (0.793650793651, 0.741211512026, 0.807646935033, 0.0389840587975),
-            (0.809523809524, 0.809722616014, 0.810405609028, 0.0389139062698),
-            (0.825396825397, 0.884677097587, 0.809315141207, 0.0422072429217),
-            (0.84126984127, 0.961041572569, 0.804311591633, 0.182431699323),
-            (0.857142857143, 0.976621102575, 0.813785197546, 0.509571446188),
-            (0.873015873016, 0.982984770875, 0.829568990311, 0.644079693295),
-            (0.888888888889, 0.987002084869, 0.848098160851, 0.728496452077),
-            (0.904761904762, 0.9899438027, 0.868188821379, 0.789375598354),
-            (0.920634920635, 0.992130297633, 0.889285349012, 0.837111330813),
-            (0.936507936508, 0.993977903803, 0.91097796791, 0.876642196307),
-            (0.952380952381, 0.995740780243, 0.932999641601, 0.91092373222),
-            (0.968253968254, 0.997106329898, 0.955300428452, 0.942209465159),
-            (0.984126984127, 0.998512698466, 0.977660727116, 0.971567030755),
-            (1.0, 1.0, 1.0, 1.0),
-            ]),
-        ("ExtendedKindlmann", [
-            (0.0, 0.0, 0.0, 0.0),
-            (0.015873015873, 0.0665872190856, 0.00317348530238, 0.0660895850313),
-            (0.031746031746, 0.105381244894, 0.00562454296989, 0.117187973649),
-            (0.047619047619, 0.126123053183, 0.00837798019045, 0.174964238809),
-            (0.0634920634921, 0.137680744083, 0.0110625831087, 0.231566300512),
-            (0.0793650793651, 0.145039082102, 0.013451479997, 0.282277543576),
-            (0.0952380952381, 0.152044276014, 0.0156859399984, 0.327623693074),
-            (0.111111111111, 0.161138270143, 0.0176484986723, 0.369879578682),
-            (0.126984126984, 0.172685805995, 0.0195648094698, 0.409048640995),
-            (0.142857142857, 0.165244050347, 0.0224832200874, 0.47021606479),
-            (0.15873015873, 0.0279918458412, 0.0373112977636, 0.583889898993),
-            (0.174603174603, 0.0238593181565, 0.127541825162, 0.499528856699),
-            (0.190476190476, 0.0202386790283, 0.173243934499, 0.422468500932),
-            (0.206349206349, 0.0172147086694, 0.204326250648, 0.360918661076),
-            (0.222222222222, 0.0151405787086, 0.228521481166, 0.315024556602),
-            (0.238095238095, 0.0137064006539, 0.249278518333, 0.281945765499),
-            (0.253968253968, 0.0130509562483, 0.268304082234, 0.257774660955),
-            (0.269841269841, 0.0139459196116, 0.286752940039, 0.234259017963),
-            (0.285714285714, 0.0147354562034, 0.305005386829, 0.208719146502),
-            (0.301587301587, 0.0155954467859, 0.323085920627, 0.180811206659),
-            (0.31746031746, 0.0164494399433, 0.341015039205, 0.150220485094),
-            (0.333333333333, 0.0172595614171, 0.358784804599, 0.117294366612),
-            (0.349206349206, 0.0182093863706, 0.376357630368, 0.0845231419061),
-            (0.365079365079, 0.0190863651751, 0.3937190206, 0.059250497456),
-            (0.380952380952, 0.0200967930623, 0.410922707788, 0.049733608345),
-            (0.396825396825, 0.020763380415, 0.428313466899, 0.0314984637501),
-            (0.412698412698, 0.0813196226022, 0.443521025455, 0.0212422538125),
-            (0.428571428571, 0.154492186368, 0.456128474882, 0.0218404104551),
-            (0.444444444444, 0.22436299475, 0.466598243329, 0.0224293240327),
-            (0.460317460317, 0.293165415215, 0.474818917034, 0.0228389362808),
-            (0.47619047619, 0.361087617102, 0.480786997283, 0.0230247509697),
-            (0.492063492063, 0.427869336004, 0.484593045332, 0.0230890727087),
-            (0.507936507937, 0.494710180878, 0.485909764738, 0.0239295955349),
-            (0.52380952381, 0.571030341606, 0.481000290069, 0.027614468239),
-            (0.539682539683, 0.659238616311, 0.466351530046, 0.0317364210825),
-            (0.555555555556, 0.759019086035, 0.437421423072, 0.036400614635),
-            (0.571428571429, 0.866948968961, 0.388363362964, 0.0413685026023),
-            (0.587301587302, 0.956773664209, 0.334498978088, 0.0929916734685),
-            (0.603174603175, 0.962500599909, 0.364829931363, 0.213272013492),
-            (0.619047619048, 0.96531706949, 0.39732820503, 0.272635650325),
-            (0.634920634921, 0.968204554641, 0.427383873897, 0.332558246158),
-            (0.650793650794, 0.972456233298, 0.452132993621, 0.42362405976),
-            (0.666666666667, 0.974924322329, 0.475311962572, 0.523734287229),
-            (0.68253968254, 0.975989878868, 0.497598275123, 0.620461989691),
-            (0.698412698413, 0.977020548467, 0.518704726869, 0.710319751135),
-            (0.714285714286, 0.978023338129, 0.539236804307, 0.792434027154),
-            (0.730158730159, 0.978917589225, 0.559781782268, 0.866134059622),
-            (0.746031746032, 0.979938765414, 0.580626873885, 0.930969250325),
-            (0.761904761905, 0.973007886008, 0.607681188528, 0.981198138945),
-            (0.777777777778, 0.933324131326, 0.657798954369, 0.983583414204),
-            (0.793650793651, 0.908309474089, 0.697018458541, 0.985524181948),
-            (0.809523809524, 0.894668785948, 0.729537811457, 0.987056417428),
-            (0.825396825397, 0.889934261241, 0.757640205324, 0.988334733592),
-            (0.84126984127, 0.892048970738, 0.782727772582, 0.989640628941),
-            (0.857142857143, 0.898924549826, 0.805934065795, 0.990584977084),
-            (0.873015873016, 0.908996109804, 0.827911240696, 0.991685867082),
-            (0.888888888889, 0.916820311909, 0.850623202421, 0.992856600763),
-            (0.904761904762, 0.920183803811, 0.874775808751, 0.99393928426),
-            (0.920634920635, 0.921584746406, 0.899420945982, 0.9951557335),
-            (0.936507936508, 0.923619461565, 0.923730853729, 0.996269632514),
-            (0.952380952381, 0.928399919483, 0.947174005275, 0.996489083038),
-            (0.968253968254, 0.937779381782, 0.969167619817, 0.996973557569),
-            (0.984126984127, 0.95568711212, 0.988614720577, 0.997872974429),
-            (1.0, 1.0, 1.0, 1.0),
-            ]),
-    ])
+    @property
+    def _data(self):
+        return _load_palettes("linear.json")
+
+    _cache = {}
 
 
 linear = LinearFactory()
@@ -3130,20 +1133,22 @@ class DivergingFactory(object):
         """Return a list of available map names."""
         return [name for name in sorted(self._data.keys())]
 
-    def map(self, name, domain_min=None, domain_max=None):
+    def map(self, name, domain_min=None, domain_max=None, lut=None):
         """Construct a named :py:class:`toyplot.color.DivergingMap` instance.
 
         Parameters
         ----------
         name: :class:`str`
           The name of the map.  Use :py:meth:`toyplot.color.DivergingFactory.names` to retrieve a list of available names.
+        lut: integer, optional
+          If specified, the map will use a lookup table with this many entries.
 
         Returns
         -------
         map: :class:`toyplot.color.DivergingMap`
         """
         low, high = self._data[name]
-        return DivergingMap(low, high, domain_min, domain_max)
+        return DivergingMap(low, high, domain_min, domain_max, lut)
 
     def maps(self):
         """Return a (name, colormap) tuple for every map in the collection.
@@ -3175,26 +1180,140 @@ def to_css(color):
     Parameters
     ----------
     color: :class:`numpy.ndarray`
-        Array of RGBA values with dtype = :data:`toyplot.color.dtype`, which is converted to a CSS rgba() color.
+        Array of RGBA values with dtype = :data:`toyplot.color.dtype` or :data:`toyplot.color.packed_dtype`, which is converted to a CSS rgba() color.
 
     Returns
     -------
     css: :class:`str` containing a CSS color value.
       """
+    if color.dtype == packed_dtype:
+        color = unpack(color)
     return "rgba(%.1f%%,%.1f%%,%.1f%%,%.3f)" % (color["r"] * 100, color["g"] * 100, color["b"] * 100, color["a"])
 
 
+def pack(colors):
+    """Convert Toyplot colors to the compact :data:`toyplot.color.packed_dtype` representation.
+
+    Each channel is rounded to the nearest of 256 levels, so converting packed
+    colors with :func:`toyplot.color.unpack` and packing them again is lossless.
+
+    Parameters
+    ----------
+    colors: :class:`numpy.ndarray`
+        Array of RGBA values with dtype = :data:`toyplot.color.dtype` or :data:`toyplot.color.packed_dtype`.
+
+    Returns
+    -------
+    colors: :class:`numpy.ndarray` with dtype = :data:`toyplot.color.packed_dtype` and the same shape as `colors`.
+    """
+    colors = numpy.asarray(colors)
+    if colors.dtype == packed_dtype:
+        return colors
+    result = numpy.empty(colors.shape, dtype=packed_dtype)
+    for channel in ["r", "g", "b", "a"]:
+        result[channel] = numpy.rint(numpy.clip(colors[channel], 0, 1) * 255)
+    return result
+
+
+def unpack(colors):
+    """Convert packed colors to Toyplot colors with dtype = :data:`toyplot.color.dtype`.
+
+    Parameters
+    ----------
+    colors: :class:`numpy.ndarray`
+        Array of RGBA values with dtype = :data:`toyplot.color.packed_dtype` or :data:`toyplot.color.dtype`.
+
+    Returns
+    -------
+    colors: :class:`numpy.ndarray` with dtype = :data:`toyplot.color.dtype` and the same shape as `colors`.
+    """
+    colors = numpy.asarray(colors)
+    if colors.dtype == dtype:
+        return colors
+    result = numpy.empty(colors.shape, dtype=dtype)
+    for channel in ["r", "g", "b", "a"]:
+        result[channel] = colors[channel] / 255.0
+    return result
+
+
+def to_css_array(colors):
+    """Convert an array of Toyplot colors to CSS strings.
+
+    Identical colors are formatted once, so this is much faster than calling
+    :func:`toyplot.color.to_css` for every color in a large array.
+
+    Parameters
+    ----------
+    colors: :class:`numpy.ndarray`
+        Array of RGBA values with dtype = :data:`toyplot.color.dtype` or :data:`toyplot.color.packed_dtype`.
+
+    Returns
+    -------
+    css: :class:`numpy.ndarray` of :class:`str` CSS color values, with the same shape as `colors`.
+    """
+    colors = numpy.asarray(colors)
+    if colors.ndim == 1 and len(colors) > 1 and colors.strides[0] == 0: # A single repeated color.
+        result = numpy.empty(1, dtype="object")
+        result[0] = to_css(colors[0])
+        return numpy.broadcast_to(result, colors.shape)
+    flat = numpy.ascontiguousarray(colors.ravel())
+    if colors.dtype == packed_dtype:
+        distinct, inverse = numpy.unique(flat.view("uint32"), return_inverse=True)
+        distinct = unpack(distinct.view(packed_dtype))
+    else:
+        flat = flat.astype(dtype)
+        distinct, inverse = numpy.unique(flat.view((numpy.void, flat.dtype.itemsize)), return_inverse=True)
+        distinct = distinct.view(dtype)
+    result = numpy.empty(len(distinct), dtype="object")
+    result[...] = ["rgba(%.1f%%,%.1f%%,%.1f%%,%.3f)" % (r * 100, g * 100, b * 100, a) for r, g, b, a in distinct.tolist()]
+    return result[inverse].reshape(colors.shape)
+
+
 def css(value):
     """Construct a Toyplot color from a CSS string.
 
+    Parsed colors are stored in a bounded, process-wide cache, so repeatedly
+    parsing the same string is inexpensive.
+
     Parameters
     ----------
     value: :class:`str`
 
     Returns
     -------
-    color: :class:`numpy.ndarray` scalar containing RGBA values with dtype = :data:`toyplot.color.dtype`.
+    color: :class:`numpy.ndarray` scalar containing RGBA values with dtype = :data:`toyplot.color.dtype`,
+    or None if the string isn't a valid CSS color.
+    """
+    color = css.cache.lookup(value, _css)
+    return None if color is None else color.copy()
+
+
+def css_array(values):
+    """Construct an array of Toyplot colors from an array of CSS strings.
+
+    Identical strings are grouped, so that each distinct string is parsed only
+    once, using the same cache as :func:`toyplot.color.css`.
+
+    Parameters
+    ----------
+    values: array-like collection of :class:`str`
+
+    Returns
+    -------
+    colors: :class:`numpy.ndarray` containing RGBA values with dtype = :data:`toyplot.color.dtype` and the same shape as `values`.
     """
+    values = numpy.asarray(values)
+    distinct, inverse = numpy.unique(values.ravel(), return_inverse=True)
+    colors = numpy.empty(len(distinct), dtype=dtype)
+    for index, value in enumerate(distinct):
+        color = css.cache.lookup(value, _css)
+        if color is None:
+            raise ValueError("Expected a CSS color string, received %r." % value)
+        colors[index] = color
+    return colors[inverse].reshape(values.shape)
+
+
+def _css(value):
     if value.lower() in css.names:
         color = css.names[value.lower()]
         return rgba(color[0] / 255.0, color[1] / 255.0, color[2] / 255.0, 1.0)
@@ -3246,6 +1365,7 @@ def css(value):
         r, g, b = colorsys.hls_to_rgb((h / 360.0) % 1, l / 100.0, s / 100.0)
         return rgba(r, g, b, a)
 
+css.cache = toyplot.cache.LRU(maxsize=4096)
 css.hex3 = re.compile(r"^#([\da-f])([\da-f])([\da-f])$", re.I).match
 css.hex6 = re.compile(r"^#([\da-f]{2})([\da-f]{2})([\da-f]{2})$", re.I).match
 css.rgb = re.compile(r"rgb\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\)").match
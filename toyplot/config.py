@@ -22,3 +22,11 @@ width = None
 
 height = None
 """Default value for the :class:`toyplot.canvas.Canvas` height."""
+
+layout_cache = None
+"""Optional :class:`toyplot.cache.LRU` instance used by :func:`toyplot.layout.graph` to store and reuse graph layouts.
+
+Caching is disabled by default.  Layouts are keyed on the graph topology,
+vertex ids, supplied coordinates, and layout parameters.  Use the cache
+`directory` parameter to persist layouts across processes.
+"""
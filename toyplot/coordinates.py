@@ -12,6 +12,7 @@ import itertools
 
 import numpy
 import six
+from six.moves import collections_abc
 
 import toyplot.broadcast
 import toyplot.color
@@ -30,6 +31,13 @@ def _mark_exportable(table, column, exportable=True):
     table.metadata(column)["toyplot:exportable"] = exportable
 
 
+def _spool(value):
+    # Iterators are treated as a sequence of chunks, spooled to temporary storage.
+    if isinstance(value, collections_abc.Iterator):
+        return toyplot.data.spool(value)
+    return value
+
+
 def _opposite_location(location):
     return "above" if location == "below" else "below"
 
@@ -1582,7 +1590,9 @@ class Cartesian(object):
             c=None,
             olayout=None,
             layout=None,
+            owarm=False,
             along="x",
+            ebundle=False,
             ecolor=None,
             efilename=None,
             eopacity=1.0,
@@ -1609,12 +1619,18 @@ class Cartesian(object):
 
         Parameters
         ----------
+        ebundle: boolean, optional
+            If True, edges with identical geometry and style are drawn as a
+            single path whose stroke width is the sum of their widths, and
+            edges aren't clipped to vertex markers.  Use with
+            :class:`toyplot.layout.BundledEdges` to reduce the size of dense
+            graphs.  The edge data table still contains every edge.
 
         Returns
         -------
         plot: :class:`toyplot.mark.Graph`
         """
-        layout = toyplot.layout.graph(a, b, c, olayout=olayout, layout=layout, vcoordinates=vcoordinates)
+        layout = toyplot.layout.graph(a, b, c, olayout=olayout, layout=layout, vcoordinates=vcoordinates, owarm=owarm)
 
         along = toyplot.require.value_in(along, ["x", "y"])
 
@@ -1704,6 +1720,7 @@ class Cartesian(object):
         return self.add_mark(
             toyplot.mark.Graph(
                 coordinate_axes=coordinate_axes,
+                ebundle=ebundle,
                 ecolor=["color"],
                 ecoordinates=layout.ecoordinates,
                 efilename=efilename,
@@ -1817,6 +1834,9 @@ class Cartesian(object):
           If `a` and `b` are provided, they specify the first and second
           coordinates respectively of each point in the plot.  If only `a` is provided, it
           provides second coordinates, and the first coordinates will range from [0, N).
+          Either may be an iterator that yields chunks of data, which will be
+          spooled to temporary storage using :func:`toyplot.data.spool`.
+          Memory-mapped arrays are used without copying.
         along: string, optional
           Controls the mapping from coordinates to axes.  When set to "x" (the default),
           first and second coordinates map to the X and Y axes.  When set to "y", the
@@ -1859,19 +1879,21 @@ class Cartesian(object):
         mark: :class:`toyplot.mark.Plot`
         """
         along = toyplot.require.value_in(along, ["x", "y"])
+        a = _spool(a)
+        b = _spool(b)
 
         if a is not None and b is not None:
             position = toyplot.require.scalar_vector(a)
             b = toyplot.require.scalar_array(b)
             if b.ndim == 1:
                 b = toyplot.require.scalar_vector(b, len(position))
-                series = numpy.ma.column_stack((b,))
+                series = b.reshape((-1, 1))
             elif b.ndim == 2:
                 series = toyplot.require.scalar_matrix(b, rows=len(position))
         else:
             a = toyplot.require.scalar_array(a)
             if a.ndim == 1:
-                series = numpy.ma.column_stack((a,))
+                series = a.reshape((-1, 1))
                 position = numpy.ma.arange(series.shape[0])
             elif a.ndim == 2:
                 series = a
@@ -2044,6 +2066,9 @@ class Cartesian(object):
           If `a` and `b` are provided, they specify the X coordinates and Y
           coordinates of each point in the plot.  If only `a` is provided, it
           specifies the Y coordinates, and the X coordinates will range from [0, N).
+          Either may be an iterator that yields chunks of data, which will be
+          spooled to temporary storage using :func:`toyplot.data.spool`.
+          Memory-mapped arrays are used without copying.
         title: string, optional
           Human-readable title for the mark.  The SVG / HTML backends render the
           title as a tooltip.
@@ -2055,22 +2080,24 @@ class Cartesian(object):
         plot: :class:`toyplot.mark.Plot`
         """
         along = toyplot.require.value_in(along, ["x", "y"])
+        a = _spool(a)
+        b = _spool(b)
 
         if a is not None and b is not None:
             position = toyplot.require.scalar_vector(a)
-            b = numpy.ma.array(b).astype("float64")
+            b = toyplot.require.scalar_array(b)
             if b.ndim == 0:
                 b = toyplot.require.scalar_vector(b, len(position))
-                series = numpy.ma.column_stack((b,))
+                series = b.reshape((-1, 1))
             elif b.ndim == 1:
                 b = toyplot.require.scalar_vector(b, len(position))
-                series = numpy.ma.column_stack((b,))
+                series = b.reshape((-1, 1))
             elif b.ndim == 2:
                 series = toyplot.require.scalar_matrix(b, rows=len(position))
         else:
-            a = numpy.ma.array(a).astype("float64")
+            a = toyplot.require.scalar_array(a)
             if a.ndim == 1:
-                series = numpy.ma.column_stack((a,))
+                series = a.reshape((-1, 1))
                 position = numpy.ma.arange(series.shape[0])
             elif a.ndim == 2:
                 series = a
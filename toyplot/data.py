@@ -7,23 +7,39 @@
 from __future__ import division
 
 import collections
-import itertools
 import numbers
 import os
 import sys
+import tempfile
 import xml.etree.ElementTree as xml
 
 import numpy
-try:
-    import pandas
-except: # pragma: no cover
-    pass
 import six
 
 import toyplot.color
 
 _data_dir = os.path.abspath(os.path.dirname(__file__))
 
+_block_size = 1048576
+
+
+def blocks(count, size=None):
+    """Generate slices that partition a range of rows into fixed-size blocks.
+
+    Used to process large (including memory-mapped) arrays in bounded memory.
+
+    Parameters
+    ----------
+    count: integer
+        Total number of rows.
+    size: integer, optional
+        Maximum number of rows in each block.  Defaults to :math:`2^{20}`.
+    """
+    size = _block_size if size is None else size
+    for begin in range(0, count, size):
+        yield slice(begin, min(begin + size, count))
+
+
 def minimax(items):
     """Compute the minimum and maximum of an arbitrary collection of scalar- or array-like items.
 
@@ -32,6 +48,9 @@ def minimax(items):
     values, and empty arrays are all handled correctly.  Returns `(None, None)`
     if the inputs don't contain any usable values.
 
+    Large arrays are processed in blocks, so memory-mapped arrays can be
+    handled without loading them into memory.
+
     Returns
     -------
     min: minimum value of the input arrays, or None.
@@ -41,57 +60,295 @@ def minimax(items):
     group_max = None
 
     for item in items:
-        item_min = None
-        item_max = None
         if isinstance(item, toyplot.data.Table):
             raise ValueError("toyplot.data.Table is not allowed.") # pragma: no cover
         elif isinstance(item, numpy.ma.MaskedArray):
             pass
         elif isinstance(item, numpy.ndarray):
-            item = numpy.ma.array(item)
+            item = numpy.ma.array(item, copy=False)
         elif item is None:
             item = numpy.ma.array([])
         else:
             item = numpy.ma.array([item])
 
-        # Ignore null values
-        selection = numpy.ma.getmaskarray(item)
-        # Ignore NaN values
-        if issubclass(item.dtype.type, numpy.number):
-            selection = numpy.logical_or(selection, numpy.isnan(item).data)
-        selection = numpy.logical_not(selection)
-        if numpy.count_nonzero(selection):
-            item_min = item[selection].min()
-            item_max = item[selection].max()
-
-        if group_min is None:
-            group_min = item_min
-        else:
-            if item_min is not None:
-                group_min = min(group_min, item_min)
+        if item.ndim == 0:
+            item = item.reshape((1,))
+
+        for block in blocks(item.shape[0]):
+            block = item[block]
+            block_min = None
+            block_max = None
+
+            # Ignore null values
+            selection = numpy.ma.getmaskarray(block)
+            # Ignore NaN values
+            if issubclass(block.dtype.type, numpy.number):
+                selection = numpy.logical_or(selection, numpy.isnan(block).data)
+            selection = numpy.logical_not(selection)
+            if numpy.count_nonzero(selection):
+                block_min = block[selection].min()
+                block_max = block[selection].max()
+
+            if group_min is None:
+                group_min = block_min
+            else:
+                if block_min is not None:
+                    group_min = min(group_min, block_min)
 
-        if group_max is None:
-            group_max = item_max
-        else:
-            if item_max is not None:
-                group_max = max(group_max, item_max)
+            if group_max is None:
+                group_max = block_max
+            else:
+                if block_max is not None:
+                    group_max = max(group_max, block_max)
 
     return group_min, group_max
 
 
+def spool(chunks, dtype="float64"):
+    """Concatenate a sequence of array chunks into temporary memory-mapped storage.
+
+    Use this to plot data that is too large to fit in memory, or that is
+    generated incrementally.  Only one chunk is held in memory at a time, and
+    the result can be passed to :meth:`toyplot.coordinates.Cartesian.plot` or
+    :meth:`toyplot.coordinates.Cartesian.scatterplot` without copying.  Those
+    methods call this function automatically when given an iterator.
+
+    Parameters
+    ----------
+    chunks: iterable of array-like values
+        The chunks to concatenate along their first axis.  Every chunk must
+        have the same trailing dimensions.
+    dtype: numpy dtype, optional
+        Data type of the result.  Masked values are stored as NaN, which
+        requires a floating point type.
+
+    Returns
+    -------
+    array: :class:`numpy.memmap` backed by an anonymous temporary file, which
+    is deleted automatically.
+    """
+    stream = tempfile.TemporaryFile()
+    shape = None
+    count = 0
+    for chunk in chunks:
+        chunk = numpy.ma.asarray(chunk, dtype=dtype)
+        if numpy.ma.is_masked(chunk):
+            chunk = chunk.filled(numpy.nan)
+        chunk = numpy.ma.getdata(chunk)
+        if chunk.ndim == 0:
+            chunk = chunk.reshape((1,))
+        if shape is None:
+            shape = chunk.shape[1:]
+        if chunk.shape[1:] != shape:
+            raise ValueError("Expected chunks with shape (N,) + %s, received %s." % (shape, chunk.shape))
+        stream.write(numpy.ascontiguousarray(chunk).tobytes())
+        count += chunk.shape[0]
+    stream.flush()
+
+    shape = (count,) + (shape if shape is not None else ())
+    if count == 0:
+        return numpy.empty(shape, dtype=dtype)
+    return numpy.memmap(stream, dtype=dtype, mode="r", shape=shape)
+
+
 def contiguous(a):
     """Split an array into a collection of contiguous ranges.
+
+    Returns
+    -------
+    begin: :class:`numpy.ndarray` containing the first index of each range.
+    end: :class:`numpy.ndarray` containing one-past-the-last index of each range.
+    values: :class:`numpy.ndarray` containing the value shared by each range.
     """
-    i = 0
-    begin = []
-    end = []
-    values = []
-    for (value, group) in itertools.groupby(numpy.array(a).ravel()):
-        begin.append(i)
-        end.append(i + len(list(group)))
-        values.append(value)
-        i = end[-1]
-    return numpy.array(begin), numpy.array(end), numpy.array(values)
+    a = numpy.array(a).ravel()
+    if not len(a):
+        return numpy.array([], dtype="int64"), numpy.array([], dtype="int64"), a
+    changes = numpy.flatnonzero(a[1:] != a[:-1]) + 1
+    begin = numpy.concatenate(([0], changes))
+    end = numpy.concatenate((changes, [len(a)]))
+    return begin, end, a[begin]
+
+
+def segments(mask):
+    """Find the contiguous runs of `True` values in one or more boolean series.
+
+    Parameters
+    ----------
+    mask: array-like
+        :math:`M` boolean values for a single series, or an :math:`M \\times N`
+        matrix of boolean values for :math:`N` series.
+
+    Returns
+    -------
+    series: :class:`numpy.ndarray` containing the series index of each run.
+    begin: :class:`numpy.ndarray` containing the first index of each run.
+    end: :class:`numpy.ndarray` containing one-past-the-last index of each run.
+
+    Runs are ordered by series, then by position within the series.
+    """
+    mask = numpy.asarray(mask, dtype="bool")
+    if mask.ndim == 1:
+        mask = mask[:, numpy.newaxis]
+    if mask.ndim != 2:
+        raise ValueError("Expected one- or two-dimensional mask.")
+
+    # Pad every series with False, so that transitions alternate between the
+    # beginning and end of a run.
+    width = mask.shape[0] + 2
+    padded = numpy.zeros((mask.shape[1], width), dtype="bool")
+    padded[:, 1:-1] = mask.T
+    padded = padded.ravel()
+    transitions = numpy.flatnonzero(padded[1:] != padded[:-1])
+    series = transitions[0::2] // width
+    return series, transitions[0::2] % width, transitions[1::2] % width
+
+
+class Statistics(object):
+    """Summary statistics for one column of a :class:`toyplot.data.Table`.
+
+    Instances are created on-demand by :meth:`toyplot.data.Table.statistics`
+    and cached until the column is modified using the table.  Each statistic
+    is computed lazily the first time it is accessed.
+
+    Parameters
+    ----------
+    column: :class:`numpy.ma.MaskedArray`
+        The column to be summarized.
+    """
+
+    distinct_limit = 256
+    """Maximum number of distinct values stored by :attr:`distinct`."""
+
+    def __init__(self, column):
+        self._column = column
+        self._extent = None
+        self._null_count = None
+        self._sorted = None
+        self._distinct = False
+        self._categories = False
+
+    def _valid(self, block):
+        valid = numpy.logical_not(numpy.ma.getmaskarray(block))
+        if issubclass(block.dtype.type, numpy.number):
+            valid = numpy.logical_and(valid, numpy.logical_not(numpy.isnan(numpy.ma.getdata(block))))
+        return valid
+
+    @property
+    def extent(self):
+        """Minimum and maximum of the column, ignoring masked and NaN values.
+
+        Returns
+        -------
+        extent: (min, max) tuple, or (None, None) if the column doesn't contain any usable values.
+        """
+        if self._extent is None:
+            self._extent = minimax([self._column])
+        return self._extent
+
+    @property
+    def null_count(self):
+        """Number of masked or NaN values in the column."""
+        if self._null_count is None:
+            self._null_count = sum([len(self._column[block]) - numpy.count_nonzero(self._valid(self._column[block])) for block in blocks(len(self._column))])
+        return self._null_count
+
+    @property
+    def sorted(self):
+        """True if the column's non-null values are in nondecreasing order."""
+        if self._sorted is None:
+            self._sorted = True
+            previous = None
+            try:
+                for block in blocks(len(self._column)):
+                    block = self._column[block]
+                    block = numpy.ma.getdata(block)[self._valid(block)]
+                    if not len(block):
+                        continue
+                    if previous is not None and block[0] < previous:
+                        self._sorted = False
+                        break
+                    if numpy.any(block[1:] < block[:-1]):
+                        self._sorted = False
+                        break
+                    previous = block[-1]
+            except TypeError:
+                self._sorted = False
+        return self._sorted
+
+    @property
+    def distinct(self):
+        """Sorted array of the column's distinct non-null values.
+
+        Returns
+        -------
+        distinct: :class:`numpy.ndarray`, or None if the column contains more
+        than :attr:`distinct_limit` distinct values.
+        """
+        if self._distinct is False:
+            distinct = numpy.array([], dtype=self._column.dtype)
+            try:
+                for block in blocks(len(self._column)):
+                    block = self._column[block]
+                    block = numpy.ma.getdata(block)[self._valid(block)]
+                    distinct = numpy.unique(numpy.concatenate((distinct, numpy.unique(block))))
+                    if len(distinct) > self.distinct_limit:
+                        distinct = None
+                        break
+            except TypeError:
+                distinct = None
+            self._distinct = distinct
+        return self._distinct
+
+    @property
+    def categories(self):
+        """Dictionary encoding of the column.
+
+        Unlike :attr:`distinct`, the encoding includes None and other values
+        that can't be ordered, so it can be used with object columns such as
+        titles, hyperlinks, and markers.  Dictionary entries appear in the
+        order in which they are first encountered.
+
+        Returns
+        -------
+        categories: (codes, dictionary) tuple, where `codes` is an integer
+        array with one code per row, and `dictionary` is a :class:`numpy.ndarray`
+        of distinct values such that `dictionary[codes]` reproduces the column.
+        Masked rows are assigned code -1.  Returns None if the column contains
+        more than :attr:`distinct_limit` distinct values, or values that can't
+        be hashed.
+        """
+        if self._categories is False:
+            self._categories = None
+            data = numpy.ma.getdata(self._column)
+            if data.dtype == object:
+                codes = numpy.empty(len(data), dtype="int32")
+                lookup = {}
+                values = []
+                try:
+                    for index, value in enumerate(data):
+                        # Key on the type too, so that equal values of different
+                        # types (e.g. 1, 1.0, and True) get their own codes.
+                        key = (type(value), value)
+                        code = lookup.get(key)
+                        if code is None:
+                            if len(values) == self.distinct_limit:
+                                return None
+                            code = lookup[key] = len(values)
+                            values.append(value)
+                        codes[index] = code
+                except (AttributeError, TypeError):
+                    return None
+                dictionary = numpy.empty(len(values), dtype=object)
+                for index, value in enumerate(values):
+                    dictionary[index] = value
+            else:
+                if self.distinct is None:
+                    return None
+                dictionary, codes = numpy.unique(data, return_inverse=True)
+                codes = codes.astype("int32")
+            codes[numpy.ma.getmaskarray(self._column)] = -1
+            self._categories = (codes, dictionary)
+        return self._categories
 
 
 class Table(object):
@@ -126,6 +383,7 @@ class Table(object):
     def __init__(self, data=None, index=False):
         self._columns = collections.OrderedDict()
         self._metadata = collections.defaultdict(dict)
+        self._statistics = {}
 
         if data is not None:
             keys = None
@@ -155,7 +413,7 @@ class Table(object):
                 keys = [str(i) for i in numpy.arange(data.shape[1])]
                 values = [data[:, i] for i in numpy.arange(data.shape[1])]
             # Input data based on Pandas data structures.
-            elif "pandas" in sys.modules and isinstance(data, pandas.DataFrame):
+            elif "pandas" in sys.modules and isinstance(data, sys.modules["pandas"].DataFrame):
                 keys = [str(data.ix[:, i].name) for i in range(data.shape[1])]
                 values = [data.ix[:, i] for i in range(data.shape[1])]
 
@@ -264,17 +522,22 @@ class Table(object):
                     raise ValueError("Expected %s values, received %s." % (column.shape[0], value.shape[0]))
             column = six.text_type(index)
             self._columns[column] = value
+            self._statistics.pop(column, None)
             return
 
         if isinstance(index, tuple):
             if isinstance(index[0], six.string_types) and isinstance(index[1], (int, slice)):
                 column, column_slice = index
+                if not numpy.ma.getdata(self._columns[column]).flags.writeable: # Copy broadcast views on write.
+                    self._columns[column] = self._columns[column].copy()
                 self._columns[column][column_slice] = value
+                self._statistics.pop(column, None)
                 return
 
         raise ValueError("Unsupported key for assignment: %s" % (index,))
 
     def __delitem__(self, key):
+        self._statistics.pop(key, None)
         return self._columns.__delitem__(key)
 
     def __len__(self):
@@ -373,6 +636,28 @@ class Table(object):
             raise ValueError("Unknown column name '%s'" % column)
         return self._metadata[column]
 
+    def statistics(self, column):
+        """Return summary statistics for one of the table's columns.
+
+        Statistics are computed lazily, and cached until the column is modified
+        by assigning to or deleting it using the table.  Modifying a column's
+        array directly will not invalidate the cache.
+
+        Parameters
+        ----------
+        column: string.
+          The name of an existing column.
+
+        Returns
+        -------
+        statistics: :class:`toyplot.data.Statistics`
+        """
+        if column not in self._columns:
+            raise ValueError("Unknown column name '%s'" % column)
+        if column not in self._statistics:
+            self._statistics[column] = Statistics(self._columns[column])
+        return self._statistics[column]
+
     def matrix(self):
         """Convert the table to a matrix (2D numpy array).
 
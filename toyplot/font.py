@@ -7,6 +7,8 @@
 
 from __future__ import absolute_import
 
+import threading
+
 import custom_inherit
 import reportlab.pdfbase.pdfmetrics
 import six
@@ -110,9 +112,14 @@ class ReportlabFont(Font):
 
 
 class ReportlabLibrary(Library):
-    """Use Reportlab to provide information about standard PDF fonts."""
+    """Use Reportlab to provide information about standard PDF fonts.
+
+    Fonts are cached, so a single library can be shared, including between
+    threads; see :func:`toyplot.font.library`.
+    """
     def __init__(self):
         self._cache = dict()
+        self._lock = threading.Lock()
 
     def font(self, style):
         """
@@ -131,11 +138,12 @@ class ReportlabLibrary(Library):
 
             font_family = ReportlabLibrary.font._substitutions[font_family]
             key = (font_family, bold, italic, size)
-            if key not in self._cache:
-                family = ReportlabLibrary.font._font_table[(font_family, bold, italic)]
-                self._cache[key] = ReportlabFont(family, size)
+            with self._lock:
+                if key not in self._cache:
+                    family = ReportlabLibrary.font._font_table[(font_family, bold, italic)]
+                    self._cache[key] = ReportlabFont(family, size)
 
-            return self._cache[key]
+                return self._cache[key]
 
         raise ValueError("Unknown font family: %s" % style) # pragma: no cover
 
@@ -162,3 +170,15 @@ class ReportlabLibrary(Library):
         ("times", False, True): "Times-Italic",
         ("times", True, True): "Times-BoldItalic",
         }
+
+
+def library():
+    """Return the font library shared by all of Toyplot's text layout and rendering code.
+
+    Returns
+    -------
+    library: instance of :class:`toyplot.font.ReportlabLibrary`
+    """
+    return library.instance
+
+library.instance = ReportlabLibrary()
@@ -12,7 +12,6 @@ import base64
 import collections
 import copy
 import functools
-import itertools
 import json
 import string
 import uuid
@@ -23,10 +22,13 @@ import numpy
 import six
 
 import toyplot.bitmap
+import toyplot.broadcast
 import toyplot.coordinates
 import toyplot.canvas
 import toyplot.color
+import toyplot.data
 import toyplot.font
+import toyplot.layout
 import toyplot.mark
 import toyplot.marker
 import toyplot.text
@@ -404,15 +406,94 @@ def _css_attrib(*styles):
     return attrib
 
 
-def _flat_contiguous(a):
-    i = 0
-    result = []
-    for (k, g) in itertools.groupby(a.ravel()):
-        n = len(list(g))
-        if k:
-            result.append(slice(i, i + n))
-        i += n
-    return result
+def _series_segments(not_null):
+    """Split per-series runs of non-null values into one list of slices per series."""
+    series, begin, end = toyplot.data.segments(not_null)
+    bounds = numpy.searchsorted(series, numpy.arange(not_null.shape[1] + 1) if not_null.ndim == 2 else [0, 1])
+    return [[slice(b, e) for b, e in zip(begin[lower:upper], end[lower:upper])] for lower, upper in zip(bounds[:-1], bounds[1:])]
+
+
+def _convert_marker(value):
+    return toyplot.marker.convert(value) if value else None
+
+
+def _convert_title(value):
+    return None if value is None else str(value)
+
+
+def _decode(table, key, convert):
+    """Convert every value in a table column, converting each distinct value only once.
+
+    Uses the column's dictionary encoding when available, so rows with the same
+    value share a single converted object.  Masked rows are converted to None.
+    """
+    categories = table.statistics(key).categories
+    if categories is None:
+        column = table[key]
+        mask = numpy.ma.getmaskarray(column)
+        result = numpy.empty(len(column), dtype="object")
+        for index, value in enumerate(numpy.ma.getdata(column)):
+            result[index] = None if mask[index] else convert(value)
+        return result
+
+    codes, dictionary = categories
+    lookup = numpy.empty(len(dictionary) + 1, dtype="object")
+    for index, value in enumerate(dictionary):
+        lookup[index] = convert(value)
+    lookup[-1] = None
+    return lookup[codes]
+
+
+def _series_marker(table, keys, mstyle, lstyle):
+    """Create the marker shared by every datum in a series, if there is one.
+
+    When the marker, size, fill, stroke, and opacity columns of a series are
+    constant, renderers can create the marker and its style attributes once
+    per series, instead of once per datum.
+
+    Returns
+    -------
+    shared: (marker, attrib) tuple, or None if the columns vary.
+    """
+    if not len(table) or not all(toyplot.broadcast.is_constant(table[key]) for key in keys):
+        return None
+    marker, size, fill, stroke, opacity = [table[key][0] for key in keys]
+    marker = _convert_marker(marker)
+    if not marker:
+        return None
+    style = toyplot.style.combine(
+        {
+            "fill": toyplot.color.to_css(fill),
+            "stroke": toyplot.color.to_css(stroke),
+            "opacity": opacity,
+        },
+        mstyle)
+    marker = toyplot.marker.create(size=size, mstyle=style, lstyle=lstyle) + marker
+    return marker, _css_attrib(marker.mstyle)
+
+
+def _segment_path(x, y, segments, continued=False):
+    """Format polyline segments as SVG path data, starting each segment with a move command.
+
+    If `continued` is True and the first segment begins at index zero, it
+    continues a segment from a previous block of data instead.
+    """
+    if not segments:
+        return ""
+    begin = numpy.array([segment.start for segment in segments])
+    lengths = numpy.array([segment.stop - segment.start for segment in segments])
+    offsets = numpy.concatenate(([0], numpy.cumsum(lengths)[:-1]))
+    indices = numpy.arange(lengths.sum()) + numpy.repeat(begin - offsets, lengths)
+    commands = numpy.repeat("L", len(indices)).tolist()
+    for offset in offsets:
+        commands[offset] = "M"
+    if continued and begin[0] == 0:
+        commands[0] = "L"
+    return " ".join(["%s %r %r" % item for item in zip(
+        commands,
+        numpy.ma.getdata(x)[indices].tolist(),
+        numpy.ma.getdata(y)[indices].tolist(),
+        )])
 
 
 def _walk_tree(node):
@@ -445,8 +526,7 @@ def _draw_text(
     if attributes is None:
         attributes = {}
 
-    fonts = toyplot.font.ReportlabLibrary()
-    layout = text if isinstance(text, toyplot.text.Layout) else toyplot.text.layout(text, style, fonts)
+    layout = text if isinstance(text, toyplot.text.Layout) else toyplot.text.layout(text, style, toyplot.font.library())
 
     transform = ""
     if x or y:
@@ -650,9 +730,10 @@ def _draw_marker(
         extra_class=None,
         title=None,
         transform=None,
+        attrib=None,
         ):
 
-    attrib = _css_attrib(marker.mstyle)
+    attrib = _css_attrib(marker.mstyle) if attrib is None else dict(attrib)
     if extra_class is not None:
         attrib["class"] = extra_class
     marker_xml = xml.SubElement(root, "g", attrib=attrib)
@@ -1077,7 +1158,7 @@ def _render_table(owner, key, label, table, filename, context):
     if isinstance(table, toyplot.data.Table):
         for name, column in table.items():
             if "toyplot:exportable" in table.metadata(name) and table.metadata(name)["toyplot:exportable"]:
-                if column.dtype == toyplot.color.dtype:
+                if column.dtype in (toyplot.color.dtype, toyplot.color.packed_dtype):
                     raise ValueError("Color column table export isn't supported.") # pragma: no cover
                 else:
                     names.append(name)
@@ -1817,14 +1898,15 @@ def _render(numberline, mark, context):
 
     dimension1 = numpy.ma.column_stack([mark._table[key] for key in mark._coordinates])
     X = numberline.axis.projection(dimension1)
-    for x, marker, msize, mfill, mstroke, mopacity, mtitle, mhyperlink in zip(
+    for x, shared_marker, marker, msize, mfill, mstroke, mopacity, mtitle, mhyperlink in zip(
             X.T,
-            [mark._table[key] for key in mark._marker],
+            [_series_marker(mark._table, keys, mark._mstyle, mark._mlstyle) for keys in zip(mark._marker, mark._msize, mark._mfill, mark._mstroke, mark._mopacity)],
+            [_decode(mark._table, key, _convert_marker) for key in mark._marker],
             [mark._table[key] for key in mark._msize],
-            [mark._table[key] for key in mark._mfill],
-            [mark._table[key] for key in mark._mstroke],
+            [toyplot.color.to_css_array(mark._table[key]) for key in mark._mfill],
+            [toyplot.color.to_css_array(mark._table[key]) for key in mark._mstroke],
             [mark._table[key] for key in mark._mopacity],
-            [mark._table[key] for key in mark._mtitle],
+            [_decode(mark._table, key, _convert_title) for key in mark._mtitle],
             [mark._table[key] for key in mark._mhyperlink],
         ):
         not_null = numpy.invert(numpy.ma.getmaskarray(x))
@@ -1846,20 +1928,26 @@ def _render(numberline, mark, context):
                 else:
                     datum_xml = series_xml
 
-                dstyle = toyplot.style.combine(
-                    {
-                        "fill": toyplot.color.to_css(dfill),
-                        "stroke": toyplot.color.to_css(dstroke),
-                        "opacity": dopacity,
-                    },
-                    mark._mstyle)
+                if shared_marker is not None:
+                    dmarker, dattrib = shared_marker
+                else:
+                    dstyle = toyplot.style.combine(
+                        {
+                            "fill": dfill,
+                            "stroke": dstroke,
+                            "opacity": dopacity,
+                        },
+                        mark._mstyle)
+                    dmarker = toyplot.marker.create(size=dsize, mstyle=dstyle, lstyle=mark._mlstyle) + dmarker
+                    dattrib = None
                 _draw_marker(
                     datum_xml,
                     cx=dx,
                     cy=0,
-                    marker=toyplot.marker.create(size=dsize, mstyle=dstyle, lstyle=mark._mlstyle) + toyplot.marker.convert(dmarker),
+                    marker=dmarker,
                     extra_class="toyplot-Datum",
                     title=dtitle,
+                    attrib=dattrib,
                     )
 
 
@@ -2065,14 +2153,7 @@ def _render(canvas, axes, context):
     separation = axes._separation / 2
 
     def contiguous(a):
-        i = 0
-        result = []
-        for (k, g) in itertools.groupby(a.ravel()):
-            n = len(list(g))
-            if k:
-                result.append((i, i + n, k))
-            i += n
-        return result
+        return [(start, end, line_type) for start, end, line_type in zip(*toyplot.data.contiguous(a)) if line_type]
 
     hlines = numpy.copy(axes._hlines)
     hlines[numpy.logical_not(axes._hlines_show)] = False
@@ -2196,9 +2277,9 @@ def _render(axes, mark, context):
     for boundary1, boundary2, fill, opacity, title in zip(
             boundaries.T[:-1],
             boundaries.T[1:],
-            [mark._table[key] for key in mark._fill],
+            [toyplot.color.to_css_array(mark._table[key]) for key in mark._fill],
             [mark._table[key] for key in mark._opacity],
-            [mark._table[key] for key in mark._title],
+            [_decode(mark._table, key, _convert_title) for key in mark._title],
         ):
         not_null = numpy.invert(
             numpy.logical_or(
@@ -2217,7 +2298,7 @@ def _render(axes, mark, context):
                 title[not_null],
             ):
             dstyle = toyplot.style.combine({
-                "fill": toyplot.color.to_css(dfill),
+                "fill": dfill,
                 "opacity": dopacity,
                 }, mark._style)
             datum_xml = xml.SubElement(
@@ -2233,7 +2314,7 @@ def _render(axes, mark, context):
                 style=_css_style(dstyle),
                 )
             if dtitle is not None:
-                xml.SubElement(datum_xml, "title").text = str(dtitle)
+                xml.SubElement(datum_xml, "title").text = dtitle
 
 
 @dispatch(toyplot.coordinates.Cartesian, toyplot.mark.BarMagnitudes, RenderContext)
@@ -2276,9 +2357,9 @@ def _render(axes, mark, context):
     for boundary1, boundary2, fill, opacity, title in zip(
             boundaries.T[:-1],
             boundaries.T[1:],
-            [mark._table[key] for key in mark._fill],
+            [toyplot.color.to_css_array(mark._table[key]) for key in mark._fill],
             [mark._table[key] for key in mark._opacity],
-            [mark._table[key] for key in mark._title],
+            [_decode(mark._table, key, _convert_title) for key in mark._title],
         ):
         series_xml = xml.SubElement(
             mark_xml, "g", attrib={"class": "toyplot-Series"})
@@ -2292,7 +2373,7 @@ def _render(axes, mark, context):
                 title[not_null],
             ):
             dstyle = toyplot.style.combine(
-                {"fill": toyplot.color.to_css(dfill), "opacity": dopacity}, mark._style)
+                {"fill": dfill, "opacity": dopacity}, mark._style)
             datum_xml = xml.SubElement(
                 series_xml,
                 "rect",
@@ -2306,7 +2387,7 @@ def _render(axes, mark, context):
                 style=_css_style(dstyle),
                 )
             if dtitle is not None:
-                xml.SubElement(datum_xml, "title").text = str(dtitle)
+                xml.SubElement(datum_xml, "title").text = dtitle
 
 
 @dispatch(toyplot.coordinates.Cartesian, toyplot.mark.FillBoundaries, RenderContext)
@@ -2332,14 +2413,11 @@ def _render(axes, mark, context):
 
     _render_table(owner=mark, key="data", label="fill data", table=mark._table, filename=mark._filename, context=context)
 
-    for boundary1, boundary2, fill, opacity, title in zip(
-            boundaries.T[:-1], boundaries.T[1:], mark._fill, mark._opacity, mark._title):
-        not_null = numpy.invert(
-            numpy.logical_or(
-                numpy.ma.getmaskarray(boundary1),
-                numpy.ma.getmaskarray(boundary2)))
-        segments = _flat_contiguous(not_null)
+    null = numpy.ma.getmaskarray(boundaries)
+    not_null = numpy.invert(numpy.logical_or(null[:, :-1], null[:, 1:]))
 
+    for boundary1, boundary2, segments, fill, opacity, title in zip(
+            boundaries.T[:-1], boundaries.T[1:], _series_segments(not_null), mark._fill, mark._opacity, mark._title):
         series_style = toyplot.style.combine(
             {"fill": toyplot.color.to_css(fill), "opacity": opacity}, mark._style)
 
@@ -2365,7 +2443,7 @@ def _render(axes, mark, context):
     boundaries = numpy.ma.cumsum(magnitudes, axis=1)
     not_null = numpy.invert(
         numpy.ma.any(numpy.ma.getmaskarray(boundaries), axis=1))
-    segments = _flat_contiguous(not_null)
+    segments = _series_segments(not_null)[0]
 
     if mark._coordinate_axes.tolist() == ["x", "y"]:
         position = axes.project("x", mark._table[mark._position[0]])
@@ -2434,12 +2512,12 @@ def _render(axes, mark, context):
         mark_xml, "g", attrib={"class": "toyplot-Series"})
     for dposition, dstroke, dopacity, dtitle in zip(
             position,
-            mark._table[mark._stroke[0]],
+            toyplot.color.to_css_array(mark._table[mark._stroke[0]]),
             mark._table[mark._opacity[0]],
             mark._table[mark._title[0]],
         ):
         dstyle = toyplot.style.combine(
-            {"stroke": toyplot.color.to_css(dstroke), "opacity": dopacity}, mark._style)
+            {"stroke": dstroke, "opacity": dopacity}, mark._style)
         datum_xml = xml.SubElement(
             series_xml,
             "line",
@@ -2494,128 +2572,116 @@ def _render(axes, mark, context): # pragma: no cover
         else:
             vertex_markers.append(None)
 
-    # Create final edge styles.
+    # Create final edge styles, sharing them among edges with identical color, width, and opacity.
+    edge_colors = toyplot.color.to_css_array(mark._etable[mark._ecolor[0]])
     edge_styles = []
+    edge_css = []
+    distinct_styles = {}
     for ecolor, ewidth, eopacity in zip(
-            mark._etable[mark._ecolor[0]],
-            mark._etable[mark._ewidth[0]],
-            mark._etable[mark._eopacity[0]],
+            edge_colors,
+            mark._etable[mark._ewidth[0]].tolist(),
+            mark._etable[mark._eopacity[0]].tolist(),
         ):
-        edge_styles.append(
-            toyplot.style.combine(
+        key = (ecolor, ewidth, eopacity)
+        if key not in distinct_styles:
+            estyle = toyplot.style.combine(
                 {
                     "fill": "none",
-                    "stroke": toyplot.color.to_css(ecolor),
+                    "stroke": ecolor,
                     "stroke-width": ewidth,
                     "stroke-opacity": eopacity,
                 },
                 mark._estyle,
             )
-        )
+            distinct_styles[key] = (estyle, _css_style(estyle))
+        estyle, ecss = distinct_styles[key]
+        edge_styles.append(estyle)
+        edge_css.append(ecss)
 
-    edge_marker_styles = []
-    for ecolor, estyle in zip(
-            mark._etable[mark._ecolor[0]],
-            edge_styles,
-            ):
-        edge_marker_styles.append(toyplot.style.combine(estyle, {"fill": toyplot.color.to_css(ecolor)}))
+    def edge_marker_style(index):
+        return toyplot.style.combine(edge_styles[index], {"fill": edge_colors[index]})
 
     # Identify ranges of edge coordinates for each edge.
-    index = 0
-    edge_start = []
-    edge_end = []
-    for eshape in mark._etable[mark._eshape[0]]:
-        edge_start.append(index)
-        for segment in eshape:
-            if segment == "M":
-                count = 1
-            elif segment == "L":
-                count = 1
-            elif segment == "Q":
-                count = 2
-            elif segment == "C":
-                count = 3
-            index += count
-        edge_end.append(index)
-
-    # Adjust edge coordinates so edges don't overlap vertex markers.
-    for esource, etarget, start, end in zip(
-            mark._etable[mark._esource[0]],
-            mark._etable[mark._etarget[0]],
-            edge_start,
-            edge_end,
-        ):
-
-        # Skip loop edges.
-        if esource == etarget:
-            continue
-
-        source_vertex_marker = vertex_markers[esource]
-        target_vertex_marker = vertex_markers[etarget]
-
-        if source_vertex_marker:
-            dp = source_vertex_marker.intersect(edge_coordinates[start + 1] - edge_coordinates[start])
-            edge_coordinates[start] += dp
-
-        if target_vertex_marker:
-            dp = target_vertex_marker.intersect(edge_coordinates[end - 2] - edge_coordinates[end - 1])
-            edge_coordinates[end - 1] += dp
+    edge_start = mark._eoffsets[:-1]
+    edge_end = mark._eoffsets[1:]
+
+    # Adjust edge coordinates so edges don't overlap vertex markers, skipping
+    # loop edges, and bundled edges that may not start or end at a vertex.
+    esources = numpy.asarray(mark._etable[mark._esource[0]], dtype="int64")
+    etargets = numpy.asarray(mark._etable[mark._etarget[0]], dtype="int64")
+    vertex_shapes = numpy.array([vmarker.shape if vmarker else None for vmarker in vertex_markers], dtype="object")
+    vertex_sizes = numpy.array([vmarker.size if vmarker and vmarker.size else 0 for vmarker in vertex_markers], dtype="float64")
+    clipped = (esources != etargets) & (not mark._ebundle)
+    for vertices, first, second in [(esources, edge_start, edge_start + 1), (etargets, edge_end - 1, edge_end - 2)]:
+        for shape in set(vertex_shapes[vertices[clipped]].tolist()) - set([None]):
+            selection = clipped & (vertex_shapes[vertices] == shape)
+            edge_coordinates[first[selection]] += toyplot.marker.intersect(
+                shape,
+                vertex_sizes[vertices[selection]],
+                edge_coordinates[second[selection]] - edge_coordinates[first[selection]],
+                )
 
     # Render the graph.
     mark_xml = xml.SubElement(context.parent, "g", id=context.get_id(mark), attrib={"class": "toyplot-mark-Graph"})
     _render_table(owner=mark, key="vertex_data", label="graph vertex data", table=mark._vtable, filename=mark._vfilename, context=context)
     _render_table(owner=mark, key="edge_data", label="graph edge data", table=mark._etable, filename=mark._efilename, context=context)
 
+    # Format edge paths, once for every group of edges sharing a shape.
+    eshapes = numpy.asarray(mark._etable[mark._eshape[0]])
+    edge_paths = numpy.empty(len(eshapes), dtype="object")
+    if len(eshapes):
+        shapes, inverse = numpy.unique(eshapes, return_inverse=True)
+        for index, shape in enumerate(shapes):
+            count = toyplot.layout._edge_offsets([shape])[-1]
+            template = " ".join([segment + " %s %s" * toyplot.layout._segment_counts[segment] for segment in shape])
+            selection = inverse == index
+            coordinates = edge_coordinates[edge_start[selection, None] + numpy.arange(count)]
+            edge_paths[selection] = [template % tuple(row) for row in coordinates.astype(str).reshape((-1, count * 2)).tolist()]
+
+    # Combine edges with identical paths and styles, summing their widths.
+    # Edges between vertices in the same cell collapse to a single point, and
+    # are skipped since they wouldn't be visible.
+    if mark._ebundle:
+        edge_owners = numpy.repeat(numpy.arange(len(edge_start)), edge_end - edge_start)
+        moving = numpy.any(edge_coordinates != edge_coordinates[edge_start[edge_owners]], axis=1)
+        visible = numpy.bincount(edge_owners, weights=moving, minlength=len(edge_start)) > 0
+
+        bundles = collections.OrderedDict()
+        for epath, ecolor, ewidth, eopacity, evisible in zip(
+                edge_paths,
+                edge_colors,
+                mark._etable[mark._ewidth[0]].tolist(),
+                mark._etable[mark._eopacity[0]].tolist(),
+                visible,
+            ):
+            if not evisible:
+                continue
+            key = (epath, ecolor, eopacity)
+            bundles[key] = bundles.get(key, 0) + ewidth
+        edge_paths = []
+        edge_css = []
+        for (epath, ecolor, eopacity), ewidth in bundles.items():
+            edge_paths.append(epath)
+            edge_css.append(_css_style({"fill": "none", "stroke": ecolor, "stroke-width": ewidth, "stroke-opacity": eopacity}, mark._estyle))
+
     # Render edges.
     edge_xml = xml.SubElement(mark_xml, "g", attrib={"class": "toyplot-Edges"})
-    for esource, etarget, eshape, estyle, hmarker, mmarker, mposition, tmarker, start, end in zip(
-            mark._etable[mark._esource[0]],
-            mark._etable[mark._etarget[0]],
-            mark._etable[mark._eshape[0]],
-            edge_styles,
-            mark._etable[mark._hmarker[0]],
-            mark._etable[mark._mmarker[0]],
-            mark._etable[mark._mposition[0]],
-            mark._etable[mark._tmarker[0]],
-            edge_start,
-            edge_end,
-        ):
-
-        path = []
-        index = 0
-        for segment in eshape:
-            if segment == "M":
-                count = 1
-            elif segment == "L":
-                count = 1
-            elif segment == "Q":
-                count = 2
-            elif segment == "C":
-                count = 3
-            path.append(segment)
-            for _ in range(count):
-                path.append(str(edge_coordinates[start + index][0]))
-                path.append(str(edge_coordinates[start + index][1]))
-                index += 1
-
+    for epath, ecss in zip(edge_paths, edge_css):
         xml.SubElement(
             edge_xml,
             "path",
-            d=" ".join(path),
-            style=_css_style(estyle),
+            d=epath,
+            style=ecss,
             )
 
     # Render edge head markers.
     marker_xml = xml.SubElement(edge_xml, "g", attrib={"class": "toyplot-HeadMarkers"})
-    for marker, mstyle, estart, eend in zip(
-            mark._etable[mark._hmarker[0]],
-            edge_marker_styles,
-            edge_start,
-            edge_end,
-        ):
+    for index, marker in enumerate(mark._etable[mark._hmarker[0]].tolist()):
         if marker:
+            estart = edge_start[index]
+
             # Create the marker with defaults.
-            marker = toyplot.marker.create(size=10, mstyle=mstyle) + toyplot.marker.convert(marker)
+            marker = toyplot.marker.create(size=10, mstyle=edge_marker_style(index)) + toyplot.marker.convert(marker)
 
             # Compute the marker angle using the first edge segment.
             edge_angle = -numpy.rad2deg(numpy.arctan2(
@@ -2643,16 +2709,12 @@ def _render(axes, mark, context): # pragma: no cover
 
     # Render edge middle markers.
     marker_xml = xml.SubElement(edge_xml, "g", attrib={"class": "toyplot-MiddleMarkers"})
-    for mstyle, marker, mposition, start, end in zip(
-            edge_marker_styles,
-            mark._etable[mark._mmarker[0]],
-            mark._etable[mark._mposition[0]],
-            edge_start,
-            edge_end,
-        ):
+    for index, (marker, mposition) in enumerate(zip(mark._etable[mark._mmarker[0]].tolist(), mark._etable[mark._mposition[0]].tolist())):
         if marker:
+            start = edge_start[index]
+
             # Create the marker with defaults.
-            marker = toyplot.marker.create(size=10, mstyle=mstyle) + toyplot.marker.convert(marker)
+            marker = toyplot.marker.create(size=10, mstyle=edge_marker_style(index)) + toyplot.marker.convert(marker)
 
             # Place the marker within the first edge segment.
             x, y = edge_coordinates[start] * (1 - mposition) + edge_coordinates[start+1] * mposition
@@ -2679,15 +2741,12 @@ def _render(axes, mark, context): # pragma: no cover
 
     # Render edge tail markers.
     marker_xml = xml.SubElement(edge_xml, "g", attrib={"class": "toyplot-TailMarkers"})
-    for mstyle, marker, start, end in zip(
-            edge_marker_styles,
-            mark._etable[mark._tmarker[0]],
-            edge_start,
-            edge_end,
-        ):
+    for index, marker in enumerate(mark._etable[mark._tmarker[0]].tolist()):
         if marker:
+            end = edge_end[index]
+
             # Create the marker with defaults.
-            marker = toyplot.marker.create(size=10, mstyle=mstyle, lstyle={}) + toyplot.marker.convert(marker)
+            marker = toyplot.marker.create(size=10, mstyle=edge_marker_style(index), lstyle={}) + toyplot.marker.convert(marker)
 
             # Compute the marker angle using the last edge segment.
             edge_angle = -numpy.rad2deg(numpy.arctan2(
@@ -2747,15 +2806,9 @@ def _render(axes, mark, context): # pragma: no cover
 
 @dispatch(toyplot.coordinates.Cartesian, toyplot.mark.Plot, RenderContext)
 def _render(axes, mark, context):
+    position_axis = mark._coordinate_axes[0]
+    series_axis = mark._coordinate_axes[1]
     position = mark._table[mark._coordinates[0]]
-    series = numpy.ma.column_stack([mark._table[key] for key in mark._series])
-
-    if mark._coordinate_axes[0] == "x":
-        position = axes.project("x", position)
-        series = axes.project("y", series)
-    elif mark._coordinate_axes[0] == "y":
-        position = axes.project("y", position)
-        series = axes.project("x", series)
 
     mark_xml = xml.SubElement(
         context.parent,
@@ -2767,77 +2820,90 @@ def _render(axes, mark, context):
 
     _render_table(owner=mark, key="data", label="plot data", table=mark._table, filename=mark._filename, context=context)
 
-    for series, stroke, stroke_width, stroke_opacity, stroke_title, marker, msize, mfill, mstroke, mopacity, mtitle in zip(
-            series.T,
+    for series, stroke, stroke_width, stroke_opacity, stroke_title, shared_marker, marker, msize, mfill, mstroke, mopacity, mtitle in zip(
+            [mark._table[key] for key in mark._series],
             mark._stroke.T,
             mark._stroke_width.T,
             mark._stroke_opacity.T,
             mark._stroke_title.T,
-            [mark._table[key] for key in mark._marker],
+            [_series_marker(mark._table, keys, mark._mstyle, mark._mlstyle) for keys in zip(mark._marker, mark._msize, mark._mfill, mark._mstroke, mark._mopacity)],
+            [_decode(mark._table, key, _convert_marker) for key in mark._marker],
             [mark._table[key] for key in mark._msize],
-            [mark._table[key] for key in mark._mfill],
-            [mark._table[key] for key in mark._mstroke],
+            [toyplot.color.to_css_array(mark._table[key]) for key in mark._mfill],
+            [toyplot.color.to_css_array(mark._table[key]) for key in mark._mstroke],
             [mark._table[key] for key in mark._mopacity],
-            [mark._table[key] for key in mark._mtitle],
+            [_decode(mark._table, key, _convert_title) for key in mark._mtitle],
         ):
-        not_null = numpy.invert(numpy.logical_or(
-            numpy.ma.getmaskarray(position), numpy.ma.getmaskarray(series)))
-        segments = _flat_contiguous(not_null)
-
         stroke_style = toyplot.style.combine(
             {
                 "stroke": toyplot.color.to_css(stroke),
                 "stroke-width": stroke_width,
                 "stroke-opacity": stroke_opacity},
             mark._style)
-        if mark._coordinate_axes[0] == "x":
-            x = position
-            y = series
-        elif mark._coordinate_axes[0] == "y":
-            x = series
-            y = position
         series_xml = xml.SubElement(
             mark_xml, "g", attrib={"class": "toyplot-Series"})
         if stroke_title is not None:
             xml.SubElement(series_xml, "title").text = str(stroke_title)
 
-        d = []
-        for segment in segments:
-            start, stop, step = segment.indices(len(not_null))
-            for i in range(start, start + 1):
-                d.append("M %r %r" % (x[i], y[i]))
-            for i in range(start + 1, stop):
-                d.append("L %r %r" % (x[i], y[i]))
-        xml.SubElement(
+        path_xml = xml.SubElement(
             series_xml,
             "path",
-            d=" ".join(d),
+            d="",
             style=_css_style(stroke_style))
-        for dx, dy, dmarker, dsize, dfill, dstroke, dopacity, dtitle in zip(
-                x[not_null],
-                y[not_null],
-                marker[not_null],
-                msize[not_null],
-                mfill[not_null],
-                mstroke[not_null],
-                mopacity[not_null],
-                mtitle[not_null],
-            ):
-            if dmarker:
-                dstyle = toyplot.style.combine(
-                    {
-                        "fill": toyplot.color.to_css(dfill),
-                        "stroke": toyplot.color.to_css(dstroke),
-                        "opacity": dopacity},
-                    mark._mstyle)
-                _draw_marker(
-                    series_xml,
-                    cx=dx,
-                    cy=dy,
-                    marker=toyplot.marker.create(size=dsize, mstyle=dstyle, lstyle=mark._mlstyle) + toyplot.marker.convert(dmarker),
-                    extra_class="toyplot-Datum",
-                    title=dtitle,
-                    )
+
+        # Project and emit the data in blocks, to bound memory use for large series.
+        d = []
+        continued = False
+        for block in toyplot.data.blocks(len(position)):
+            block_position = axes.project(position_axis, position[block])
+            block_series = axes.project(series_axis, series[block])
+            not_null = numpy.invert(numpy.logical_or(
+                numpy.ma.getmaskarray(block_position), numpy.ma.getmaskarray(block_series)))
+            if position_axis == "x":
+                x = block_position
+                y = block_series
+            elif position_axis == "y":
+                x = block_series
+                y = block_position
+
+            segments = _series_segments(not_null)[0]
+            if segments:
+                d.append(_segment_path(x, y, segments, continued))
+            continued = bool(not_null[-1]) if len(not_null) else continued
+
+            for dx, dy, dmarker, dsize, dfill, dstroke, dopacity, dtitle in zip(
+                    x[not_null],
+                    y[not_null],
+                    marker[block][not_null],
+                    msize[block][not_null],
+                    mfill[block][not_null],
+                    mstroke[block][not_null],
+                    mopacity[block][not_null],
+                    mtitle[block][not_null],
+                ):
+                if dmarker:
+                    if shared_marker is not None:
+                        dmarker, dattrib = shared_marker
+                    else:
+                        dstyle = toyplot.style.combine(
+                            {
+                                "fill": dfill,
+                                "stroke": dstroke,
+                                "opacity": dopacity},
+                            mark._mstyle)
+                        dmarker = toyplot.marker.create(size=dsize, mstyle=dstyle, lstyle=mark._mlstyle) + dmarker
+                        dattrib = None
+                    _draw_marker(
+                        series_xml,
+                        cx=dx,
+                        cy=dy,
+                        marker=dmarker,
+                        extra_class="toyplot-Datum",
+                        title=dtitle,
+                        attrib=dattrib,
+                        )
+
+        path_xml.set("d", " ".join(d))
 
 
 @dispatch(toyplot.coordinates.Cartesian, toyplot.mark.Rect, RenderContext)
@@ -2870,12 +2936,12 @@ def _render(axes, mark, context):
             x2,
             y1,
             y2,
-            mark._table[mark._fill[0]],
+            toyplot.color.to_css_array(mark._table[mark._fill[0]]),
             mark._table[mark._opacity[0]],
             mark._table[mark._title[0]],
         ):
         dstyle = toyplot.style.combine(
-            {"fill": toyplot.color.to_css(dfill), "opacity": dopacity}, mark._style)
+            {"fill": dfill, "opacity": dopacity}, mark._style)
         datum_xml = xml.SubElement(
             series_xml,
             "rect",
@@ -2892,15 +2958,12 @@ def _render(axes, mark, context):
 
 @dispatch(toyplot.coordinates.Cartesian, toyplot.mark.Scatterplot, RenderContext)
 def _render(axes, mark, context):
-    dimension1 = numpy.ma.column_stack([mark._table[key] for key in mark._coordinates[0::2]])
-    dimension2 = numpy.ma.column_stack([mark._table[key] for key in mark._coordinates[1::2]])
-
     if mark._coordinate_axes[0] == "x":
-        X = axes.project("x", dimension1)
-        Y = axes.project("y", dimension2)
+        x_keys = mark._coordinates[0::2]
+        y_keys = mark._coordinates[1::2]
     elif mark._coordinate_axes[0] == "y":
-        X = axes.project("x", dimension2)
-        Y = axes.project("y", dimension1)
+        x_keys = mark._coordinates[1::2]
+        y_keys = mark._coordinates[0::2]
 
     mark_xml = xml.SubElement(
         context.parent,
@@ -2911,54 +2974,66 @@ def _render(axes, mark, context):
 
     _render_table(owner=mark, key="data", label="scatterplot", table=mark._table, filename=mark._filename, context=context)
 
-    for x, y, marker, msize, mfill, mstroke, mopacity, mtitle, mhyperlink in zip(
-            X.T,
-            Y.T,
-            [mark._table[key] for key in mark._marker],
+    for x_key, y_key, shared_marker, marker, msize, mfill, mstroke, mopacity, mtitle, mhyperlink in zip(
+            x_keys,
+            y_keys,
+            [_series_marker(mark._table, keys, mark._mstyle, mark._mlstyle) for keys in zip(mark._marker, mark._msize, mark._mfill, mark._mstroke, mark._mopacity)],
+            [_decode(mark._table, key, _convert_marker) for key in mark._marker],
             [mark._table[key] for key in mark._msize],
-            [mark._table[key] for key in mark._mfill],
-            [mark._table[key] for key in mark._mstroke],
+            [toyplot.color.to_css_array(mark._table[key]) for key in mark._mfill],
+            [toyplot.color.to_css_array(mark._table[key]) for key in mark._mstroke],
             [mark._table[key] for key in mark._mopacity],
-            [mark._table[key] for key in mark._mtitle],
+            [_decode(mark._table, key, _convert_title) for key in mark._mtitle],
             [mark._table[key] for key in mark._mhyperlink],
         ):
-        not_null = numpy.invert(numpy.logical_or(
-            numpy.ma.getmaskarray(x), numpy.ma.getmaskarray(y)))
-
         series_xml = xml.SubElement(
             mark_xml, "g", attrib={"class": "toyplot-Series"})
-        for dx, dy, dmarker, dsize, dfill, dstroke, dopacity, dtitle, dhyperlink in zip(
-                x[not_null],
-                y[not_null],
-                marker[not_null],
-                msize[not_null],
-                mfill[not_null],
-                mstroke[not_null],
-                mopacity[not_null],
-                mtitle[not_null],
-                mhyperlink[not_null],
-            ):
-            if dmarker:
-                if dhyperlink:
-                    datum_xml = xml.SubElement(series_xml, "a", attrib={"xlink:href": dhyperlink})
-                else:
-                    datum_xml = series_xml
 
-                dstyle = toyplot.style.combine(
-                    {
-                        "fill": toyplot.color.to_css(dfill),
-                        "stroke": toyplot.color.to_css(dstroke),
-                        "opacity": dopacity,
-                    },
-                    mark._mstyle)
-                _draw_marker(
-                    datum_xml,
-                    cx=dx,
-                    cy=dy,
-                    marker=toyplot.marker.create(size=dsize, mstyle=dstyle, lstyle=mark._mlstyle) + toyplot.marker.convert(dmarker),
-                    extra_class="toyplot-Datum",
-                    title=dtitle,
-                    )
+        # Project and emit the data in blocks, to bound memory use for large series.
+        for block in toyplot.data.blocks(len(mark._table)):
+            x = axes.project("x", mark._table[x_key, block])
+            y = axes.project("y", mark._table[y_key, block])
+            not_null = numpy.invert(numpy.logical_or(
+                numpy.ma.getmaskarray(x), numpy.ma.getmaskarray(y)))
+
+            for dx, dy, dmarker, dsize, dfill, dstroke, dopacity, dtitle, dhyperlink in zip(
+                    x[not_null],
+                    y[not_null],
+                    marker[block][not_null],
+                    msize[block][not_null],
+                    mfill[block][not_null],
+                    mstroke[block][not_null],
+                    mopacity[block][not_null],
+                    mtitle[block][not_null],
+                    mhyperlink[block][not_null],
+                ):
+                if dmarker:
+                    if dhyperlink:
+                        datum_xml = xml.SubElement(series_xml, "a", attrib={"xlink:href": dhyperlink})
+                    else:
+                        datum_xml = series_xml
+
+                    if shared_marker is not None:
+                        dmarker, dattrib = shared_marker
+                    else:
+                        dstyle = toyplot.style.combine(
+                            {
+                                "fill": dfill,
+                                "stroke": dstroke,
+                                "opacity": dopacity,
+                            },
+                            mark._mstyle)
+                        dmarker = toyplot.marker.create(size=dsize, mstyle=dstyle, lstyle=mark._mlstyle) + dmarker
+                        dattrib = None
+                    _draw_marker(
+                        datum_xml,
+                        cx=dx,
+                        cy=dy,
+                        marker=dmarker,
+                        extra_class="toyplot-Datum",
+                        title=dtitle,
+                        attrib=dattrib,
+                        )
 
 
 @dispatch((toyplot.canvas.Canvas, toyplot.coordinates.Cartesian), toyplot.mark.Text, RenderContext)
@@ -2986,7 +3061,7 @@ def _render(parent, mark, context):
             y,
             mark._table[mark._text[0]],
             mark._table[mark._angle[0]],
-            mark._table[mark._fill[0]],
+            toyplot.color.to_css_array(mark._table[mark._fill[0]]),
             mark._table[mark._opacity[0]],
             mark._table[mark._title[0]],
         ):
@@ -2998,7 +3073,7 @@ def _render(parent, mark, context):
             y=dy,
             angle=dangle,
             attributes={"class": "toyplot-Datum"},
-            style=toyplot.style.combine({"fill": toyplot.color.to_css(dfill), "opacity": dopacity}, mark._style),
+            style=toyplot.style.combine({"fill": dfill, "opacity": dopacity}, mark._style),
             title=dtitle,
             )
 
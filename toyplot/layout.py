@@ -7,12 +7,17 @@
 
 from __future__ import division
 
+import contextlib
+import hashlib
+import multiprocessing.pool
 import time
 
 import custom_inherit
 import numpy
 import six
 
+import toyplot.cache
+import toyplot.config
 import toyplot.units
 
 def region(
@@ -255,8 +260,12 @@ class Graph(object):
         """Return the graph edges as a :math:`E \\times 2` matrix of source, target indices."""
         return self._edges
 
-def graph(a, b=None, c=None, olayout=None, layout=None, vcoordinates=None):
-    """Compute a graph layout."""
+def graph(a, b=None, c=None, olayout=None, layout=None, vcoordinates=None, owarm=False):
+    """Compute a graph layout.
+
+    If `owarm` is True, vertex coordinates from `olayout` are passed to the
+    layout algorithm as a warm start, instead of being held fixed.
+    """
 
     stack = [c, b, a]
 
@@ -283,13 +292,18 @@ def graph(a, b=None, c=None, olayout=None, layout=None, vcoordinates=None):
     # Setup storage to receive vertex coordinates
     vcount = len(vids)
     ivcoordinates = numpy.ma.masked_all((vcount, 2))
+    initial = None
 
     # If the caller supplied the layout for an external graph, merge those coordinates in.
     if olayout is not None:
         olayout = toyplot.require.instance(olayout, (toyplot.mark.Graph, toyplot.layout.Graph))
         oindices = numpy.in1d(olayout.vids, vids, assume_unique=True)
         iindices = numpy.in1d(vids, olayout.vids, assume_unique=True)
-        ivcoordinates[iindices] = olayout.vcoordinates[oindices]
+        if owarm:
+            initial = numpy.ma.masked_all((vcount, 2))
+            initial[iindices] = olayout.vcoordinates[oindices]
+        else:
+            ivcoordinates[iindices] = olayout.vcoordinates[oindices]
 
     # If the caller supplied extra vertex coordinates, merge them in.
     if vcoordinates is not None:
@@ -306,14 +320,71 @@ def graph(a, b=None, c=None, olayout=None, layout=None, vcoordinates=None):
         else:
             # Otherwise, we can ignore the vertices and just create edges.
             layout = toyplot.layout.IgnoreVertices()
-    vcoordinates, eshapes, ecoordinates = layout.graph(ivcoordinates, edges)
+
+    computed = []
+    def compute(key):
+        computed.append(key)
+        if initial is None:
+            return layout.graph(ivcoordinates, edges)
+        return layout.graph(ivcoordinates, edges, initial=initial)
+
+    cache = toyplot.config.layout_cache
+    if cache is None:
+        vcoordinates, eshapes, ecoordinates = compute(None)
+    else:
+        key = _layout_key(vids, edges, ivcoordinates, initial, layout)
+        vcoordinates, eshapes, ecoordinates = [value.copy() for value in cache.lookup(key, compute)]
+        if not computed:
+            toyplot.log.info("Graph layout cache hit: %s", key)
     toyplot.log.info("Graph layout time: %s ms", (time.time() - start) * 1000)
+    if computed and getattr(layout, "iterations", None) is not None:
+        toyplot.log.info("Graph layout iterations: %s", layout.iterations)
 
     if numpy.ma.is_masked(vcoordinates):
         raise RuntimeError("Graph layout cannot return masked vertex coordinates.") # pragma: no cover
 
     return Graph(vids, vcoordinates, edges, eshapes, ecoordinates)
 
+def _fingerprint(digest, value):
+    """Update a hash with the contents of an arbitrary value.
+
+    Objects contribute their type and attributes, except attributes named in
+    the class `_state` attribute, which record results rather than parameters.
+    """
+    if isinstance(value, numpy.ma.MaskedArray):
+        digest.update(b"masked")
+        _fingerprint(digest, numpy.ma.getmaskarray(value))
+        _fingerprint(digest, value.filled())
+    elif isinstance(value, numpy.ndarray):
+        digest.update(("array %s %s" % (value.dtype.str, value.shape)).encode("utf-8"))
+        if value.dtype == object:
+            digest.update(repr(value.tolist()).encode("utf-8"))
+        else:
+            digest.update(numpy.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (list, tuple)):
+        digest.update(("sequence %s" % len(value)).encode("utf-8"))
+        for item in value:
+            _fingerprint(digest, item)
+    elif isinstance(value, dict):
+        digest.update(("dict %s" % len(value)).encode("utf-8"))
+        for item in sorted(value.items()):
+            _fingerprint(digest, item)
+    elif hasattr(value, "__dict__"):
+        digest.update(("object %s.%s" % (type(value).__module__, type(value).__name__)).encode("utf-8"))
+        state = getattr(type(value), "_state", ())
+        _fingerprint(digest, {name: attribute for name, attribute in vars(value).items() if name not in state})
+    else:
+        digest.update(repr(value).encode("utf-8"))
+
+
+def _layout_key(vids, edges, vcoordinates, initial, layout):
+    """Return a key that identifies a graph layout computation."""
+    digest = hashlib.sha1()
+    for value in [vids, edges, vcoordinates, initial, layout]:
+        _fingerprint(digest, value)
+    return digest.hexdigest()
+
+
 def _add_at(target, target_indices, source):
     """Add source values to the target and handle duplicate indices correctly.
 
@@ -328,6 +399,68 @@ def _add_at(target, target_indices, source):
             target[target_index] += source[source_index]
 
 
+_block_size = 1024
+
+
+@contextlib.contextmanager
+def _thread_pool(threads):
+    """Provide a pool of worker threads for the duration of a layout, or None to compute serially."""
+    if threads is None or threads == 1:
+        yield None
+        return
+    pool = multiprocessing.pool.ThreadPool(threads)
+    try:
+        yield pool
+    finally:
+        pool.terminate()
+
+
+def _map_blocks(function, count, pool=None):
+    """Call `function(begin, end)` for contiguous blocks of `count` items, and return the results in block order.
+
+    Without a pool, the function is called once for all of the items.
+    Otherwise, it is called in parallel for blocks of :data:`_block_size`
+    items, so callers must compute results for each item independently of the
+    others in order for them to be identical.
+    """
+    if pool is None or count <= _block_size:
+        return [function(0, count)]
+    bounds = numpy.append(numpy.arange(0, count, _block_size), count)
+    return pool.map(lambda block: function(*block), zip(bounds[:-1], bounds[1:]))
+
+
+def _require_threads(threads):
+    """Raise an exception if a thread count isn't a positive integer or None."""
+    if threads is not None and threads < 1:
+        raise ValueError("threads must be a positive integer or None.")
+    return threads
+
+
+def _attract(offsets, vcoordinates, edges, force, pool=None):
+    """Add attractive forces between the vertices of every edge to a set of offsets.
+
+    Parameters
+    ----------
+    force : callable
+        Called with an array of edge lengths, returns the magnitude of the
+        attractive force along each edge.
+    pool : :class:`multiprocessing.pool.ThreadPool`, optional
+        Used to compute forces for blocks of edges in parallel.  The forces are
+        summed serially, so the results don't depend on the pool.
+    """
+    def block(begin, end):
+        a = vcoordinates[edges[begin:end, 0]]
+        b = vcoordinates[edges[begin:end, 1]]
+        delta = b - a
+        distance = numpy.linalg.norm(delta, axis=1)[:, None]
+        delta /= distance
+        delta *= force(distance)
+        return delta
+    delta = numpy.ma.concatenate(_map_blocks(block, len(edges), pool))
+    _add_at(offsets, edges.T[0], +delta)
+    _add_at(offsets, edges.T[1], -delta)
+
+
 #def _floyd_warshall_shortest_path(vcount, edges):
 #    """Compute the (directed) shortest paths between every pair of vertices in a graph, using the Floyd-Warshall algorithm.
 #
@@ -358,20 +491,29 @@ def _add_at(target, target_indices, source):
 
 
 def _adjacency_list(vcount, edges):
-    """Return an adjacency list representation of a graph."""
-    targets = [[] for i in numpy.arange(vcount)]
-    for source, target in edges:
-        targets[source].append(target)
-    return targets
+    """Return a compressed sparse row (CSR) representation of a graph.
+
+    Returns
+    -------
+    offsets: array of :math:`V + 1` integers
+        The targets of vertex `i` are `targets[offsets[i]:offsets[i + 1]]`.
+    targets: array of :math:`E` integers
+        Edge targets grouped by source vertex, in edge order.
+    """
+    edges = numpy.asarray(edges, dtype="int64").reshape((-1, 2))
+    order = numpy.argsort(edges.T[0], kind="mergesort")
+    offsets = numpy.concatenate(([0], numpy.cumsum(numpy.bincount(edges.T[0], minlength=vcount))))
+    return offsets, edges.T[1][order]
 
 
-def _require_tree(children):
+def _require_tree(offsets, targets):
     """Return the root vertex and maximum depth of a tree.
 
     Parameters
     ----------
-    children: list of lists
-        Adjacency list representation of a graph.
+    offsets, targets: arrays of integers
+        Compressed sparse row representation of a graph, as returned by
+        :func:`_adjacency_list`.
 
     Returns
     -------
@@ -380,23 +522,63 @@ def _require_tree(children):
     depth: integer
         Maximum depth of the tree.
     """
-    roots = numpy.setdiff1d(numpy.arange(len(children)), numpy.concatenate(children))
+    vcount = len(offsets) - 1
+    roots = numpy.flatnonzero(numpy.bincount(targets, minlength=vcount) == 0)
     if len(roots) != 1:
         raise ValueError("Not a tree.") # pragma: no cover
     root = roots[0]
 
-    depth = []
-    visited = numpy.zeros(len(children), dtype=bool)
-    def mark_visited(vertex, vdepth=0):
+    depth = 0
+    offsets = offsets.tolist()
+    targets = targets.tolist()
+    visited = [False] * vcount
+    stack = [(root, 0)]
+    while stack:
+        vertex, vdepth = stack.pop()
         if visited[vertex]:
             raise ValueError("Not a tree.") # pragma: no cover
-        depth.append(vdepth)
         visited[vertex] = True
-        for child in children[vertex]:
-            mark_visited(child, vdepth + 1)
-    mark_visited(root)
+        depth = max(depth, vdepth)
+        stack.extend((child, vdepth + 1) for child in targets[offsets[vertex]:offsets[vertex+1]])
+
+    return root, depth
+
+_segment_counts = {"M": 1, "L": 1, "Q": 2, "C": 3}
+
+
+def _edge_offsets(eshapes):
+    """Return the range of edge coordinates used by each edge shape.
+
+    Parameters
+    ----------
+    eshapes : array of :math:`E` strings
+        Edge shape strings, as returned by :meth:`EdgeLayout.edges`.
+
+    Returns
+    -------
+    offsets : array of :math:`E + 1` integers
+        The coordinates for edge `i` are stored in rows `offsets[i]` through
+        `offsets[i + 1] - 1` of the edge coordinate matrix.
+
+    Raises
+    ------
+    ValueError
+        If a shape string contains an unknown drawing code.
+    """
+    eshapes = numpy.asarray(eshapes)
+    offsets = numpy.zeros(len(eshapes) + 1, dtype="int64")
+    if len(eshapes):
+        # Edge layouts typically produce a handful of distinct shapes, so each is parsed once.
+        shapes, inverse = numpy.unique(eshapes, return_inverse=True)
+        counts = numpy.empty(len(shapes), dtype="int64")
+        for index, shape in enumerate(shapes):
+            for segment in shape:
+                if segment not in _segment_counts:
+                    raise ValueError("Unknown edge shape segment: %s" % segment)
+            counts[index] = sum([_segment_counts[segment] for segment in shape])
+        numpy.cumsum(counts[inverse], out=offsets[1:])
+    return offsets
 
-    return root, max(depth)
 
 @six.add_metaclass(custom_inherit.DocInheritMeta(style="numpy_napoleon"))
 class EdgeLayout(object):
@@ -478,10 +660,345 @@ class CurvedEdges(EdgeLayout):
         return eshapes, ecoordinates
 
 
+class BundledEdges(EdgeLayout):
+    """Bundles graph edges that connect nearby vertices.
+
+    The vertices are binned into a grid of square cells, and every edge is
+    drawn as a straight line between the centers of the cells containing its
+    source and target vertices, so edges connecting the same pair of cells
+    (in the same direction) have identical geometry.  Combined with the
+    `ebundle` option of :meth:`toyplot.coordinates.Cartesian.graph`, each
+    bundle is rendered as a single path, greatly reducing the size of
+    visualizations of dense graphs.  Edges between vertices in the same cell
+    have zero length.
+
+    Parameters
+    ----------
+    resolution : integer
+        Number of grid cells along the longest dimension of the vertex
+        bounding box.
+    """
+    def __init__(self, resolution=32):
+        if resolution < 1:
+            raise ValueError("resolution must be a positive integer.")
+        self._resolution = resolution
+
+    def edges(self, vcoordinates, edges):
+        eshapes = numpy.tile("ML", len(edges))
+        ecoordinates = numpy.empty((len(edges) * 2, 2))
+        if not len(edges):
+            return eshapes, ecoordinates
+
+        coordinates = numpy.ma.getdata(vcoordinates)
+        lower = numpy.min(coordinates, axis=0)
+        size = numpy.max(numpy.max(coordinates, axis=0) - lower) / self._resolution
+        if size == 0:
+            size = 1.0
+        cells = numpy.minimum(numpy.floor((coordinates - lower) / size), self._resolution - 1)
+        centers = lower + (cells + 0.5) * size
+
+        ecoordinates[0::2] = centers[edges.T[0]]
+        ecoordinates[1::2] = centers[edges.T[1]]
+        return eshapes, ecoordinates
+
+
+@six.add_metaclass(custom_inherit.DocInheritMeta(style="numpy_napoleon"))
+class Repulsion(object):
+    """Abstract interface for algorithms that compute repulsive forces between graph vertices."""
+    def forces(self, vcoordinates, force, pool=None):
+        """Return the total repulsive offset acting on every graph vertex.
+
+        Parameters
+        ----------
+        vcoordinates : :math:`V \\times 2` matrix
+            Contains the coordinates for every graph vertex, in vertex order.
+        force : callable
+            Called with an array of distances between pairs of vertices, returns
+            the magnitude of the repulsive force between each pair.
+        pool : :class:`multiprocessing.pool.ThreadPool`, optional
+            If specified, implementations may use it to compute forces for
+            blocks of vertices in parallel.  The results must not depend on
+            whether a pool is used.
+
+        Returns
+        -------
+        offsets : :math:`V \\times 2` matrix
+            Contains the sum of the repulsive forces acting on each vertex, in
+            vertex order.
+        """
+        raise NotImplementedError() # pragma: no cover
+
+
+class AllPairs(Repulsion):
+    """Computes exact repulsive forces between every pair of graph vertices.
+
+    This requires :math:`O(V^2)` time and memory, and is only practical for
+    small graphs.  Forces are always computed serially.
+    """
+    def forces(self, vcoordinates, force, pool=None):
+        # The pair indices are rebuilt on every call rather than cached, so
+        # their O(V^2) memory is released as soon as the layout finishes.
+        vertices = numpy.column_stack(numpy.triu_indices(n=len(vcoordinates), k=1))
+
+        offsets = numpy.zeros_like(vcoordinates)
+        a = vcoordinates[vertices.T[0]]
+        b = vcoordinates[vertices.T[1]]
+        delta = a - b
+        distance = numpy.linalg.norm(delta, axis=1)[:, None]
+        delta /= distance
+        delta *= force(distance)
+        _add_at(offsets, vertices.T[0], +delta)
+        _add_at(offsets, vertices.T[1], -delta)
+        return offsets
+
+
+def _morton(x, y):
+    """Interleave the bits of two arrays of 16-bit integers."""
+    def spread(value):
+        value = value.astype("int64")
+        value = (value | (value << 8)) & 0x00ff00ff
+        value = (value | (value << 4)) & 0x0f0f0f0f
+        value = (value | (value << 2)) & 0x33333333
+        value = (value | (value << 1)) & 0x55555555
+        return value
+    return spread(x) | (spread(y) << 1)
+
+
+def _expand(begin, end):
+    """Return the indices of every range in a set of ranges, and the range each index came from."""
+    counts = end - begin
+    source = numpy.repeat(numpy.arange(len(begin)), counts)
+    ramp = numpy.arange(numpy.sum(counts)) - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+    return source, begin[source] + ramp
+
+
+class _Quadtree(object):
+    """Quadtree over a set of points, stored as one array of cells per level.
+
+    Points are sorted by their Morton codes, so every cell at every level
+    covers a contiguous range of the sorted points.
+    """
+    def __init__(self, coordinates, depth=16):
+        lower = numpy.min(coordinates, axis=0)
+        extent = numpy.max(numpy.max(coordinates, axis=0) - lower)
+        if extent == 0:
+            extent = 1.0
+        resolution = 2 ** depth
+        quantized = numpy.minimum(((coordinates - lower) / extent * resolution).astype("int64"), resolution - 1)
+        codes = _morton(quantized.T[0], quantized.T[1])
+
+        self.depth = depth
+        self.order = numpy.argsort(codes, kind="mergesort")
+        self.x = coordinates[self.order, 0]
+        self.y = coordinates[self.order, 1]
+        self.sizes = extent / numpy.power(2.0, numpy.arange(depth + 1))
+
+        codes = codes[self.order]
+        self.levels = []
+        for level in numpy.arange(depth + 1):
+            level_codes = codes >> (2 * (depth - level))
+            begin = numpy.flatnonzero(numpy.concatenate(([True], level_codes[1:] != level_codes[:-1])))
+            counts = numpy.diff(numpy.append(begin, len(codes)))
+            self.levels.append({
+                "begin": begin,
+                "counts": counts,
+                "x": numpy.add.reduceat(self.x, begin) / counts,
+                "y": numpy.add.reduceat(self.y, begin) / counts,
+                "members": numpy.repeat(numpy.arange(len(begin)), counts),
+                })
+
+        for parent, child in zip(self.levels[:-1], self.levels[1:]):
+            parent["children"] = child["members"][parent["begin"]]
+            parent["children_end"] = numpy.append(parent["children"][1:], len(child["begin"]))
+
+
+class BarnesHut(Repulsion):
+    """Approximates repulsive forces using the Barnes-Hut algorithm.
+
+    Vertices are stored in a quadtree, and distant groups of vertices are
+    treated as a single combined vertex at their center of mass, reducing the
+    cost of each layout iteration to :math:`O(V \\log V)`.  Results are
+    deterministic, and forces for blocks of vertices are computed in
+    parallel when a thread pool is available.
+
+    Parameters
+    ----------
+    theta: number, optional
+        Accuracy of the approximation.  A group of vertices is treated as a
+        single vertex when the size of its quadtree cell divided by its
+        distance is less than `theta`.  Smaller values are more accurate and
+        slower, and zero computes exact forces.
+    """
+    def __init__(self, theta=0.9):
+        if theta < 0:
+            raise ValueError("theta must be non-negative.")
+        self._theta = theta
+
+    def forces(self, vcoordinates, force, pool=None):
+        coordinates = numpy.ma.getdata(vcoordinates).astype("float64")
+        vcount = len(coordinates)
+        offsets = numpy.zeros((vcount, 2))
+        if vcount < 2:
+            return offsets
+
+        tree = _Quadtree(coordinates)
+        threshold = numpy.square(tree.sizes / self._theta) if self._theta else numpy.repeat(numpy.inf, len(tree.sizes))
+
+        # Each vertex only accumulates its own forces, so contiguous blocks of
+        # vertices can be handled independently.
+        results = _map_blocks(lambda begin, end: self._block_forces(tree, threshold, force, begin, end), vcount, pool)
+        offsets[tree.order, 0] = numpy.concatenate([fx for fx, fy in results])
+        offsets[tree.order, 1] = numpy.concatenate([fy for fx, fy in results])
+        return offsets
+
+    @staticmethod
+    def _block_forces(tree, threshold, force, begin, end):
+        """Return the forces acting on a contiguous block of vertices, identified by their position in the tree's sorted order."""
+        x = tree.x
+        y = tree.y
+        fx = numpy.zeros(end - begin)
+        fy = numpy.zeros(end - begin)
+
+        def accumulate(vertices, dx, dy, distance, mass):
+            magnitude = mass * force(distance) / distance
+            fx[...] += numpy.bincount(vertices - begin, weights=dx * magnitude, minlength=end - begin)
+            fy[...] += numpy.bincount(vertices - begin, weights=dy * magnitude, minlength=end - begin)
+
+        # Every vertex starts at the root cell, and descends the tree until it
+        # reaches cells that are far enough away to approximate.
+        vertices = numpy.arange(begin, end)
+        cells = numpy.zeros(end - begin, dtype="int64")
+        for level, cell in enumerate(tree.levels):
+            counts = cell["counts"][cells]
+            dx = x[vertices] - cell["x"][cells]
+            dy = y[vertices] - cell["y"][cells]
+            distance = dx * dx + dy * dy
+            single = counts == 1
+            far = (cell["members"][vertices] != cells) & (single | (distance > threshold[level]))
+
+            index = numpy.flatnonzero(far)
+            accumulate(vertices[index], dx[index], dy[index], numpy.sqrt(distance[index]), counts[index])
+
+            index = numpy.flatnonzero(~(far | single))
+            vertices = vertices[index]
+            cells = cells[index]
+            if not len(vertices):
+                break
+
+            if level == tree.depth:
+                # Vertices that share a cell at the finest level of the tree are
+                # handled exactly.
+                source, members = _expand(cell["begin"][cells], cell["begin"][cells] + cell["counts"][cells])
+                vertices = vertices[source]
+                keep = vertices != members
+                vertices = vertices[keep]
+                members = members[keep]
+                dx = x[vertices] - x[members]
+                dy = y[vertices] - y[members]
+                accumulate(vertices, dx, dy, numpy.hypot(dx, dy), 1)
+            else:
+                # Cells have at most four children.
+                children = cell["children"][cells][:, None] + numpy.arange(4)
+                valid = children < cell["children_end"][cells][:, None]
+                vertices = numpy.broadcast_to(vertices[:, None], valid.shape)[valid]
+                cells = children[valid]
+
+        return fx, fy
+
+
+class GridCutoff(Repulsion):
+    """Computes repulsive forces only between vertices closer than a cutoff radius.
+
+    Vertices are binned into a grid of square cells whose size is the cutoff
+    radius, and each vertex only interacts with vertices in its own and
+    adjacent cells.  Forces between more distant vertices are ignored, so the
+    cost of each layout iteration is roughly :math:`O(V)` when the density
+    of vertices is fixed.  Results are deterministic, and forces for blocks
+    of vertices are computed in parallel when a thread pool is available.
+
+    Parameters
+    ----------
+    radius: number, optional
+        Vertices farther apart than this distance don't repel one another.
+        The default is twice the average spacing between vertices, estimated
+        during each iteration from the density of vertices in the box
+        spanning the 5th through 95th percentiles of their coordinates, so
+        that a few distant vertices don't affect it.
+    """
+    def __init__(self, radius=None):
+        if radius is not None and radius <= 0:
+            raise ValueError("radius must be positive.")
+        self._radius = radius
+
+    def forces(self, vcoordinates, force, pool=None):
+        coordinates = numpy.ma.getdata(vcoordinates).astype("float64")
+        vcount = len(coordinates)
+        offsets = numpy.zeros((vcount, 2))
+        if vcount < 2:
+            return offsets
+
+        radius = self._radius
+        if radius is None:
+            bounds = numpy.percentile(coordinates, [5, 95], axis=0)
+            extent = bounds[1] - bounds[0]
+            area = numpy.prod(extent) or numpy.max(extent) ** 2 or 1.0
+            inside = numpy.count_nonzero(numpy.all((coordinates >= bounds[0]) & (coordinates <= bounds[1]), axis=1))
+            radius = 2 * numpy.sqrt(area / max(inside, 1))
+
+        # Sort vertices by cell, padding the grid so that adjacent cells always
+        # have valid keys.
+        cells = numpy.floor((coordinates - numpy.min(coordinates, axis=0)) / radius).astype("int64")
+        columns = numpy.max(cells.T[1]) + 3
+        keys = (cells.T[0] + 1) * columns + (cells.T[1] + 1)
+        order = numpy.argsort(keys, kind="mergesort")
+        grid = {
+            "keys": keys[order],
+            "x": coordinates[order, 0],
+            "y": coordinates[order, 1],
+            "adjacent": [i * columns + j for i in [-1, 0, 1] for j in [-1, 0, 1]],
+            }
+        grid["cells"], grid["begin"] = numpy.unique(grid["keys"], return_index=True)
+        grid["end"] = numpy.append(grid["begin"][1:], vcount)
+
+        # Each vertex only accumulates its own forces, so contiguous blocks of
+        # vertices can be handled independently.
+        results = _map_blocks(lambda begin, end: self._block_forces(grid, radius, force, begin, end), vcount, pool)
+        offsets[order, 0] = numpy.concatenate([fx for fx, fy in results])
+        offsets[order, 1] = numpy.concatenate([fy for fx, fy in results])
+        return offsets
+
+    @staticmethod
+    def _block_forces(grid, radius, force, begin, end):
+        """Return the forces acting on a contiguous block of vertices, identified by their position in cell order."""
+        x = grid["x"]
+        y = grid["y"]
+        fx = numpy.zeros(end - begin)
+        fy = numpy.zeros(end - begin)
+        vertices = numpy.arange(begin, end)
+
+        for adjacent in grid["adjacent"]:
+            keys = grid["keys"][vertices] + adjacent
+            cells = numpy.minimum(numpy.searchsorted(grid["cells"], keys), len(grid["cells"]) - 1)
+            occupied = numpy.flatnonzero(grid["cells"][cells] == keys)
+            source, members = _expand(grid["begin"][cells[occupied]], grid["end"][cells[occupied]])
+            sources = vertices[occupied][source]
+
+            dx = x[sources] - x[members]
+            dy = y[sources] - y[members]
+            distance = dx * dx + dy * dy
+            near = numpy.flatnonzero((distance < radius * radius) & (sources != members))
+            distance = numpy.sqrt(distance[near])
+            magnitude = force(distance) / distance
+            fx += numpy.bincount(sources[near] - begin, weights=dx[near] * magnitude, minlength=end - begin)
+            fy += numpy.bincount(sources[near] - begin, weights=dy[near] * magnitude, minlength=end - begin)
+
+        return fx, fy
+
+
 @six.add_metaclass(custom_inherit.DocInheritMeta(style="numpy_napoleon"))
 class GraphLayout(object):
     """Abstract interface for algorithms that compute coordinates for graph vertices and edges."""
-    def graph(self, vcoordinates, edges):
+    def graph(self, vcoordinates, edges, initial=None):
         """Compute vertex and edge coordinates for a graph.
 
         Parameters
@@ -494,6 +1011,10 @@ class GraphLayout(object):
             Contains the integer vertex indices for every graph edge in edge
             order.  The first and second matrix columns contain the source and
             target vertices respectively.
+        initial : :math:`V \\times 2` masked array, optional
+            Starting coordinates for vertices, in vertex order, for layouts
+            that support a warm start.  Unlike `vcoordinates`, these are free
+            to move.  Masked coordinates are unknown.
 
         Returns
         -------
@@ -529,7 +1050,7 @@ class IgnoreVertices(GraphLayout):
 
         self._edges = edges
 
-    def graph(self, vcoordinates, edges):
+    def graph(self, vcoordinates, edges, initial=None):
         eshapes, ecoordinates = self._edges.edges(vcoordinates, edges)
         return vcoordinates, eshapes, ecoordinates
 
@@ -537,6 +1058,8 @@ class IgnoreVertices(GraphLayout):
 class Random(GraphLayout):
     """Compute a random graph layout.
 
+    Initial coordinates are ignored.
+
     Parameters
     ----------
     edges: :class:`toyplot.layout.EdgeLayout` instance, optional
@@ -551,7 +1074,7 @@ class Random(GraphLayout):
         self._edges = edges
         self._seed = seed
 
-    def graph(self, vcoordinates, edges):
+    def graph(self, vcoordinates, edges, initial=None):
         generator = numpy.random.RandomState(seed=self._seed)
         mask = numpy.ma.getmaskarray(vcoordinates)
         vcoordinates = numpy.ma.where(mask, generator.uniform(-1, 1, size=vcoordinates.shape), vcoordinates)
@@ -562,6 +1085,9 @@ class Random(GraphLayout):
 class Eades(GraphLayout):
     """Compute a force directed graph layout using the 1984 algorithm of Eades.
 
+    Initial coordinates are used as a warm start, and vertices without them
+    are placed near their neighbors.
+
     Parameters
     ----------
     edges: :class:`toyplot.layout.EdgeLayout` instance, optional
@@ -572,62 +1098,161 @@ class Eades(GraphLayout):
         Number of iterations to run the spring simulation.
     seed: integer, optional
         Random seed used to initialize vertex coordinates.
+    repulsion: :class:`toyplot.layout.Repulsion` instance, optional
+        Algorithm used to compute repulsive forces between vertices.  The
+        default computes exact forces between every pair of vertices; use
+        :class:`toyplot.layout.BarnesHut` or
+        :class:`toyplot.layout.GridCutoff` for large graphs.
+    tolerance: number, optional
+        Stop iterating early once no vertex moves farther than this distance
+        in a single iteration.  By default, all `M` iterations are run.
+    threads: integer, optional
+        Number of threads used to compute forces.  Multiple threads only
+        speed up large graphs, and produce the same layout as a single thread.
     """
-    def __init__(self, edges=None, c1=2, c2=1, c3=1, c4=0.1, M=100, seed=1234):
+    _state = ("_iterations", "_threads")
+
+    def __init__(self, edges=None, c1=2, c2=1, c3=1, c4=0.1, M=100, seed=1234, repulsion=None, tolerance=None, threads=None):
         if edges is None:
             edges = StraightEdges()
+        if repulsion is None:
+            repulsion = AllPairs()
 
         self._edges = edges
+        self._repulsion = repulsion
         self._c1 = c1
         self._c2 = c2
         self._c3 = c3
         self._c4 = c4
         self._M = M
         self._seed = seed
+        self._tolerance = tolerance
+        self._threads = _require_threads(threads)
+        self._iterations = None
+
+    @property
+    def iterations(self):
+        """Number of iterations run by the most recent call to :meth:`graph`, or None."""
+        return self._iterations
 
-    def graph(self, vcoordinates, edges):
+    def graph(self, vcoordinates, edges, initial=None):
+        with _thread_pool(self._threads) as pool:
+            return self._graph(vcoordinates, edges, initial, pool)
+
+    def _graph(self, vcoordinates, edges, initial, pool):
         generator = numpy.random.RandomState(seed=self._seed)
         # Initialize coordinates
         mask = numpy.ma.getmaskarray(vcoordinates)
-        vcoordinates = numpy.ma.where(mask, generator.uniform(-1, 1, size=vcoordinates.shape), vcoordinates)
+        vcoordinates = _warm_start(vcoordinates, initial, edges, 0.1 * self._c2, generator)
 
         # Repeatedly apply attract / repel forces to the vertices
-        vertices = numpy.column_stack(numpy.triu_indices(n=len(vcoordinates), k=1))
+        self._iterations = 0
         for iteration in numpy.arange(self._M):
-            offsets = numpy.zeros_like(vcoordinates)
-
+            self._iterations += 1
             # Repel
-            a = vcoordinates[vertices.T[0]]
-            b = vcoordinates[vertices.T[1]]
-            delta = a - b
-            distance = numpy.linalg.norm(delta, axis=1)[:, None]
-            delta /= distance
-            force = self._c3 / numpy.square(distance)
-            delta *= force
-            _add_at(offsets, vertices.T[0], delta)
-            _add_at(offsets, vertices.T[1], -delta)
+            offsets = self._repulsion.forces(vcoordinates, lambda distance: self._c3 / numpy.square(distance), pool)
 
             # Attract
-            a = vcoordinates[edges.T[0]]
-            b = vcoordinates[edges.T[1]]
-            delta = b - a
-            distance = numpy.linalg.norm(delta, axis=1)[:, None]
-            delta /= distance
-            force = self._c1 * numpy.log(distance / self._c2)
-            delta *= force
-            _add_at(offsets, edges.T[0], delta)
-            _add_at(offsets, edges.T[1], -delta)
+            _attract(offsets, vcoordinates, edges, lambda distance: self._c1 * numpy.log(distance / self._c2), pool)
 
             # Sum offsets
             vcoordinates = numpy.ma.where(mask, vcoordinates + self._c4 * offsets, vcoordinates)
 
+            if _converged(self._c4 * offsets, mask, self._tolerance):
+                break
+
         eshapes, ecoordinates = self._edges.edges(vcoordinates, edges)
         return vcoordinates, eshapes, ecoordinates
 
 
+def _warm_start(vcoordinates, initial, edges, scale, generator):
+    """Return starting coordinates for a force-directed layout.
+
+    Unmasked vertex coordinates are kept, and masked coordinates are taken from
+    `initial` where available.  Vertices without initial coordinates are placed
+    near the average of their positioned neighbors, working outward from the
+    positioned vertices, and any that remain are placed randomly.
+    """
+    mask = numpy.ma.getmaskarray(vcoordinates)
+    coordinates = numpy.ma.where(mask, generator.uniform(-1, 1, size=vcoordinates.shape), vcoordinates)
+    if initial is None:
+        return coordinates
+
+    initial = numpy.ma.asarray(initial)
+    imask = numpy.ma.getmaskarray(initial)
+    coordinates = numpy.array(numpy.ma.where(mask & ~imask, initial, coordinates))
+    placed = ~numpy.any(mask & imask, axis=1)
+
+    edges = edges[edges.T[0] != edges.T[1]]
+    sources = numpy.concatenate((edges.T[0], edges.T[1]))
+    targets = numpy.concatenate((edges.T[1], edges.T[0]))
+    while True:
+        neighbors = placed[sources] & ~placed[targets]
+        if not numpy.any(neighbors):
+            break
+        counts = numpy.bincount(targets[neighbors], minlength=len(coordinates))
+        x = numpy.bincount(targets[neighbors], weights=coordinates[sources[neighbors], 0], minlength=len(coordinates))
+        y = numpy.bincount(targets[neighbors], weights=coordinates[sources[neighbors], 1], minlength=len(coordinates))
+        new = counts > 0
+        coordinates[new] = numpy.column_stack((x[new], y[new])) / counts[new][:, None]
+        coordinates[new] += generator.uniform(-scale, scale, size=(numpy.count_nonzero(new), 2))
+        placed |= new
+
+    return numpy.ma.where(mask, coordinates, vcoordinates)
+
+
+def _converged(offsets, mask, tolerance):
+    """Return True if no movable vertex is displaced by more than the tolerance."""
+    if tolerance is None:
+        return False
+    displacement = numpy.linalg.norm(numpy.where(mask, numpy.ma.filled(offsets, 0), 0), axis=1)
+    return not numpy.any(displacement > tolerance)
+
+
+def _fruchterman_reingold(vcoordinates, mask, edges, k, temperatures, repulsion, tolerance=None, pool=None):
+    """Apply Fruchterman-Reingold spring simulation steps to a graph.
+
+    Only vertices whose `mask` is True are moved.  Up to one iteration is run
+    for each of the given temperatures, which limit the distance vertices can
+    travel, stopping early once every vertex moves less than `tolerance`.
+    Forces are computed in parallel if a thread `pool` is given.
+
+    Returns
+    -------
+    vcoordinates: :math:`V \\times 2` masked array
+    iterations: integer
+        The number of iterations that were run.
+    """
+    iterations = 0
+    for temperature in temperatures:
+        iterations += 1
+        # Repel
+        offsets = repulsion.forces(vcoordinates, lambda distance: numpy.square(k) / distance, pool)
+
+        # Attract
+        _attract(offsets, vcoordinates, edges, lambda distance: numpy.square(distance) / k, pool)
+
+        # Limit offsets to the temperature
+        distance = numpy.linalg.norm(offsets, axis=1)
+        offsets /= distance[:, None]
+        offsets *= numpy.minimum(temperature, distance)[:, None]
+
+        # Sum offsets
+        vcoordinates = numpy.ma.where(mask, vcoordinates + offsets, vcoordinates)
+
+        if _converged(offsets, mask, tolerance):
+            break
+
+    return vcoordinates, iterations
+
+
 class FruchtermanReingold(GraphLayout):
     """Compute a force directed graph layout using the 1991 algorithm of Fruchterman and Reingold.
 
+    Initial coordinates are used as a warm start, and vertices without them
+    are placed near their neighbors.  When warm starting from a previous
+    layout, a lower `temperature` keeps vertices closer to where they started.
+
     Parameters
     ----------
     edges: :class:`toyplot.layout.EdgeLayout` instance, optional
@@ -638,61 +1263,218 @@ class FruchtermanReingold(GraphLayout):
         Number of iterations to run the spring simulation.
     seed: integer, optional
         Random seed used to initialize vertex coordinates.
+    repulsion: :class:`toyplot.layout.Repulsion` instance, optional
+        Algorithm used to compute repulsive forces between vertices.  The
+        default computes exact forces between every pair of vertices; use
+        :class:`toyplot.layout.BarnesHut` or
+        :class:`toyplot.layout.GridCutoff` for large graphs.
+    tolerance: number, optional
+        Stop iterating early once no vertex moves farther than this distance
+        in a single iteration.  By default, all `M` iterations are run.
+    threads: integer, optional
+        Number of threads used to compute forces.  Multiple threads only
+        speed up large graphs, and produce the same layout as a single thread.
     """
-    def __init__(self, edges=None, area=1, temperature=0.1, M=50, seed=1234):
+    _state = ("_iterations", "_threads")
+
+    def __init__(self, edges=None, area=1, temperature=0.1, M=50, seed=1234, repulsion=None, tolerance=None, threads=None):
         if edges is None:
             edges = StraightEdges()
+        if repulsion is None:
+            repulsion = AllPairs()
 
         self._edges = edges
+        self._repulsion = repulsion
         self._area = area
         self._temperature = temperature
         self._M = M
         self._seed = seed
+        self._tolerance = tolerance
+        self._threads = _require_threads(threads)
+        self._iterations = None
+
+    @property
+    def iterations(self):
+        """Number of iterations run by the most recent call to :meth:`graph`, or None."""
+        return self._iterations
 
-    def graph(self, vcoordinates, edges):
+    def graph(self, vcoordinates, edges, initial=None):
+        with _thread_pool(self._threads) as pool:
+            return self._graph(vcoordinates, edges, initial, pool)
+
+    def _graph(self, vcoordinates, edges, initial, pool):
         generator = numpy.random.RandomState(seed=self._seed)
         # Setup parameters
         k = numpy.sqrt(self._area / len(vcoordinates))
 
         # Initialize coordinates
         mask = numpy.ma.getmaskarray(vcoordinates)
-        vcoordinates = numpy.ma.where(mask, generator.uniform(-1, 1, size=vcoordinates.shape), vcoordinates)
+        vcoordinates = _warm_start(vcoordinates, initial, edges, 0.1 * k, generator)
 
         # Repeatedly apply attract / repel forces to the vertices
-        vertices = numpy.column_stack(numpy.triu_indices(n=len(vcoordinates), k=1))
-        for temperature in numpy.linspace(self._temperature, 0, self._M, endpoint=False):
-            offsets = numpy.zeros_like(vcoordinates)
+        temperatures = numpy.linspace(self._temperature, 0, self._M, endpoint=False)
+        vcoordinates, self._iterations = _fruchterman_reingold(vcoordinates, mask, edges, k, temperatures, self._repulsion, self._tolerance, pool)
 
-            # Repel
-            a = vcoordinates[vertices.T[0]]
-            b = vcoordinates[vertices.T[1]]
-            delta = a - b
-            distance = numpy.linalg.norm(delta, axis=1)[:, None]
-            delta /= distance
-            force = numpy.square(k) / distance
-            delta *= force
-            _add_at(offsets, vertices.T[0], +delta)
-            _add_at(offsets, vertices.T[1], -delta)
+        eshapes, ecoordinates = self._edges.edges(vcoordinates, edges)
+        return vcoordinates, eshapes, ecoordinates
 
-            # Attract
-            a = vcoordinates[edges.T[0]]
-            b = vcoordinates[edges.T[1]]
-            delta = b - a
-            distance = numpy.linalg.norm(delta, axis=1)[:, None]
-            delta /= distance
-            force = numpy.square(distance) / k
-            delta *= force
-            _add_at(offsets, edges.T[0], +delta)
-            _add_at(offsets, edges.T[1], -delta)
-
-            # Limit offsets to the temperature
-            distance = numpy.linalg.norm(offsets, axis=1)
-            offsets /= distance[:, None]
-            offsets *= numpy.minimum(temperature, distance)[:, None]
 
-            # Sum offsets
-            vcoordinates = numpy.ma.where(mask, vcoordinates + offsets, vcoordinates)
+def _coarsen(vcount, edges, mass, generator):
+    """Collapse a graph by merging adjacent vertices.
+
+    Each vertex chooses its lightest neighbor (breaking ties randomly), pairs
+    of vertices that choose one another are merged, and the remaining vertices
+    join the cluster of their choice if it was merged.
+
+    Returns
+    -------
+    clusters: array of :math:`V` integers
+        The coarse vertex that each vertex belongs to.
+    ccount: integer
+        Number of coarse vertices.
+    """
+    vertices = numpy.arange(vcount)
+    edges = edges[edges.T[0] != edges.T[1]]
+    if not len(edges):
+        return vertices, vcount
+
+    sources = numpy.concatenate((edges.T[0], edges.T[1]))
+    targets = numpy.concatenate((edges.T[1], edges.T[0]))
+    priority = generator.permutation(vcount)
+    order = numpy.lexsort((priority[targets], mass[targets], sources))
+    sources = sources[order]
+    targets = targets[order]
+    first = numpy.concatenate(([True], sources[1:] != sources[:-1]))
+
+    choice = vertices.copy()
+    choice[sources[first]] = targets[first]
+    matched = (choice[choice] == vertices) & (choice != vertices)
+    leader = numpy.where(matched, numpy.minimum(vertices, choice), vertices)
+    join = ~matched & matched[choice]
+    leader[join] = leader[choice[join]]
+
+    leaders, clusters = numpy.unique(leader, return_inverse=True)
+    return clusters, len(leaders)
+
+
+class Multilevel(GraphLayout):
+    """Compute a force directed graph layout for large graphs using multilevel refinement.
+
+    The graph is repeatedly coarsened by merging adjacent vertices, the
+    coarsest graph is laid out using the Fruchterman-Reingold algorithm, then
+    the layout is interpolated and refined at each finer level in turn.  This
+    produces good layouts of large graphs with far fewer iterations than
+    :class:`toyplot.layout.FruchtermanReingold`.
+
+    Vertices with explicit coordinates are held fixed during the final
+    refinement, but are otherwise ignored.  If initial coordinates are
+    supplied, the graph is not coarsened; instead, the initial coordinates
+    are used as a warm start for refinement, and vertices without them are
+    placed near their neighbors.
+
+    Parameters
+    ----------
+    edges: :class:`toyplot.layout.EdgeLayout` instance, optional
+        The default will generate straight edges.
+    area, temperature: numbers, optional
+        Constants defined in the original Fruchterman-Reingold paper.
+    M: integer, optional
+        Number of iterations used to lay out the coarsest graph.
+    refine: integer, optional
+        Number of iterations used to refine each finer level.
+    size: integer, optional
+        Stop coarsening once the graph has this many vertices or fewer.
+    seed: integer, optional
+        Random seed used to coarsen the graph and initialize vertex coordinates.
+    repulsion: :class:`toyplot.layout.Repulsion` instance, optional
+        Algorithm used to compute repulsive forces between vertices.  The
+        default is :class:`toyplot.layout.BarnesHut`.
+    tolerance: number, optional
+        Stop iterating at each level once no vertex moves farther than this
+        distance in a single iteration.  By default, all iterations are run.
+    threads: integer, optional
+        Number of threads used to compute forces.  Multiple threads only
+        speed up large graphs, and produce the same layout as a single thread.
+    """
+    _state = ("_iterations", "_threads")
+
+    def __init__(self, edges=None, area=1, temperature=0.1, M=50, refine=5, size=100, seed=1234, repulsion=None, tolerance=None, threads=None):
+        if edges is None:
+            edges = StraightEdges()
+        if repulsion is None:
+            repulsion = BarnesHut()
 
+        self._edges = edges
+        self._area = area
+        self._temperature = temperature
+        self._M = M
+        self._refine = refine
+        self._size = size
+        self._seed = seed
+        self._repulsion = repulsion
+        self._tolerance = tolerance
+        self._threads = _require_threads(threads)
+        self._iterations = None
+
+    @property
+    def iterations(self):
+        """Total number of iterations run at every level by the most recent call to :meth:`graph`, or None."""
+        return self._iterations
+
+    def graph(self, vcoordinates, edges, initial=None):
+        with _thread_pool(self._threads) as pool:
+            return self._graph(vcoordinates, edges, initial, pool)
+
+    def _graph(self, vcoordinates, edges, initial, pool):
+        generator = numpy.random.RandomState(seed=self._seed)
+        mask = numpy.ma.getmaskarray(vcoordinates)
+        warm = initial is not None and not numpy.all(numpy.ma.getmaskarray(initial))
+
+        # Coarsen the graph until it is small enough, or stops shrinking.
+        levels = [(len(vcoordinates), edges)]
+        clusters = []
+        mass = numpy.ones(len(vcoordinates))
+        while levels[-1][0] > self._size and not warm:
+            vcount, cedges = levels[-1]
+            vclusters, ccount = _coarsen(vcount, cedges, mass, generator)
+            if ccount > 0.9 * vcount:
+                break
+            cedges = numpy.sort(vclusters[cedges], axis=1)
+            cedges = cedges[cedges.T[0] != cedges.T[1]]
+            cedges = numpy.unique(cedges.T[0] * ccount + cedges.T[1])
+            cedges = numpy.column_stack((cedges // ccount, cedges % ccount))
+            mass = numpy.bincount(vclusters, weights=mass)
+            levels.append((ccount, cedges))
+            clusters.append(vclusters)
+
+        # Layout the coarsest graph from scratch, then interpolate and refine
+        # each finer level in turn.
+        # When warm starting, refine the initial coordinates as if they had
+        # been interpolated from a coarser level instead.
+        coarse_k = numpy.sqrt(self._area / levels[-1][0])
+        if warm:
+            coordinates = _warm_start(vcoordinates, initial, edges, 0.1 * coarse_k, generator)
+            temperature = self._temperature * coarse_k / numpy.sqrt(self._area / min(self._size, len(vcoordinates)))
+            temperatures = numpy.linspace(temperature, 0, self._refine, endpoint=False)
+        else:
+            coordinates = generator.uniform(-1, 1, size=(levels[-1][0], 2))
+            temperatures = numpy.linspace(self._temperature, 0, self._M, endpoint=False)
+        self._iterations = 0
+        for level in reversed(range(len(levels))):
+            vcount, cedges = levels[level]
+            k = numpy.sqrt(self._area / vcount)
+            if level < len(levels) - 1:
+                coordinates = numpy.ma.getdata(coordinates)[clusters[level]]
+                coordinates += generator.uniform(-0.1 * k, 0.1 * k, size=coordinates.shape)
+                temperatures = numpy.linspace(self._temperature * k / coarse_k, 0, self._refine, endpoint=False)
+            cmask = numpy.ones((vcount, 2), dtype=bool)
+            if level == 0:
+                cmask = mask
+                coordinates = numpy.ma.where(mask, coordinates, vcoordinates)
+            coordinates, iterations = _fruchterman_reingold(coordinates, cmask, cedges, k, temperatures, self._repulsion, self._tolerance, pool)
+            self._iterations += iterations
+
+        vcoordinates = numpy.ma.where(mask, coordinates, vcoordinates)
         eshapes, ecoordinates = self._edges.edges(vcoordinates, edges)
         return vcoordinates, eshapes, ecoordinates
 
@@ -700,7 +1482,7 @@ class FruchtermanReingold(GraphLayout):
 class Buchheim(GraphLayout):
     """Compute a tree layout using the 2002 algorithm of Buchheim, Junger, and Leipert.
 
-    Note: this layout currently ignores preexisting vertex coordinates.
+    Note: this layout currently ignores preexisting and initial vertex coordinates.
     """
     def __init__(self, edges=None, basis=None):
         if edges is None:
@@ -712,127 +1494,144 @@ class Buchheim(GraphLayout):
         self._edges = edges
         self._basis = numpy.array(basis)
 
-    def graph(self, vcoordinates, edges):
+    def graph(self, vcoordinates, edges, initial=None):
         # Convert the graph to an adjacency list
-        children = _adjacency_list(len(vcoordinates), edges)
+        offsets, targets = _adjacency_list(len(vcoordinates), edges)
         # Ensure we actually have a tree
-        root, depth = _require_tree(children)
+        root, depth = _require_tree(offsets, targets)
 
         # Get rid of the mask, it complicates things.
         vcoordinates = numpy.array(vcoordinates)
 
-        # Convert our flat adjacency list into a hierarchy, to make the implementation easier.
-        class Vertex(object):
-            def __init__(self, vertex, parent=None, number=0, depth=0):
-                self.vertex = vertex
-                self.parent = parent
-                self.number = number
-                self.depth = depth
-                self.children = [Vertex(child, self, number, depth+1) for number, child in enumerate(children[vertex])]
-                self.mod = 0
-                self.thread = None
-                self.ancestor = self
-                self.prelim = 0
-                self.change = 0
-                self.shift = 0
+        # Store the tree in flat arrays, with each vertex's parent and its
+        # position among its siblings.
+        vcount = len(vcoordinates)
+        counts = numpy.diff(offsets)
+        parent = numpy.repeat(-1, vcount)
+        parent[targets] = numpy.repeat(numpy.arange(vcount), counts)
+        number = numpy.zeros(vcount, dtype="int64")
+        number[targets] = numpy.arange(len(targets)) - numpy.repeat(offsets[:-1], counts)
+
+        # Python lists are much faster than numpy arrays for the element-wise
+        # access in the walks below.
+        offsets = offsets.tolist()
+        children = targets.tolist()
+        parent = parent.tolist()
+        number = number.tolist()
+        mod = [0] * vcount
+        thread = [-1] * vcount
+        ancestor = list(range(vcount))
+        prelim = [0] * vcount
+        change = [0] * vcount
+        shift = [0] * vcount
+
+        # Order the vertices so that every vertex follows its parent.  Reversed,
+        # this is the order in which a recursive first walk would finish them.
+        order = []
+        stack = [root]
+        while stack:
+            v = stack.pop()
+            order.append(v)
+            stack.extend(children[offsets[v]:offsets[v+1]])
 
         # We follow Appendix A of the original paper as closely as possible here.
         distance = 1
-        def FirstWalk(v):
-            if not v.children: # v is a leaf
-                v.prelim = 0
-                if v.number: # v has a left sibling
-                    v.prelim = v.parent.children[v.number-1].prelim + distance
-            else: # v is not a leaf
-                defaultAncestor = v.children[0] # leftmost child of v
-                for w in v.children:
-                    FirstWalk(w)
-                    defaultAncestor = Apportion(w, defaultAncestor)
-                ExecuteShifts(v)
-                midpoint = 0.5 * (v.children[0].prelim + v.children[-1].prelim)
-                if v.number: # v has a left sibling
-                    v.prelim = v.parent.children[v.number-1].prelim + distance
-                    v.mod = v.prelim - midpoint
-                else:
-                    v.prelim = midpoint
-
         def Apportion(v, defaultAncestor):
-            if v.number: # v has a left sibling
+            if number[v]: # v has a left sibling
                 vip = vop = v
-                vim = v.parent.children[v.number-1]
-                vom = vip.parent.children[0]
-                sip = vip.mod
-                sop = vop.mod
-                sim = vim.mod
-                som = vom.mod
-                while NextRight(vim) and NextLeft(vip):
+                vim = children[offsets[parent[v]] + number[v] - 1]
+                vom = children[offsets[parent[vip]]]
+                sip = mod[vip]
+                sop = mod[vop]
+                sim = mod[vim]
+                som = mod[vom]
+                while NextRight(vim) != -1 and NextLeft(vip) != -1:
                     vim = NextRight(vim)
                     vip = NextLeft(vip)
                     vom = NextLeft(vom)
                     vop = NextRight(vop)
-                    vop.ancestor = v
-                    shift = (vim.prelim + sim) - (vip.prelim + sip) + distance
-                    if shift > 0:
-                        MoveSubtree(Ancestor(vim, v, defaultAncestor), v, shift)
-                        sip += shift
-                        sop += shift
-                    sim += vim.mod
-                    sip += vip.mod
-                    som += vom.mod
-                    sop += vop.mod
-                if NextRight(vim) and not NextRight(vop):
-                    vop.thread = NextRight(vim)
-                    vop.mod += sim - sop
-                if NextLeft(vip) and not NextLeft(vom):
-                    vom.thread = NextLeft(vip)
-                    vom.mod += sip - som
+                    ancestor[vop] = v
+                    s = (prelim[vim] + sim) - (prelim[vip] + sip) + distance
+                    if s > 0:
+                        MoveSubtree(Ancestor(vim, v, defaultAncestor), v, s)
+                        sip += s
+                        sop += s
+                    sim += mod[vim]
+                    sip += mod[vip]
+                    som += mod[vom]
+                    sop += mod[vop]
+                if NextRight(vim) != -1 and NextRight(vop) == -1:
+                    thread[vop] = NextRight(vim)
+                    mod[vop] += sim - sop
+                if NextLeft(vip) != -1 and NextLeft(vom) == -1:
+                    thread[vom] = NextLeft(vip)
+                    mod[vom] += sip - som
                     defaultAncestor = v
             return defaultAncestor
 
         def NextLeft(v):
-            if v.children:
-                return v.children[0]
+            if offsets[v] != offsets[v+1]:
+                return children[offsets[v]]
             else:
-                return v.thread
+                return thread[v]
 
         def NextRight(v):
-            if v.children:
-                return v.children[-1]
+            if offsets[v] != offsets[v+1]:
+                return children[offsets[v+1] - 1]
             else:
-                return v.thread
+                return thread[v]
 
-        def MoveSubtree(wm, wp, shift):
-            subtrees = wp.number - wm.number
-            wp.change -= shift / subtrees
-            wp.shift += shift
-            wm.change += shift / subtrees
-            wp.prelim += shift
-            wp.mod += shift
+        def MoveSubtree(wm, wp, s):
+            subtrees = number[wp] - number[wm]
+            change[wp] -= s / subtrees
+            shift[wp] += s
+            change[wm] += s / subtrees
+            prelim[wp] += s
+            mod[wp] += s
 
         def ExecuteShifts(v):
-            shift = 0
-            change = 0
-            for w in v.children:
-                w.prelim += shift
-                w.mod += shift
-                change += w.change
-                shift += w.shift + change
+            s = 0
+            c = 0
+            for w in children[offsets[v]:offsets[v+1]]:
+                prelim[w] += s
+                mod[w] += s
+                c += change[w]
+                s += shift[w] + c
 
         def Ancestor(vim, v, defaultAncestor):
-            if vim.ancestor in v.parent.children:
-                return vim.ancestor
+            if parent[ancestor[vim]] == parent[v]:
+                return ancestor[vim]
             else:
                 return defaultAncestor
 
-        def SecondWalk(v, m):
-            vcoordinates[v.vertex][0] = v.prelim + m
-            vcoordinates[v.vertex][1] = v.depth
-            for w in v.children:
-                SecondWalk(w, m + v.mod)
-
-        r = Vertex(root)
-        FirstWalk(r)
-        SecondWalk(r, -r.prelim)
+        # First walk, visiting each vertex after all of its children.
+        defaultAncestors = [children[begin] if begin != end else -1 for begin, end in zip(offsets[:-1], offsets[1:])]
+        for v in reversed(order):
+            if offsets[v] == offsets[v+1]: # v is a leaf
+                prelim[v] = 0
+                if number[v]: # v has a left sibling
+                    prelim[v] = prelim[children[offsets[parent[v]] + number[v] - 1]] + distance
+            else: # v is not a leaf
+                ExecuteShifts(v)
+                midpoint = 0.5 * (prelim[children[offsets[v]]] + prelim[children[offsets[v+1] - 1]])
+                if number[v]: # v has a left sibling
+                    prelim[v] = prelim[children[offsets[parent[v]] + number[v] - 1]] + distance
+                    mod[v] = prelim[v] - midpoint
+                else:
+                    prelim[v] = midpoint
+            if v != root:
+                defaultAncestors[parent[v]] = Apportion(v, defaultAncestors[parent[v]])
+
+        # Second walk, visiting each vertex before its children.
+        m = [0] * vcount
+        vdepth = [0] * vcount
+        m[root] = -prelim[root]
+        for v in order:
+            for w in children[offsets[v]:offsets[v+1]]:
+                m[w] = m[v] + mod[v]
+                vdepth[w] = vdepth[v] + 1
+        vcoordinates[order, 0] = [prelim[v] + m[v] for v in order]
+        vcoordinates[order, 1] = [vdepth[v] for v in order]
 
         vcoordinates = numpy.dot(vcoordinates, self._basis)
 
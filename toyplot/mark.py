@@ -13,9 +13,15 @@ import numpy
 import six
 
 import toyplot.color
+import toyplot.layout
 import toyplot.marker
 import toyplot.require
 
+def _table_minimax(table, keys):
+    # Combine cached per-column extents, instead of rescanning the columns.
+    return toyplot.data.minimax([value for key in keys for value in table.statistics(key).extent])
+
+
 ##########################################################################
 # Basic Toyplot marks
 
@@ -126,7 +132,7 @@ class AxisLines(Mark):
 
     def domain(self, axis):
         if axis == self._coordinate_axes:
-            return toyplot.data.minimax([self._table[self._coordinates[0]]])
+            return _table_minimax(self._table, [self._coordinates[0]])
         return (None, None)
 
 
@@ -175,9 +181,9 @@ class BarBoundaries(Mark):
 
     def domain(self, axis):
         if axis == self._coordinate_axes[0]:
-            return toyplot.data.minimax([self._table[self._left[0]], self._table[self._right[0]]])
+            return _table_minimax(self._table, [self._left[0], self._right[0]])
         if axis == self._coordinate_axes[1]:
-            return toyplot.data.minimax([self._table[key] for key in self._boundaries])
+            return _table_minimax(self._table, self._boundaries)
 
     @property
     def markers(self):
@@ -246,7 +252,7 @@ class BarMagnitudes(Mark):
 
     def domain(self, axis):
         if axis == self._coordinate_axes[0]:
-            return toyplot.data.minimax([self._table[self._left[0]], self._table[self._right[0]]])
+            return _table_minimax(self._table, [self._left[0], self._right[0]])
         if axis == self._coordinate_axes[1]:
             boundaries = numpy.column_stack([self._table[key] for key in self._magnitudes])
             boundaries = numpy.column_stack((self._table[self._baseline[0]], boundaries))
@@ -316,9 +322,9 @@ class FillBoundaries(Mark):
 
     def domain(self, axis):
         if axis == self._coordinate_axes[0]:
-            return toyplot.data.minimax([self._table[self._position[0]]])
+            return _table_minimax(self._table, [self._position[0]])
         if axis == self._coordinate_axes[1]:
-            return toyplot.data.minimax([self._table[key] for key in self._boundaries])
+            return _table_minimax(self._table, self._boundaries)
 
     @property
     def markers(self):
@@ -388,7 +394,7 @@ class FillMagnitudes(Mark):
 
     def domain(self, axis):
         if axis == self._coordinate_axes[0]:
-            return toyplot.data.minimax([self._table[self._position[0]]])
+            return _table_minimax(self._table, [self._position[0]])
         if axis == self._coordinate_axes[1]:
             boundaries = numpy.column_stack([self._table[key] for key in self._magnitudes])
             boundaries = numpy.column_stack((self._table[self._baseline[0]], boundaries))
@@ -452,6 +458,7 @@ class Graph(Mark): # pragma: no cover
             vstyle,
             vtable,
             vtitle,
+            ebundle=False,
         ):
         Mark.__init__(self)
 
@@ -492,23 +499,14 @@ class Graph(Mark): # pragma: no cover
         # 1 edge shape column
         self._eshape = toyplot.require.table_keys(etable, eshape, length=1)
 
-        ecoordinate_count = 0
-        for shape in self._etable[self._eshape[0]]:
-            for segment in shape:
-                if segment == "M":
-                    ecoordinate_count += 1
-                elif segment == "L":
-                    ecoordinate_count += 1
-                elif segment == "Q":
-                    ecoordinate_count += 2
-                elif segment == "C":
-                    ecoordinate_count += 3
-                else:
-                    raise ValueError("Unknown edge shape segment: %s" % segment)
+        # E + 1 edge coordinate offsets
+        self._eoffsets = toyplot.layout._edge_offsets(self._etable[self._eshape[0]])
 
         # C x D edge coordinate columns
-        self._ecoordinates = toyplot.require.scalar_matrix(ecoordinates, rows=ecoordinate_count, columns=len(self._coordinate_axes))
+        self._ecoordinates = toyplot.require.scalar_matrix(ecoordinates, rows=self._eoffsets[-1], columns=len(self._coordinate_axes))
 
+        # Draw edges with identical geometry and style as a single path
+        self._ebundle = toyplot.require.value_in(ebundle, [False, True])
         # 1 edge color column
         self._ecolor = toyplot.require.table_keys(etable, ecolor, length=1)
         # 1 edge width column
@@ -530,7 +528,7 @@ class Graph(Mark): # pragma: no cover
 
     def domain(self, axis):
         index = numpy.flatnonzero(self._coordinate_axes == axis)[0]
-        return toyplot.data.minimax([self._vtable[self._vcoordinates[index]], self._ecoordinates[:, index]])
+        return toyplot.data.minimax(list(self._vtable.statistics(self._vcoordinates[index]).extent) + [self._ecoordinates[:, index]])
 
 
     @property
@@ -602,7 +600,7 @@ class Image(Mark):
             raise ValueError("Image must be a 1D, 2D or 3D array.")
         if data.shape[2] < 1 or data.shape[2] > 4:
             raise ValueError("Image must contain 1, 2, 3, or 4 channels.")
-        if issubclass(data.dtype.type, (numpy.object_, numpy.complexfloating, numpy.flexible)) and data.dtype != toyplot.color.dtype:
+        if issubclass(data.dtype.type, (numpy.object_, numpy.complexfloating, numpy.flexible)) and data.dtype not in (toyplot.color.dtype, toyplot.color.packed_dtype):
             raise ValueError("Unsupported image dtype: %s" % data.dtype)
 
         self._data = data
@@ -679,9 +677,9 @@ class Plot(Mark):
 
     def domain(self, axis):
         if axis == self._coordinate_axes[0]:
-            return toyplot.data.minimax([self._table[self._coordinates[0]]])
+            return _table_minimax(self._table, [self._coordinates[0]])
         if axis == self._coordinate_axes[1]:
-            return toyplot.data.minimax([self._table[key] for key in self._series])
+            return _table_minimax(self._table, self._series)
 
     @property
     def markers(self):
@@ -750,9 +748,9 @@ class Rect(Mark):
 
     def domain(self, axis):
         if axis == self._coordinate_axes[0]:
-            return toyplot.data.minimax([self._table[self._left[0]], self._table[self._right[0]]])
+            return _table_minimax(self._table, [self._left[0], self._right[0]])
         if axis == self._coordinate_axes[1]:
-            return toyplot.data.minimax([self._table[self._top[0]], self._table[self._bottom[0]]])
+            return _table_minimax(self._table, [self._top[0], self._bottom[0]])
 
 
 class Scatterplot(Mark):
@@ -814,7 +812,7 @@ class Scatterplot(Mark):
 
     def domain(self, axis):
         columns = [coordinate_column for coordinate_axis, coordinate_column in zip(itertools.cycle(self._coordinate_axes), self._coordinates) if coordinate_axis == axis]
-        return toyplot.data.minimax([self._table[column] for column in columns])
+        return _table_minimax(self._table, columns)
 
     @property
     def markers(self):
@@ -901,7 +899,7 @@ class Text(Mark):
     def domain(self, axis):
         for index, coordinate_axis in enumerate(self._coordinate_axes):
             if coordinate_axis == axis:
-                return toyplot.data.minimax(self._table[self._coordinates[index]])
+                return _table_minimax(self._table, [self._coordinates[index]])
 
     def extents(self, axes):
         axis_map = {key: index for index, key in enumerate(self._coordinate_axes)}
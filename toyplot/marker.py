@@ -105,32 +105,57 @@ class Marker(object):
         dp: :class:`numpy.ndarray` with shape (2)
             Relative coordinates of the intersection with this marker's border.
         """
-        if self._size:
-            if self._shape in ["o", "oo", "o|", "o/", "o-", "o\\", "o+", "ox", "o*"]:
-                p /= numpy.linalg.norm(p)
-                p *= self._size / 2
-                return p
-            if self._shape in ["s"]:
-                u = numpy.max(numpy.abs(p))
-                p /= u
-                p *= self._size / 2
-                return p
-            if self._shape and self._shape[0] == "r":
-                width, height = self._shape[1:].split("x")
-                width = float(width)
-                height = float(height)
-
-                ap = numpy.abs(p)
-                if ap[1]:
-                    if ap[0] / ap[1] > width / height:
-                        p = p / ap[0] * self._size * width / 2
-                    else:
-                        p = p / ap[1] * self._size * height / 2
-                else:
-                    p = p / ap[0] * self._size * width / 2
-                return p
-
-        return numpy.zeros((2,))
+        return intersect(self._shape, [self._size if self._size else 0], [p])[0]
+
+
+_circles = ["o", "oo", "o|", "o/", "o-", "o\\", "o+", "ox", "o*"]
+
+
+def intersect(shape, size, p):
+    """Compute the intersections between many same-shaped marker borders and line segments.
+
+    This is the vectorized equivalent of :meth:`toyplot.marker.Marker.intersect`.
+
+    Parameters
+    ----------
+    shape: string, required
+        Marker shape shared by every marker.
+    size: :class:`numpy.ndarray` with shape (N), required
+        Size of each marker.  Markers with zero size have no border.
+    p: :class:`numpy.ndarray` with shape (N, 2), required
+        Relative coordinates of line segments originating at the center of each marker.
+
+    Returns
+    -------
+    dp: :class:`numpy.ndarray` with shape (N, 2)
+        Relative coordinates of the intersection with each marker's border.
+    """
+    size = numpy.array(size, dtype="float64")
+    p = numpy.array(p, dtype="float64").reshape((-1, 2))
+    result = numpy.zeros_like(p)
+    visible = size != 0
+    size = size[visible, None]
+    p = p[visible]
+
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        if shape in _circles:
+            result[visible] = p / numpy.linalg.norm(p, axis=1)[:, None] * (size / 2)
+        elif shape in ["s"]:
+            result[visible] = p / numpy.max(numpy.abs(p), axis=1)[:, None] * (size / 2)
+        elif shape and shape[0] == "r":
+            width, height = shape[1:].split("x")
+            width = float(width)
+            height = float(height)
+
+            ap = numpy.abs(p)
+            horizontal = (ap[:, 1] == 0) | (ap[:, 0] / numpy.where(ap[:, 1], ap[:, 1], 1) > width / height)
+            result[visible] = numpy.where(
+                horizontal[:, None],
+                p / ap[:, 0, None] * size * width / 2,
+                p / ap[:, 1, None] * size * height / 2,
+                )
+
+    return result
 
 
 def create(shape=None, mstyle=None, size=None, angle=None, label=None, lstyle=None):
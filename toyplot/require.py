@@ -11,6 +11,8 @@ import numbers
 import numpy
 import six
 
+import toyplot.data
+
 def instance(value, types):
     """Raise an exception if a value isn't one of the given type(s)."""
     if not isinstance(value, types):
@@ -42,11 +44,27 @@ def scalar(value):
     return value
 
 
+def float64(value):
+    """Convert a value to a masked array of float64 values.
+
+    Memory-mapped arrays that already contain float64 values are wrapped
+    without copying, so they can be used without loading them into memory.
+    """
+    if isinstance(value, numpy.ndarray):
+        data = numpy.ma.getdata(value)
+        if isinstance(data, numpy.memmap) and data.dtype == numpy.float64:
+            return numpy.ma.array(data, mask=numpy.ma.getmask(value), copy=False)
+    return numpy.ma.array(value).astype("float64")
+
+
 def scalar_array(value):
     """Raise an exception if a value isn't convertable to an array of numbers."""
-    array = numpy.ma.array(value).astype("float64")
-    array.mask = numpy.ma.mask_or(array.mask, ~numpy.isfinite(array))
-    return array
+    array = float64(value)
+    # Check for non-finite values in blocks, so the mask is only allocated when needed.
+    data = numpy.ma.getdata(array)
+    if data.ndim and all(numpy.isfinite(data[block]).all() for block in toyplot.data.blocks(data.shape[0])):
+        return array
+    return numpy.ma.array(data, mask=numpy.ma.mask_or(numpy.ma.getmask(array), ~numpy.isfinite(data)), copy=False)
 
 
 def vector(value, length=None, min_length=None, modulus=None):
@@ -75,7 +93,7 @@ def integer_vector(value, length=None, min_length=None, modulus=None):
 
 def scalar_vector(value, length=None, min_length=None, modulus=None):
     """Raise an exception if a value isn't convertable to a 1D array of numbers."""
-    return vector(value, length=length, min_length=min_length, modulus=modulus).astype("float64")
+    return vector(float64(value), length=length, min_length=min_length, modulus=modulus)
 
 
 def string_vector(value, length=None, min_length=None, modulus=None):
@@ -36,7 +36,7 @@ def require(css, allowed):
     for key, value in css.items():
         if key not in allowed:
             raise ValueError("Not an allowed CSS style: %s.  Use one of: %s" % (key, ", ".join(allowed))) # pragma: no cover
-        if isinstance(value, numpy.ndarray) and value.dtype == toyplot.color.dtype:
+        if isinstance(value, numpy.ndarray) and value.dtype in (toyplot.color.dtype, toyplot.color.packed_dtype):
             css[key] = toyplot.color.to_css(value)
 
     return css
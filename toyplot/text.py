@@ -7,11 +7,13 @@
 from __future__ import division
 
 import copy
+import re
 import sys
 import xml.etree.ElementTree as xml
 
 import numpy
 
+import toyplot.cache
 import toyplot.font
 import toyplot.require
 import toyplot.style
@@ -26,8 +28,7 @@ def extents(text, angle, style):
     angle = toyplot.require.scalar_vector(angle)
     style = toyplot.style.require(style, toyplot.style.allowed.text)
 
-    # TODO: don't hard-code this.
-    fonts = toyplot.font.ReportlabLibrary()
+    fonts = toyplot.font.library()
 
     layouts = numpy.array([toyplot.text.layout(string, style, fonts) for string in text])
     left = numpy.array([layout.left for layout in layouts])
@@ -108,6 +109,14 @@ class _LineBreak(object):
 def layout(text, style, fonts):
     """Convert text with markup into a layout that is ready to be rendered.
 
+    Finished layouts are stored in :data:`layout.cache`, a
+    :class:`toyplot.cache.LRU` instance keyed on the text, style, and font
+    library, so repeated strings such as tick labels are only laid out once.
+    Cached layouts are shared and must not be modified.  Use the cache
+    `hits`, `misses`, and `hit_rate` properties to monitor its effectiveness.
+    Text without markup skips parsing, and is laid out as a single line by
+    adapting a layout of other plain text with the same style.
+
     Parameters
     ----------
     text: string, required
@@ -123,6 +132,106 @@ def layout(text, style, fonts):
         The text layout contains a hierarchy of styled, positiioned nodes that
         are ready to be rendered.
     """
+    style = {} if style is None else style
+    frozen = tuple(sorted((name, repr(value)) for name, value in style.items()))
+    return layout.cache.lookup((text, frozen, fonts), lambda key: _layout(text, style, fonts, frozen))
+
+layout.cache = toyplot.cache.LRU(maxsize=4096)
+
+
+def _layout(text, style, fonts, frozen):
+    """Compute a text layout without caching; see :func:`toyplot.text.layout`."""
+    if _plain_text(text):
+        template = _plain_template.cache.lookup((frozen, fonts), lambda key: _plain_template(style, fonts))
+        return _plain_layout(text, template, fonts)
+    return _markup_layout(text, style, fonts)
+
+
+_plain_text = re.compile(u"^[^<>&\r\x00-\x08\x0b\x0c\x0e-\x1f]+$").match
+
+
+def _plain_template(style, fonts):
+    """Return a layout of a sample string without markup, with the style information needed to adapt it to other plain text."""
+    sample = _markup_layout("x", style, fonts)
+    style = toyplot.style.combine(_default_style, style)
+    reference_font_size = toyplot.units.convert(style["font-size"], target="px", default="px")
+    anchor_shift = toyplot.units.convert(style["-toyplot-anchor-shift"], target="px", default="px", reference=reference_font_size)
+    return sample, style["text-anchor"], anchor_shift
+
+_plain_template.cache = toyplot.cache.LRU(maxsize=256)
+
+
+def _plain_layout(text, template, fonts):
+    """Lay out text without markup as a single line containing a single text box.
+
+    Everything but the horizontal extents is independent of the text, so
+    those values are copied from a template layout with the same style, and
+    the extents are computed the same way :func:`_markup_layout` does.  The
+    numpy reductions over a single line and box are replaced with indexing,
+    which produces the same numpy scalars more cheaply.
+    """
+    sample, text_anchor, anchor_shift = template
+    sample_line = sample.children[0]
+    sample_box = sample_line.children[0]
+
+    box = TextBox(text, sample_box.style)
+    box.baseline = sample_box.baseline
+    box.top = sample_box.top
+    box.bottom = sample_box.bottom
+    box.height = sample_box.height
+    box.width = fonts.font(box.style).width(text)
+
+    line = LineBox(sample_line.style)
+    line.children.append(box)
+    line.baseline = sample_line.baseline
+    line.top = sample_line.top
+    line.bottom = sample_line.bottom
+    line.height = sample_line.height
+    line.width = numpy.array([box.width])[0]
+
+    if text_anchor == "start":
+        anchor_offset = 0
+    elif text_anchor == "middle":
+        anchor_offset = -line.width * 0.5
+    else:
+        anchor_offset = -line.width
+    anchor_offset += anchor_shift
+
+    line.left = anchor_offset
+    line.right = anchor_offset + line.width
+    box.left = anchor_offset
+    box.right = box.left + box.width
+
+    result = Layout(sample.style)
+    result.children.append(line)
+    result.top = sample.top
+    result.bottom = sample.bottom
+    result.left = numpy.array([line.left])[0]
+    result.right = numpy.array([line.right])[0]
+    result.width = result.right - result.left
+    result.height = result.bottom - result.top
+    return result
+
+
+_default_style = {
+    "-toyplot-anchor-shift": "0",
+    "-toyplot-vertical-align": "middle",
+    "alignment-baseline": "alphabetic",
+    "baseline-shift": "0",
+    "fill": toyplot.color.black,
+    "font-family": "helvetica",
+    "font-size": "12px",
+    "font-weight": "normal",
+    "line-height": "normal",
+    "stroke": "none",
+    "text-anchor": "middle",
+    "vertical-align": "baseline",
+    "white-space": "pre",
+}
+
+
+def _markup_layout(text, style, fonts):
+    """Lay out text by parsing it as markup; see :func:`toyplot.text.layout`."""
     def cascade_styles(style, node):
         """Cascades style information so that each node in an XML DOM has an explicit representation of each property/value pair."""
         if node.tag in ["b", "strong"]:
@@ -373,22 +482,7 @@ def layout(text, style, fonts):
 
     dom = xml.fromstring(("<body>" + text + "</body>").encode("utf-8"))
 
-    default_style = {
-        "-toyplot-anchor-shift": "0",
-        "-toyplot-vertical-align": "middle",
-        "alignment-baseline": "alphabetic",
-        "baseline-shift": "0",
-        "fill": toyplot.color.black,
-        "font-family": "helvetica",
-        "font-size": "12px",
-        "font-weight": "normal",
-        "line-height": "normal",
-        "stroke": "none",
-        "text-anchor": "middle",
-        "vertical-align": "baseline",
-        "white-space": "pre",
-    }
-    style = toyplot.style.combine(default_style, style)
+    style = toyplot.style.combine(_default_style, style)
     reference_font_size = toyplot.units.convert(style["font-size"], target="px", default="px")
 
     cascade_styles(style, dom)